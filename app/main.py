@@ -1,16 +1,23 @@
 # app/main.py
 from fastapi import FastAPI, HTTPException, Request, Query
-from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+import os
 from pathlib import Path
-from .services.board import load_board, load_season_board
+from ffwb import metrics
+
+from .services.board import ADP_SOURCE, ROSTER, load_board, load_season_board
+from .services import http_cache, live
 
 BASE = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE / "templates"))
+TEMPLATES_DIR = BASE / "templates"
+templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 app = FastAPI()
-app.mount("/static", StaticFiles(directory=BASE / "static"), name="static")
+if (BASE / "static").is_dir():  # not shipped in every checkout
+    app.mount("/static", StaticFiles(directory=BASE / "static"), name="static")
 
 
 @app.get("/", include_in_schema=False)
@@ -18,44 +25,149 @@ async def root():
     return {"msg": "alive"}
 
 
+@app.get("/metrics", tags=["ops"])
+async def metrics_summary(recent: int = Query(50, ge=0, le=metrics.RING_SIZE)):
+    """Per-span totals for this worker, plus the most recent raw spans."""
+    return {
+        "pid": os.getpid(),
+        "summary": metrics.summarize(metrics.recent()),
+        "recent": metrics.recent(recent) if recent else [],
+    }
+
+
+# board handlers are plain `def`: FastAPI runs them in its threadpool, so the
+# parquet decode + VOR in render() never blocks the event loop
 @app.get("/weekly-board", response_class=HTMLResponse, include_in_schema=False)
-async def draft_board(
+def draft_board(
     request: Request,
     season: int = Query(2024),
     week: int = Query(1),
 ):
-    board_df = load_board(season, week)
-    board = board_df.to_dict(orient="records")
-
     # HTMX sends HX-Request header. If present, render *partial* only
-    if request.headers.get("hx-request") == "true":
-        return templates.TemplateResponse(
-            "_board_table.html",
-            {"request": request, "board": board},
+    partial = request.headers.get("hx-request") == "true"
+    name = "_board_table.html" if partial else "weekly_board.html"
+
+    def etag() -> str:
+        return http_cache.make_etag(
+            [f"projection_weekly_tank01/season={season}/week={week}"],
+            page=name,
+            season=season,
+            week=week,
+            roster=ROSTER,
+            template=http_cache.template_version(TEMPLATES_DIR, name),
         )
 
-    # Full page render
-    return templates.TemplateResponse(
-        "weekly_board.html",
-        {"request": request, "board": board, "season": season, "week": week},
-    )
+    def render() -> str:
+        board = load_board(season, week).to_dict(orient="records")
+        context = {"request": request, "board": board}
+        if not partial:
+            context.update(season=season, week=week)
+        return templates.get_template(name).render(context)
+
+    return http_cache.cached_html(request, etag, render)
 
 
 @app.get("/season", tags=["draft"])
-async def season_board(request: Request, season: int = 2024, teams: int = 12):
+def season_board(request: Request, season: int = 2024, teams: int = 12):
     """
     Season-long draft board (VOR vs replacement).
     """
+
+    def etag() -> str:
+        return http_cache.make_etag(
+            [
+                f"totals/season={season}",
+                f"adp/season={season}/source={ADP_SOURCE}",
+                "tank01_players",
+            ],
+            page="season",
+            season=season,
+            teams=teams,
+            roster=ROSTER,
+            template=http_cache.template_version(TEMPLATES_DIR, "board.html"),
+        )
+
+    def render() -> str:
+        try:
+            board = load_season_board(season, teams)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc))
+
+        context = dict(
+            request=request,
+            title=f"{season} Draft Board (Full Season)",
+            board=board.to_dict(orient="records"),
+            season=season,
+            mode="season",
+        )
+        return templates.get_template("board.html").render(context)
+
+    return http_cache.cached_html(request, etag, render)
+
+
+# --------------------------------------------------------------------------- #
+#  Live draft rooms (SSE push of row-level deltas)
+# --------------------------------------------------------------------------- #
+async def _draft_room(draft_id: str, season: int, teams: int) -> live.DraftRoom:
+    room = live.hub.get(draft_id)
+    if room is not None:
+        return room
     try:
-        board = load_season_board(season, teams)
+        board = await run_in_threadpool(load_season_board, season, teams)
+        return live.hub.get_or_create(
+            draft_id, lambda: board, season=season, teams=teams
+        )
+    except RuntimeError as exc:  # no totals yet, or every room is in use
+        raise HTTPException(status_code=503, detail=str(exc))
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    context = dict(
-        request=request,
-        title=f"{season} Draft Board (Full Season)",
-        board=board.to_dict(orient="records"),
-        season=season,
-        mode="season",
+
+@app.get("/draft/{draft_id}", response_class=HTMLResponse, tags=["draft"])
+async def draft_room(
+    request: Request, draft_id: str, season: int = 2024, teams: int = 12
+):
+    """Live draft page; rows are patched in place from the event stream."""
+    room = await _draft_room(draft_id, season, teams)
+    return templates.TemplateResponse(
+        "draft_room.html",
+        {
+            "request": request,
+            "draft_id": draft_id,
+            "season": room.season,
+            "teams": room.teams,
+        },
+    )
+
+
+@app.get("/draft/{draft_id}/events", tags=["draft"])
+async def draft_events(
+    request: Request, draft_id: str, season: int = 2024, teams: int = 12
+):
+    """Server-Sent Events: one `snapshot`, then `delta` messages per change."""
+    room = await _draft_room(draft_id, season, teams)
+    return StreamingResponse(
+        live.stream(room, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return templates.TemplateResponse("board.html", context)
+
+
+@app.post("/draft/{draft_id}/pick", tags=["draft"])
+async def draft_pick(draft_id: str, player_id: str, undo: bool = False):
+    room = live.hub.get(draft_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail=f"No live draft {draft_id}")
+    delta = room.mark_drafted([player_id], drafted=not undo)
+    return {"v": room.version, "changed": len(delta["upsert"])}
+
+
+@app.post("/draft/{draft_id}/refresh", tags=["draft"])
+async def draft_refresh(draft_id: str):
+    """Recompute the room's board (new VOR/tier/ADP) and push whatever changed."""
+    room = live.hub.get(draft_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail=f"No live draft {draft_id}")
+    board = await run_in_threadpool(load_season_board, room.season, room.teams)
+    delta = room.publish(board)
+    return {"v": room.version, "changed": len(delta["upsert"])}
@@ -1,21 +1,35 @@
 # app/services/board.py
-from ffwb import vor
-from ffwb.ingest.tank01 import ingest_tank01
+from ffwb import metrics, vor
+from ffwb.ingest.tank01 import KEEP, ingest_tank01
 import pandas as pd
 
+from ffwb.ingest.registry import has_keys, key_join
 from ffwb.pipeline import DATA_DIR
 
+from . import hot_tables
+
 ROSTER = {"qb": 1, "rb": 2, "wr": 2, "te": 1}
+ADP_SOURCE = "ffc"  # board the runner's `adp` stage ingests by default
+NAME_COLS = ["player_id", "player_key", "full_name", "team"]
 
 
 def _load_parquet(rel: str) -> pd.DataFrame:
+    """Partition under data/, read through the shared mmap'd Arrow cache."""
     path = DATA_DIR / rel
-    return pd.read_parquet(path) if path.exists() else pd.DataFrame()
+    return hot_tables.load_frame(rel) if path.exists() else pd.DataFrame()
 
 
+@metrics.timed("app.load_board")
 def load_board(season: int, week: int, teams: int = 12) -> pd.DataFrame:
-    """Return Draft Board dataframe ready for templating."""
-    proj = ingest_tank01(season, week)  # uses your existing code
+    """
+    Return Draft Board dataframe ready for templating.  Reads the stored
+    Tank-01 week and only calls the API when it has not been ingested, so
+    rendering never rewrites the partition the page's ETag is built from.
+    """
+    proj = _load_parquet(f"projection_weekly_tank01/season={season}/week={week}")
+    if proj.empty:
+        proj = ingest_tank01(season, week)
+    proj = proj[[c for c in KEEP if c in proj.columns]]
     totals = proj.rename(columns={"fantasy_pts": "fantasy_pts_season"})
 
     board = vor.compute_vor(totals, ROSTER, num_teams=teams)
@@ -28,6 +42,7 @@ def load_board(season: int, week: int, teams: int = 12) -> pd.DataFrame:
     return board[["player_id", "full_name", "position", "pts", "vor_f", "tier"]]
 
 
+@metrics.timed("app.load_season_board")
 def load_season_board(season: int, teams: int = 12) -> pd.DataFrame:
     totals = _load_parquet(f"totals/season={season}")
     if totals.empty:
@@ -37,9 +52,12 @@ def load_season_board(season: int, teams: int = 12) -> pd.DataFrame:
 
     vor_df = vor.compute_vor(
         totals,
-        roster_settings={"qb": 1, "rb": 2, "wr": 2, "te": 1},
+        roster_settings=ROSTER,
         num_teams=teams,
     )
+    adp = _load_parquet(f"adp/season={season}/source={ADP_SOURCE}")
+    if not adp.empty:  # adp / value_vs_adp for the board and live rooms
+        vor_df = vor.attach_adp(vor_df, adp)
     return _attach_names(vor_df, season)
 
 
@@ -53,10 +71,15 @@ def _attach_names(board: pd.DataFrame, season: int) -> pd.DataFrame:
     roster_path = DATA_DIR / "tank01_players"
 
     if roster_path.exists():
-        names = pd.read_parquet(roster_path)[["player_id", "full_name", "team"]]
+        names = _load_parquet("tank01_players")
     else:
-        names = ingest_player_list()[["player_id", "full_name", "team"]]
+        names = ingest_player_list(season)
+    names = names[[c for c in NAME_COLS if c in names.columns]]
 
-    board = board.merge(names, on="player_id", how="left")
+    if has_keys(board, names):
+        # tank01 ids and Sleeper ids share registry keys once linked
+        board = key_join(board, names, ["full_name", "team"])
+    else:
+        board = board.merge(names, on="player_id", how="left")
     board["full_name"] = board["full_name"].fillna("–")
     return board
@@ -0,0 +1,114 @@
+# app/services/hot_tables.py
+"""
+Shared, memory-mapped copies of the board's input tables.
+
+Parquet partitions the web app reads on every board build (`totals`,
+`vor`, `tank01_players`, …) are exported once to uncompressed Arrow IPC
+(Feather v2) files under `data/_hot/`.  Every uvicorn worker memory-maps
+the same file, so the OS page cache holds one physical copy of the
+buffers instead of one decoded copy per worker, and opening a table is a
+mmap plus a footer read rather than a parquet decode.
+
+Each file records the `http_cache.partition_version` of its source in the
+schema metadata; a rewritten partition is re-exported on the next read.
+Exports go to a per-process temp file and are `os.replace`d into place, so
+readers only ever see a complete file (workers still mapping the old one
+keep its inode alive until they move on).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from ffwb import metrics
+from ffwb.pipeline import DATA_DIR
+
+from . import http_cache
+
+HOT_DIR_NAME = "_hot"
+_VERSION_KEY = b"source_version"
+
+_lock = threading.Lock()
+_mapped: dict[str, tuple[str, pa.Table]] = {}  # rel → (version, table)
+
+
+def hot_path(rel: str) -> Path:
+    """`totals/season=2024` → data/_hot/totals__season=2024.arrow"""
+    return DATA_DIR / HOT_DIR_NAME / (rel.strip("/").replace("/", "__") + ".arrow")
+
+
+def export(rel: str, version: str | None = None) -> Path:
+    """Decode parquet partition `rel` once and write it as an IPC file."""
+    version = version or http_cache.partition_version(rel)
+    with metrics.span("hot.export", table=rel) as sp:
+        path = _export(rel, version)
+        sp.set(
+            bytes_read=metrics.path_bytes(DATA_DIR / rel),
+            bytes_written=path.stat().st_size,
+        )
+    return path
+
+
+def _export(rel: str, version: str) -> Path:
+    table = pq.read_table(DATA_DIR / rel).combine_chunks()
+    meta = dict(table.schema.metadata or {})
+    meta[_VERSION_KEY] = version.encode()
+    table = table.replace_schema_metadata(meta)
+
+    path = hot_path(rel)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with ipc.new_file(sink, table.schema) as writer:  # uncompressed
+            writer.write_table(table)
+    os.replace(tmp, path)
+    return path
+
+
+def _open(path: Path) -> pa.Table:
+    """Zero-copy Table over a memory-mapped IPC file."""
+    return ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def load(rel: str) -> pa.Table:
+    """
+    Arrow table for partition `rel`, memory-mapped from `data/_hot/`
+    (exported first if missing or older than the parquet source).
+    """
+    version = http_cache.partition_version(rel)
+    if version == "missing":
+        raise FileNotFoundError(f"No table at {DATA_DIR / rel}")
+    with _lock:
+        hit = _mapped.get(rel)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+
+        path = hot_path(rel)
+        table = _open(path) if path.exists() else None
+        stamp = (table.schema.metadata or {}).get(_VERSION_KEY) if table else None
+        if stamp != version.encode():
+            table = _open(export(rel, version))
+        _mapped[rel] = (version, table)
+        return table
+
+
+def load_frame(rel: str) -> pd.DataFrame:
+    """
+    `load` as a DataFrame.  `split_blocks` keeps one block per column, so
+    null-free numeric columns stay views of the mapped buffers; string
+    columns are materialised as Python objects.
+    """
+    return load(rel).to_pandas(split_blocks=True)
+
+
+def clear() -> None:
+    """Drop this process's mappings (files on disk are kept)."""
+    with _lock:
+        _mapped.clear()
@@ -0,0 +1,177 @@
+# app/services/http_cache.py
+"""
+Conditional GET + compression for the HTML boards.
+
+ETags are derived from the *inputs* of a page (partition file stats and
+settings), so a request whose validator still matches is answered with 304
+before any parquet is read or template rendered.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from ffwb.pipeline import DATA_DIR
+
+try:  # optional: `pip install brotli`
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+MIN_COMPRESS_BYTES = 1024
+_CACHE_SIZE = 64
+_VARY = "Accept-Encoding, HX-Request"
+
+
+# --------------------------------------------------------------------------- #
+#  Versions / ETags
+# --------------------------------------------------------------------------- #
+def partition_version(rel: str) -> str:
+    """
+    Cheap fingerprint of a partition under data/: (file, size, mtime) of every
+    parquet file below it.  Changes whenever an ingest/calc step rewrites it.
+    """
+    root = DATA_DIR / rel
+    if not root.exists():
+        return "missing"
+    h = hashlib.sha1()
+    for f in sorted(root.rglob("*.parquet")):
+        st = f.stat()
+        h.update(f"{f.relative_to(root)}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()[:16]
+
+
+def make_etag(partitions: list[str], **settings) -> str:
+    """Weak ETag over the input partition versions plus page settings."""
+    state = {
+        "parts": {p: partition_version(p) for p in partitions},
+        "settings": settings,
+    }
+    digest = hashlib.sha1(
+        json.dumps(state, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def _matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # weak comparison: ignore W/ prefixes
+    ours = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == ours for tag in header.split(","))
+
+
+# --------------------------------------------------------------------------- #
+#  Compression
+# --------------------------------------------------------------------------- #
+def _choose_encoding(request: Request) -> str | None:
+    accept = request.headers.get("accept-encoding", "").lower()
+    offered = {
+        part.split(";")[0].strip()
+        for part in accept.split(",")
+        if not part.strip().endswith("q=0")
+    }
+    if brotli is not None and "br" in offered:
+        return "br"
+    if "gzip" in offered:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str | None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
+
+
+class _BodyCache:
+    """
+    Small LRU of rendered bodies keyed by (etag, requested encoding); values
+    are (encoding actually applied, body) since tiny pages go uncompressed.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple[str, str | None], tuple[str | None, bytes]]
+        self._data = OrderedDict()
+
+    def get(self, key: tuple[str, str | None]) -> tuple[str | None, bytes] | None:
+        hit = self._data.get(key)
+        if hit is not None:
+            self._data.move_to_end(key)
+        return hit
+
+    def put(self, key: tuple[str, str | None], value: tuple[str | None, bytes]) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+body_cache = _BodyCache()
+
+
+# --------------------------------------------------------------------------- #
+#  Public helper
+# --------------------------------------------------------------------------- #
+def cached_html(
+    request: Request,
+    etag: Callable[[], str],
+    render: Callable[[], str],
+) -> Response:
+    """
+    Serve an HTML page with validators and compression.
+
+    `etag` is called before rendering (304 / cache hit short-circuit) and once
+    more afterwards, because rendering may itself refresh an input partition
+    (e.g. a Tank-01 fetch); the response carries the post-render version.
+    """
+    tag = etag()
+    headers = {"ETag": tag, "Vary": _VARY, "Cache-Control": "no-cache"}
+    if _matches(request, tag):
+        return Response(status_code=304, headers=headers)
+
+    wanted = _choose_encoding(request)
+    hit = body_cache.get((tag, wanted))
+    if hit is None:
+        raw = render().encode()
+        tag = headers["ETag"] = etag()
+        applied = wanted if len(raw) >= MIN_COMPRESS_BYTES else None
+        hit = (applied, _compress(raw, applied))
+        body_cache.put((tag, wanted), hit)
+
+    applied, body = hit
+    if applied is not None:
+        headers["Content-Encoding"] = applied
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+def template_version(templates_dir: Path, name: str) -> str:
+    """
+    Stamp of every file under `templates_dir`, so a deploy that changes
+    the page, `base.html` or an included partial invalidates old ETags.
+    """
+    if not (templates_dir / name).exists():
+        return "missing"
+    h = hashlib.sha1(name.encode())
+    for f in sorted(templates_dir.rglob("*")):
+        if f.is_file():
+            rel = f.relative_to(templates_dir).as_posix()
+            h.update(f"{rel}:{f.stat().st_mtime_ns}:{f.stat().st_size}".encode())
+    return h.hexdigest()[:16]
@@ -0,0 +1,254 @@
+# app/services/live.py
+"""Live draft rooms: push row-level board deltas to viewers over SSE."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Callable
+
+import numpy as np
+import pandas as pd
+
+# columns streamed to the browser (whatever subset the board actually has)
+LIVE_COLS = [
+    "full_name",
+    "position",
+    "fantasy_pts_season",
+    "vor",
+    "tier",
+    "adp",
+    "value_vs_adp",
+    "drafted",
+]
+
+QUEUE_SIZE = 32  # per-viewer backlog before we fall back to a full resync
+HEARTBEAT_S = 15.0
+# rooms nobody watches are dropped after ROOM_IDLE_S (a short grace period,
+# so a page reload keeps its picks); at most MAX_ROOMS per worker
+ROOM_IDLE_S = 300.0
+MAX_ROOMS = 128
+
+
+# --------------------------------------------------------------------------- #
+#  Snapshot + diff helpers
+# --------------------------------------------------------------------------- #
+def _snapshot(board: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalise a board into the frame we diff against: indexed by player_id,
+    only LIVE_COLS, floats rounded to 1dp so float jitter never creates deltas.
+    """
+    cols = [c for c in LIVE_COLS if c in board.columns]
+    snap = board.drop_duplicates("player_id").set_index("player_id")[cols].copy()
+    if "drafted" not in snap.columns:
+        snap["drafted"] = False
+    for col in snap.columns:
+        if pd.api.types.is_float_dtype(snap[col]):
+            snap[col] = snap[col].round(1)
+    return snap
+
+
+def diff_rows(old: pd.DataFrame, new: pd.DataFrame) -> dict:
+    """
+    Row-level delta between two snapshots (both indexed by player_id).
+
+    Returns
+    -------
+    dict
+        {"cols": [...], "upsert": [[player_id, *values], ...], "remove": [ids]}
+        Only rows that are new or whose values changed are included.
+    """
+    cols = list(new.columns)
+    prev = old.reindex(index=new.index, columns=cols)
+
+    a = new.to_numpy(dtype=object)
+    b = prev.to_numpy(dtype=object)
+    both_na = pd.isna(a) & pd.isna(b)
+    changed = ((a != b) & ~both_na).any(axis=1)
+
+    upsert = new[changed]
+    removed = old.index.difference(new.index)
+    return {
+        "cols": cols,
+        "upsert": [
+            [pid, *_jsonable(vals)]
+            for pid, vals in zip(upsert.index, upsert.to_numpy(dtype=object))
+        ],
+        "remove": removed.tolist(),
+    }
+
+
+def _jsonable(values: np.ndarray) -> list:
+    out = []
+    for v in values:
+        if v is None or (not isinstance(v, str) and pd.isna(v)):
+            out.append(None)
+        elif isinstance(v, np.generic):
+            out.append(v.item())
+        else:
+            out.append(v)
+    return out
+
+
+def _sse(event: str, payload: dict) -> bytes:
+    data = json.dumps(payload, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+# --------------------------------------------------------------------------- #
+#  Draft room: one snapshot, many subscribers
+# --------------------------------------------------------------------------- #
+class DraftRoom:
+    """
+    Holds the current board for one draft and fans deltas out to viewers.
+
+    Every update is diffed and serialised *once*; each viewer just receives
+    the same bytes on its queue, so the cost of a pick is independent of the
+    number of connected clients.
+    """
+
+    def __init__(
+        self,
+        draft_id: str,
+        board: pd.DataFrame,
+        *,
+        season: int | None = None,
+        teams: int | None = None,
+    ) -> None:
+        self.draft_id = draft_id
+        # what the board was built for; refreshes rebuild the same board
+        self.season = season
+        self.teams = teams
+        self.version = 0
+        self._snap = _snapshot(board)
+        self._subscribers: set[asyncio.Queue[bytes]] = set()
+        self.idle_since: float | None = time.monotonic()  # None while watched
+
+    # ------------------------------------------------------------------ #
+    @property
+    def viewers(self) -> int:
+        return len(self._subscribers)
+
+    def full_message(self) -> bytes:
+        full = diff_rows(self._snap.iloc[0:0], self._snap)
+        return _sse("snapshot", {"v": self.version, **full})
+
+    # ------------------------------------------------------------------ #
+    def subscribe(self) -> asyncio.Queue[bytes]:
+        q: asyncio.Queue[bytes] = asyncio.Queue(maxsize=QUEUE_SIZE)
+        q.put_nowait(self.full_message())
+        self._subscribers.add(q)
+        self.idle_since = None
+        return q
+
+    def unsubscribe(self, q: asyncio.Queue[bytes]) -> None:
+        self._subscribers.discard(q)
+        if not self._subscribers:
+            self.idle_since = time.monotonic()
+
+    def _broadcast(self, msg: bytes) -> None:
+        for q in self._subscribers:
+            try:
+                q.put_nowait(msg)
+            except asyncio.QueueFull:
+                # slow viewer: drop its backlog and resync from a full snapshot
+                while not q.empty():
+                    q.get_nowait()
+                q.put_nowait(self.full_message())
+
+    # ------------------------------------------------------------------ #
+    def publish(self, board: pd.DataFrame) -> dict:
+        """Replace the board (new VOR/tier/ADP) and push only the changed rows."""
+        new = _snapshot(board)
+        # drafted flags live in the room, not in the recomputed board
+        new["drafted"] = self._snap["drafted"].reindex(new.index, fill_value=False)
+        return self._apply(new)
+
+    def mark_drafted(self, player_ids: list[str], drafted: bool = True) -> dict:
+        new = self._snap.copy()
+        new.loc[new.index.intersection(player_ids), "drafted"] = drafted
+        return self._apply(new)
+
+    def _apply(self, new: pd.DataFrame) -> dict:
+        delta = diff_rows(self._snap, new)
+        self._snap = new
+        if delta["upsert"] or delta["remove"]:
+            self.version += 1
+            self._broadcast(_sse("delta", {"v": self.version, **delta}))
+        return delta
+
+
+class DraftHub:
+    """
+    Registry of live draft rooms for this worker.  Rooms without viewers
+    are evicted once idle for `idle_s`; creating a room beyond `max_rooms`
+    first evicts the longest-idle one (RuntimeError if every room is watched).
+    """
+
+    def __init__(
+        self, *, idle_s: float = ROOM_IDLE_S, max_rooms: int = MAX_ROOMS
+    ) -> None:
+        self._rooms: dict[str, DraftRoom] = {}
+        self.idle_s = idle_s
+        self.max_rooms = max_rooms
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def get(self, draft_id: str) -> DraftRoom | None:
+        self.sweep()
+        return self._rooms.get(draft_id)
+
+    def sweep(self) -> None:
+        """Drop rooms that have had no viewers for longer than `idle_s`."""
+        cutoff = time.monotonic() - self.idle_s
+        for draft_id, room in list(self._rooms.items()):
+            if room.idle_since is not None and room.idle_since <= cutoff:
+                del self._rooms[draft_id]
+
+    def _make_room(self) -> None:
+        idle = [
+            (r.idle_since, k)
+            for k, r in self._rooms.items()
+            if r.idle_since is not None
+        ]
+        if not idle:
+            raise RuntimeError(f"All {self.max_rooms} live draft rooms are in use")
+        del self._rooms[min(idle)[1]]
+
+    def get_or_create(
+        self,
+        draft_id: str,
+        loader: Callable[[], pd.DataFrame],
+        *,
+        season: int | None = None,
+        teams: int | None = None,
+    ) -> DraftRoom:
+        """Existing room, or a new one built by `loader` (first caller wins)."""
+        room = self.get(draft_id)
+        if room is None:
+            if len(self._rooms) >= self.max_rooms:
+                self._make_room()
+            room = self._rooms[draft_id] = DraftRoom(
+                draft_id, loader(), season=season, teams=teams
+            )
+        return room
+
+
+async def stream(room: DraftRoom, is_disconnected) -> AsyncIterator[bytes]:
+    """SSE byte stream for one viewer (snapshot first, then deltas)."""
+    q = room.subscribe()
+    try:
+        while True:
+            try:
+                yield await asyncio.wait_for(q.get(), timeout=HEARTBEAT_S)
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    break
+                yield b": keep-alive\n\n"
+    finally:
+        room.unsubscribe(q)
+
+
+hub = DraftHub()
@@ -0,0 +1,5 @@
+import sys
+
+from ffwb.cli import main
+
+sys.exit(main())
@@ -0,0 +1,310 @@
+# ffwb/backtest.py
+"""
+Historical draft-strategy backtester.
+
+For every (season, strategy, draft slot) we replay a snake draft: the other
+teams take the best available player by that season's ADP, our team picks
+with the strategy under test from a pre-season VOR board (last season's
+`vor` table), and every roster is then scored as a best-ball season from
+that season's `actual_weekly`.  Jobs run in a process pool; each worker
+loads a season's inputs once and reuses them for all jobs of that season.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from ffwb.bestball import BESTBALL_SLOTS, bestball_from_pool, weekly_pool
+from ffwb.lineup import POS_CODE
+
+ROUNDS = 15
+# never roster more than this many per position (keeps ADP drafters sane)
+POSITION_CAPS = {"QB": 3, "RB": 7, "WR": 7, "TE": 3}
+
+
+@dataclass(frozen=True)
+class SeasonInputs:
+    season: int
+    player_ids: pd.Index
+    pos: np.ndarray  # (P,) position codes
+    adp: np.ndarray  # (P,) inf where unknown
+    vor: np.ndarray  # (P,) pre-season board value, -inf where unknown
+    weekly: np.ndarray  # (W, P) actual weekly points
+
+
+# --------------------------------------------------------------------------- #
+#  Inputs
+# --------------------------------------------------------------------------- #
+def build_inputs(
+    season: int,
+    adp: pd.DataFrame,
+    board: pd.DataFrame,
+    weekly: pd.DataFrame,
+) -> SeasonInputs:
+    """
+    Align ADP (player_id, position, adp), the pre-season board
+    (player_id, position, vor) and scored weekly rows on one player pool.
+    """
+    cols = ["player_id", "position"]
+    pool = (
+        pd.concat([adp[cols], board[cols]], ignore_index=True)
+        .dropna()
+        .drop_duplicates("player_id")
+    )
+    pool = pool[pool["position"].str.upper().isin(POSITION_CAPS)]
+    ids = pd.Index(pool["player_id"])
+
+    adp_arr = np.full(len(ids), np.inf)
+    i = ids.get_indexer(adp["player_id"])
+    adp_arr[i[i >= 0]] = adp["adp"].to_numpy(dtype=float)[i >= 0]
+    adp_arr[np.isnan(adp_arr)] = np.inf
+
+    vor_arr = np.full(len(ids), -np.inf)
+    i = ids.get_indexer(board["player_id"])
+    vor_arr[i[i >= 0]] = board["vor"].to_numpy(dtype=float)[i >= 0]
+    vor_arr[np.isnan(vor_arr)] = -np.inf
+
+    _, pts, pos = weekly_pool(weekly, pool)
+    return SeasonInputs(season, ids, pos, adp_arr, vor_arr, pts)
+
+
+def load_inputs(season: int, data_root: Path, adp_source: str = "ffc") -> SeasonInputs:
+    """Read one season's ADP, prior-season VOR and actual weekly points."""
+    from ffwb.pipeline import DEFAULT_RULES
+    from ffwb.scoring import score_weekly
+
+    adp = pd.read_parquet(
+        data_root / "adp" / f"season={season}" / f"source={adp_source}"
+    )
+    board_path = data_root / "vor" / f"season={season - 1}"
+    if not board_path.exists():
+        raise FileNotFoundError(
+            f"No pre-season board at {board_path} – run `ffwb run --season "
+            f"{season - 1} --target vor` first"
+        )
+    board = pd.read_parquet(board_path)
+    weekly = pd.read_parquet(data_root / "actual_weekly" / f"season={season}")
+    if "fantasy_pts" not in weekly.columns:
+        weekly = score_weekly(weekly, DEFAULT_RULES)
+    return build_inputs(season, adp, board, weekly)
+
+
+# --------------------------------------------------------------------------- #
+#  Strategies: (inputs, available mask, our position counts, round) → index
+# --------------------------------------------------------------------------- #
+Strategy = Callable[[SeasonInputs, np.ndarray, dict[int, int], int], int]
+
+
+def _best(score: np.ndarray, ok: np.ndarray, fallback: np.ndarray | None = None) -> int:
+    """
+    Available (`ok`) index with the highest finite `score`.  When no
+    available player has one (e.g. the rest have no ADP), the best by
+    `fallback`, then the first available in pool order.
+    """
+    cand = np.flatnonzero(ok)
+    for values in (score, fallback):
+        if values is None:
+            continue
+        s = values[cand]
+        finite = np.isfinite(s)
+        if finite.any():
+            return int(cand[np.argmax(np.where(finite, s, -np.inf))])
+    return int(cand[0])
+
+
+def best_vor(inp, ok, counts, rnd):
+    return _best(inp.vor, ok)
+
+
+def value_vs_adp(inp, ok, counts, rnd):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = inp.vor / inp.adp
+    return _best(ratio, ok, inp.vor)
+
+
+def zero_rb(inp, ok, counts, rnd, *, rb_after: int = 5):
+    if rnd <= rb_after:
+        no_rb = ok & (inp.pos != POS_CODE["RB"])
+        if no_rb.any():
+            return _best(inp.vor, no_rb)
+    return _best(inp.vor, ok)
+
+
+def adp_only(inp, ok, counts, rnd):
+    return _best(-inp.adp, ok, inp.vor)
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "best_vor": best_vor,
+    "value_vs_adp": value_vs_adp,
+    "zero_rb": zero_rb,
+    "adp": adp_only,
+}
+
+
+# --------------------------------------------------------------------------- #
+#  Draft + scoring
+# --------------------------------------------------------------------------- #
+def simulate_draft(
+    inp: SeasonInputs,
+    strategy: Strategy,
+    slot: int,
+    *,
+    teams: int = 12,
+    rounds: int = ROUNDS,
+) -> np.ndarray:
+    """Snake draft → (teams, rounds) pool indices; team `slot` uses `strategy`."""
+    caps = {POS_CODE[p]: c for p, c in POSITION_CAPS.items()}
+    available = np.ones(len(inp.player_ids), dtype=bool)
+    counts = [dict.fromkeys(caps, 0) for _ in range(teams)]
+    rosters = np.full((teams, rounds), -1, dtype=np.int64)
+
+    for rnd in range(1, rounds + 1):
+        order = range(teams) if rnd % 2 else range(teams - 1, -1, -1)
+        for team in order:
+            full = [p for p, c in counts[team].items() if c >= caps[p]]
+            ok = available & ~np.isin(inp.pos, full)
+            if not ok.any():
+                continue
+            if team == slot:
+                pick = strategy(inp, ok, counts[team], rnd)
+            else:
+                pick = _best(-inp.adp, ok, inp.vor)
+            available[pick] = False
+            counts[team][int(inp.pos[pick])] += 1
+            rosters[team, rnd - 1] = pick
+    return rosters
+
+
+def run_one(
+    inp: SeasonInputs,
+    strategy: str,
+    slot: int,
+    *,
+    teams: int = 12,
+    slots: dict[str, int] | None = None,
+) -> dict:
+    rosters = simulate_draft(inp, STRATEGIES[strategy], slot, teams=teams)
+    pts = bestball_from_pool(inp.weekly, inp.pos, rosters, slots or BESTBALL_SLOTS)
+    return {
+        "season": inp.season,
+        "strategy": strategy,
+        "slot": slot + 1,
+        "points": float(pts[slot]),
+        "rank": int((pts > pts[slot]).sum() + 1),
+        "league_mean": float(pts.mean()),
+    }
+
+
+@lru_cache(maxsize=None)
+def _cached_inputs(season: int, data_root: str, adp_source: str) -> SeasonInputs:
+    return load_inputs(season, Path(data_root), adp_source)
+
+
+def _worker(job: tuple) -> dict:
+    season, strategy, slot, teams, data_root, adp_source = job
+    return run_one(
+        _cached_inputs(season, data_root, adp_source), strategy, slot, teams=teams
+    )
+
+
+def backtest(
+    seasons: list[int],
+    strategies: list[str] | None = None,
+    *,
+    teams: int = 12,
+    slots: list[int] | None = None,
+    data_root: Path | None = None,
+    adp_source: str = "ffc",
+    jobs: int = 4,
+) -> pd.DataFrame:
+    """
+    Run every strategy × season × draft slot; one row per simulated draft.
+    """
+    from ffwb.ingest import io
+
+    strategies = strategies or list(STRATEGIES)
+    unknown = set(strategies) - set(STRATEGIES)
+    if unknown:
+        raise ValueError(f"Unknown strategies {sorted(unknown)}")
+    root = str(data_root or io._DATA_ROOT)
+    draft_slots = slots or list(range(teams))
+
+    # season-major order so each worker mostly sees one season's inputs
+    tasks = [
+        (season, strat, slot, teams, root, adp_source)
+        for season in seasons
+        for strat in strategies
+        for slot in draft_slots
+    ]
+    if jobs <= 1:
+        rows = [_worker(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rows = list(pool.map(_worker, tasks, chunksize=max(1, len(draft_slots))))
+    return pd.DataFrame(rows)
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """Strategy summary: mean points / edge over league / rank / titles."""
+    res = results.assign(edge=results["points"] - results["league_mean"])
+    return (
+        res.groupby("strategy")
+        .agg(
+            drafts=("points", "size"),
+            mean_pts=("points", "mean"),
+            mean_edge=("edge", "mean"),
+            mean_rank=("rank", "mean"),
+            first_place=("rank", lambda r: (r == 1).mean()),
+        )
+        .sort_values("mean_edge", ascending=False)
+        .reset_index()
+    )
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def backtest_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb backtest", description="Replay historical drafts per strategy"
+    )
+    parser.add_argument("--seasons", type=int, nargs="+", required=True)
+    parser.add_argument(
+        "--strategies", nargs="+", choices=sorted(STRATEGIES), default=None
+    )
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument(
+        "--adp-source",
+        choices=["fantasypros", "underdog", "ffc", "consensus"],
+        default="ffc",
+    )
+    parser.add_argument("--jobs", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    results = backtest(
+        args.seasons,
+        args.strategies,
+        teams=args.teams,
+        adp_source=args.adp_source,
+        jobs=args.jobs,
+    )
+    summary = summarize(results)
+
+    table = Table(title=f"Draft strategies {min(args.seasons)}–{max(args.seasons)}")
+    for col in summary.columns:
+        table.add_column(col.replace("_", " ").title())
+    for row in summary.itertuples(index=False):
+        table.add_row(*(f"{x:.2f}" if isinstance(x, float) else str(x) for x in row))
+    print(table)
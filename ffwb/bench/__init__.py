@@ -0,0 +1,7 @@
+"""
+Benchmarks on seeded synthetic data.
+
+`ffwb bench` runs the timed suite (`suite`) over inputs from `generators`
+and compares against a saved baseline; one-off studies run as modules,
+e.g. `python -m ffwb.bench.arrow_backend`.
+"""
@@ -0,0 +1,120 @@
+# ffwb/bench/arrow_backend.py
+"""
+pandas vs Arrow backend for parquet → score → season totals → VOR → parquet.
+
+    python -m ffwb.bench.arrow_backend --seasons 10
+
+Each backend runs in a fresh process so peak memory is its own: peak RSS
+above the post-import baseline, Arrow memory-pool high-water mark, and
+tracemalloc peak (numpy/pandas allocations; Arrow buffers are not traced).
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ffwb import metrics, scoring, vor
+from ffwb.bench import generators
+from ffwb.pipeline import DEFAULT_RULES, ROSTER_SETTINGS
+
+
+def make_weekly(seasons: int, players: int | None = None) -> pd.DataFrame:
+    """Synthetic multi-season `actual_weekly` with a position column."""
+    weekly = generators.make_weekly(seasons, players=players)
+    return weekly.merge(generators.positions(weekly), on="player_id", how="left")
+
+
+def _run_pandas(src: Path, dst: Path) -> None:
+    weekly = pd.read_parquet(src)
+    scored = scoring.score_weekly(weekly, DEFAULT_RULES)
+    totals = scoring.aggregate_season(scored)
+    totals = totals.merge(
+        weekly[["player_id", "position"]].drop_duplicates("player_id"),
+        on="player_id",
+        how="left",
+    )
+    out = vor.compute_vor(totals, ROSTER_SETTINGS, num_teams=12)
+    pq.write_table(pa.Table.from_pandas(out, preserve_index=False), dst)
+
+
+def _run_arrow(src: Path, dst: Path) -> None:
+    weekly = pq.read_table(src)
+    scored = scoring.score_weekly(weekly, DEFAULT_RULES, backend="arrow")
+    totals = scoring.aggregate_season(scored, backend="arrow")
+    positions = weekly.select(["player_id", "position"]).group_by("player_id")
+    totals = totals.join(
+        positions.aggregate([("position", "min")]).rename_columns(
+            ["player_id", "position"]
+        ),
+        "player_id",
+        join_type="left outer",
+    )
+    out = vor.compute_vor(totals, ROSTER_SETTINGS, num_teams=12, backend="arrow")
+    pq.write_table(out, dst)
+
+
+def _measure(backend: str, src: str, dst: str, queue) -> None:
+    run = {"pandas": _run_pandas, "arrow": _run_arrow}[backend]
+    base = metrics._rss_mb()
+    pool = pa.default_memory_pool()
+    tracemalloc.start()
+    t0, c0 = time.perf_counter(), time.process_time()
+    run(Path(src), Path(dst))
+    wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    queue.put(
+        {
+            "backend": backend,
+            "wall_s": round(wall, 3),
+            "cpu_s": round(cpu, 3),
+            "rss_peak_mb": round(metrics._rss_mb() - base, 1),
+            "arrow_pool_peak_mb": round(pool.max_memory() / 2**20, 1),
+            "numpy_peak_mb": round(py_peak / 2**20, 1),
+        }
+    )
+
+
+def run(seasons: int = 10, players: int | None = None) -> pd.DataFrame:
+    ctx = mp.get_context("spawn")
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "weekly.parquet"
+        weekly = make_weekly(seasons, players)
+        n_rows = len(weekly)
+        pq.write_table(pa.Table.from_pandas(weekly), src)
+        del weekly
+        for backend in scoring.BACKENDS:
+            queue = ctx.Queue()
+            args = (backend, str(src), str(Path(tmp) / f"vor_{backend}.parquet"), queue)
+            proc = ctx.Process(target=_measure, args=args)
+            proc.start()
+            rows.append(queue.get())
+            proc.join()
+    out = pd.DataFrame(rows).set_index("backend")
+    out.attrs["rows"] = n_rows
+    return out
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--players", type=int, help="per season (default ~650)")
+    args = parser.parse_args(argv)
+
+    result = run(args.seasons, args.players)
+    print(f"{result.attrs['rows']:,} player-weeks")
+    print(result.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# ffwb/bench/generators.py
+"""
+Seeded synthetic inputs shaped like the real tables.
+
+`scale` is in seasons: 1× is one NFL season of `actual_weekly` (about 650
+fantasy-relevant players × 17 weeks, ~11k rows), 10× and 100× stack that
+many seasons.  Stat lines are drawn per position from Poisson/gamma
+distributions around realistic weekly means, so scoring touches the same
+columns with similar sparsity as nflverse data.  Same seed → same frames.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+WEEKS = 17
+FIRST_SEASON = 2000
+
+# players per season by position (roughly the fantasy-relevant pool)
+POSITION_COUNTS = {"QB": 70, "RB": 160, "WR": 250, "TE": 120, "K": 50}
+PLAYERS_PER_SEASON = sum(POSITION_COUNTS.values())
+
+# position → stat → weekly mean (Poisson for counts, gamma for yards)
+_MEANS: dict[str, dict[str, float]] = {
+    "QB": {"pass_yds": 210, "pass_tds": 1.3, "pass_ints": 0.7, "rush_yds": 14},
+    "RB": {"rush_yds": 42, "rush_tds": 0.3, "rec_rec": 2.2, "rec_yds": 17},
+    "WR": {"rec_rec": 3.3, "rec_yds": 40, "rec_tds": 0.25, "rush_yds": 1.5},
+    "TE": {"rec_rec": 2.6, "rec_yds": 27, "rec_tds": 0.2},
+    "K": {},
+}
+_YARDS = ("pass_yds", "rush_yds", "rec_yds")
+STAT_COLS = [
+    "pass_yds",
+    "pass_tds",
+    "pass_ints",
+    "rush_yds",
+    "rush_tds",
+    "rec_rec",
+    "rec_yds",
+    "rec_tds",
+    "fumbles_lost",
+]
+
+
+def player_pool(players: int | None = None, seed: int = 0) -> pd.DataFrame:
+    """player_id, position, talent (multiplier on the position means)."""
+    rng = np.random.default_rng(seed)
+    counts = POSITION_COUNTS
+    if players is not None:  # shrink/grow every position proportionally
+        counts = {
+            p: max(1, round(n * players / PLAYERS_PER_SEASON))
+            for p, n in POSITION_COUNTS.items()
+        }
+    pos = np.concatenate([np.full(n, p, dtype=object) for p, n in counts.items()])
+    return pd.DataFrame(
+        {
+            "player_id": [f"{i + 1000}" for i in range(len(pos))],
+            "position": pos,
+            "talent": rng.lognormal(0.0, 0.5, len(pos)),
+        }
+    )
+
+
+def make_weekly(
+    scale: int = 1, *, players: int | None = None, seed: int = 0
+) -> pd.DataFrame:
+    """`actual_weekly`-shaped rows for `scale` seasons (player_id, season, week, stats…)."""
+    pool = player_pool(players, seed)
+    rng = np.random.default_rng(seed + 1)
+    n_players, seasons = len(pool), max(1, int(scale))
+    n = n_players * WEEKS * seasons
+
+    idx = np.tile(np.repeat(np.arange(n_players), WEEKS), seasons)
+    df = pd.DataFrame(
+        {
+            "player_id": pool["player_id"].to_numpy()[idx],
+            "season": np.repeat(
+                np.arange(FIRST_SEASON, FIRST_SEASON + seasons), n_players * WEEKS
+            ).astype(np.int16),
+            "week": np.tile(np.arange(1, WEEKS + 1), n_players * seasons).astype(
+                np.int8
+            ),
+        }
+    )
+    position = pool["position"].to_numpy()[idx]
+    talent = pool["talent"].to_numpy()[idx]
+    for col in STAT_COLS:
+        mean = np.zeros(n)
+        for pos, means in _MEANS.items():
+            mean[position == pos] = means.get(col, 0.0)
+        mean *= talent
+        if col in _YARDS:
+            draw = rng.gamma(2.0, np.maximum(mean, 1e-9) / 2.0).round()
+            draw[mean == 0] = 0.0
+        else:
+            draw = rng.poisson(mean).astype(np.float64)
+        df[col] = draw
+    df["fumbles_lost"] = rng.poisson(0.05, n).astype(np.float64)
+    df.attrs["position"] = pool.set_index("player_id")["position"]
+    return df
+
+
+def positions(weekly: pd.DataFrame) -> pd.DataFrame:
+    """player_id → position lookup for frames from `make_weekly`."""
+    pos = weekly.attrs["position"]
+    return pd.DataFrame({"player_id": pos.index, "position": pos.to_numpy()})
+
+
+def make_totals(
+    scale: int = 1, *, players: int | None = None, seed: int = 0
+) -> pd.DataFrame:
+    """Season totals with positions (input of `compute_vor`)."""
+    from ffwb.pipeline import DEFAULT_RULES
+    from ffwb.scoring import aggregate_season, score_weekly
+
+    weekly = make_weekly(scale, players=players, seed=seed)
+    totals = aggregate_season(score_weekly(weekly, DEFAULT_RULES))
+    return totals.merge(positions(weekly), on="player_id", how="left")
+
+
+def make_adp(totals: pd.DataFrame, *, sources: int = 3, seed: int = 0) -> pd.DataFrame:
+    """
+    Consensus-ADP rows for the players in `totals`: ADP follows season
+    points with noise; `sources` feeds disagree by a few picks.
+    """
+    rng = np.random.default_rng(seed + 2)
+    latest = totals[totals["season"] == totals["season"].max()]
+    order = latest["fantasy_pts_season"].rank(ascending=False, method="first")
+    n = len(latest)
+    base = order.to_numpy() + rng.normal(0, 0.08 * n, n).clip(-0.2 * n, 0.2 * n)
+    picks = np.abs(base[:, None] + rng.normal(0, 3.0, (n, sources)))
+    return pd.DataFrame(
+        {
+            "player_id": latest["player_id"].to_numpy(),
+            "position": latest["position"].to_numpy(),
+            "adp": picks.mean(axis=1).round(2),
+            "adp_stdev": picks.std(axis=1).round(2),
+            "n_sources": np.full(n, sources, dtype=np.int8),
+        }
+    )
+
+
+def make_rosters(
+    pool: pd.DataFrame,
+    *,
+    leagues: int = 1,
+    teams: int = 12,
+    per_team: int = 16,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Long rosters (league_id, roster_id, player_id) drawn without replacement."""
+    rng = np.random.default_rng(seed + 3)
+    need = teams * per_team
+    if need > len(pool):
+        raise ValueError(f"{need} roster spots but only {len(pool)} players")
+    frames = []
+    for league in range(leagues):
+        chosen = rng.choice(len(pool), need, replace=False)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "league_id": str(league),
+                    "roster_id": np.repeat(np.arange(1, teams + 1), per_team),
+                    "player_id": pool["player_id"].to_numpy()[chosen],
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,272 @@
+# ffwb/bench/suite.py
+"""
+Timed benchmark cases over synthetic data, with saved baselines.
+
+    ffwb bench run --scales 1 10 100 --baseline   # time, save as baseline
+    ffwb bench run                                # time, save latest
+    ffwb bench compare                            # latest vs baseline
+
+Every case runs `repeat` times on the same seeded inputs; results keep the
+min and median wall time.  `compare` divides current by baseline medians
+and flags cases slower than `1 + threshold` (exit status 1), ignoring
+cases too fast to time reliably.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ffwb import scoring, vor
+from ffwb.bench import generators
+from ffwb.ingest import io
+from ffwb.pipeline import DEFAULT_RULES, ROSTER_SETTINGS
+
+BENCH_DIR = Path("_bench")  # relative to the data root
+DEFAULT_SCALES = (1, 10)
+DEFAULT_THRESHOLD = 0.2
+MIN_SECONDS = 1e-3  # below this, timer noise dominates
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[[], object]
+    rows: int
+    prepare: Callable[[], None] | None = None  # untimed, before every repeat
+
+
+@contextmanager
+def _data_root(path: Path) -> Iterator[None]:
+    """Point `io` (and the registry) at a scratch data root."""
+    old = io._DATA_ROOT
+    io._DATA_ROOT = path
+    try:
+        yield
+    finally:
+        io._DATA_ROOT = old
+
+
+def build_cases(scale: int, root: Path, *, seed: int = 0, players=None) -> list[Case]:
+    """Inputs for one scale are generated once; cases share them read-only."""
+    weekly = generators.make_weekly(scale, players=players, seed=seed)
+    scored = scoring.score_weekly(weekly, DEFAULT_RULES)
+    totals = scoring.aggregate_season(scored).merge(
+        generators.positions(weekly), on="player_id", how="left"
+    )
+    vor_df = vor.compute_vor(totals, ROSTER_SETTINGS, num_teams=12)
+    adp = generators.make_adp(totals, seed=seed)
+    table_dir = root / "actual_weekly"
+
+    def clear_table() -> None:
+        shutil.rmtree(table_dir, ignore_errors=True)
+
+    def write() -> None:
+        io.to_parquet(weekly, "actual_weekly", partition_cols=["season", "week"])
+
+    return [
+        Case(
+            "score_weekly",
+            lambda: scoring.score_weekly(weekly, DEFAULT_RULES),
+            len(weekly),
+        ),
+        Case("aggregate_season", lambda: scoring.aggregate_season(scored), len(scored)),
+        Case(
+            "compute_replacement",
+            lambda: vor.compute_replacement(totals, ROSTER_SETTINGS, num_teams=12),
+            len(totals),
+        ),
+        Case(
+            "compute_vor",
+            lambda: vor.compute_vor(totals, ROSTER_SETTINGS, num_teams=12),
+            len(totals),
+        ),
+        Case("attach_adp", lambda: vor.attach_adp(vor_df, adp), len(vor_df)),
+        Case("io.to_parquet", write, len(weekly), prepare=clear_table),
+        # reads use the files left by the last write repeat
+        Case("io.read_parquet", lambda: pd.read_parquet(table_dir), len(weekly)),
+        Case("io.read_table", lambda: io.read_table("actual_weekly"), len(weekly)),
+    ]
+
+
+def _time(case: Case, repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        if case.prepare is not None:
+            case.prepare()
+        t0 = time.perf_counter()
+        case.run()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def run_suite(
+    scales: tuple[int, ...] = DEFAULT_SCALES,
+    *,
+    repeat: int = 5,
+    seed: int = 0,
+    players: int | None = None,
+    only: list[str] | None = None,
+) -> dict:
+    """Time every case at every scale; JSON-ready result dict."""
+    results: dict[str, dict] = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as tmp, _data_root(Path(tmp)):
+            for case in build_cases(scale, Path(tmp), seed=seed, players=players):
+                if only and case.name not in only:
+                    continue
+                times = _time(case, repeat)
+                results[f"{case.name}@{scale}x"] = {
+                    "case": case.name,
+                    "scale": scale,
+                    "rows": case.rows,
+                    "repeat": repeat,
+                    "min_s": min(times),
+                    "median_s": statistics.median(times),
+                }
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "players": players,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "pyarrow": pa.__version__,
+        },
+        "results": results,
+    }
+
+
+def save(result: dict, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2))
+    return path
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = "median_s",
+) -> pd.DataFrame:
+    """
+    One row per case in either run: baseline, current, ratio and status
+    ("regression", "improved", "ok", "new" or "missing").
+    """
+    base, cur = baseline["results"], current["results"]
+    rows = []
+    keys = sorted(set(base) | set(cur), key=lambda k: (int(k.split("@")[1][:-1]), k))
+    for key in keys:
+        b = base.get(key, {}).get(metric)
+        c = cur.get(key, {}).get(metric)
+        if b is None or c is None:
+            status, ratio = ("new" if b is None else "missing"), np.nan
+        else:
+            ratio = c / b if b > 0 else np.inf
+            if max(b, c) < MIN_SECONDS:
+                status = "ok"
+            elif ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 - threshold:
+                status = "improved"
+            else:
+                status = "ok"
+        rows.append(
+            {
+                "case": key,
+                "baseline_s": b,
+                "current_s": c,
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def _default(name: str) -> Path:
+    return io._DATA_ROOT / BENCH_DIR / f"{name}.json"
+
+
+def bench_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb bench", description="Benchmark core kernels on synthetic data"
+    )
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    run_p = sub.add_parser("run", help="time the suite and save results")
+    run_p.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    run_p.add_argument("--repeat", type=int, default=5)
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--only", nargs="+", help="case names to run")
+    run_p.add_argument("--out", type=Path, help="default: data/_bench/latest.json")
+    run_p.add_argument("--baseline", action="store_true", help="also save as baseline")
+    cmp_p = sub.add_parser("compare", help="flag regressions vs a baseline")
+    cmp_p.add_argument("baseline", nargs="?", type=Path)
+    cmp_p.add_argument("current", nargs="?", type=Path)
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    if args.cmd == "run":
+        result = run_suite(
+            tuple(args.scales), repeat=args.repeat, seed=args.seed, only=args.only
+        )
+        paths = [save(result, args.out or _default("latest"))]
+        if args.baseline:
+            paths.append(save(result, _default("baseline")))
+        table = Table(title="ffwb bench")
+        for col in ("case", "rows", "min_s", "median_s"):
+            table.add_column(col, justify="left" if col == "case" else "right")
+        for key, r in result["results"].items():
+            table.add_row(
+                key, f"{r['rows']:,}", f"{r['min_s']:.4f}", f"{r['median_s']:.4f}"
+            )
+        print(table)
+        print(f"[green]Saved {', '.join(map(str, paths))}[/green]")
+        return
+
+    base_path = args.baseline or _default("baseline")
+    cur_path = args.current or _default("latest")
+    try:
+        base = json.loads(base_path.read_text())
+        cur = json.loads(cur_path.read_text())
+    except FileNotFoundError as e:
+        print(f"[red]{e}[/red]")
+        return
+    diff = compare(base, cur, threshold=args.threshold)
+    colour = {"regression": "red", "improved": "green", "ok": "white"}
+    table = Table(title=f"{cur_path.name} vs {base_path.name} (±{args.threshold:.0%})")
+    for col in diff.columns:
+        table.add_column(col, justify="left" if col == "case" else "right")
+    for r in diff.itertuples(index=False):
+        c = colour.get(r.status, "yellow")
+        table.add_row(
+            r.case,
+            "–" if pd.isna(r.baseline_s) else f"{r.baseline_s:.4f}",
+            "–" if pd.isna(r.current_s) else f"{r.current_s:.4f}",
+            f"{r.ratio:.2f}",
+            f"[{c}]{r.status}[/{c}]",
+        )
+    print(table)
+    if (diff["status"] == "regression").any():
+        raise SystemExit(1)
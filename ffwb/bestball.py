@@ -0,0 +1,156 @@
+# ffwb/bestball.py
+"""
+Best-ball season scoring: Σ over weeks of each roster's optimal lineup.
+
+Rosters are integer index arrays into a player pool, and weekly points are a
+(weeks × pool) array, either actual results (`actual_weekly`, backtests) or
+simulated weeks (sims × weeks × pool).  Lineups for every roster × week are
+solved together with `lineup.optimal_lineup`, in bounded-size chunks so
+tens of thousands of simulated drafts stay within memory.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from ffwb.lineup import optimal_lineup, position_codes
+
+# Underdog-style best-ball lineup
+BESTBALL_SLOTS: dict[str, int] = {"qb": 1, "rb": 2, "wr": 3, "te": 1, "flex": 1}
+
+REGULAR_SEASON_WEEKS = tuple(range(1, 18))
+
+_CHUNK_CELLS = 4_000_000  # roster-week-slot cells solved per chunk
+
+
+def bestball_from_pool(
+    pool_points: np.ndarray,
+    pool_pos: np.ndarray,
+    rosters: np.ndarray,
+    slots: dict[str, int] | None = None,
+) -> np.ndarray:
+    """
+    Best-ball season points for many rosters drawn from one player pool.
+
+    Parameters
+    ----------
+    pool_points : ndarray (W, P) or (S, W, P)
+        Weekly points for every pool player (actual or S simulated seasons);
+        NaN/0 for byes and missed games.
+    pool_pos : ndarray (P,)
+        Position codes (`lineup.position_codes`).
+    rosters : ndarray (..., N) int
+        Pool indices per roster; -1 pads short rosters.
+    slots : dict, optional
+        Lineup slots, default `BESTBALL_SLOTS`.
+
+    Returns
+    -------
+    ndarray
+        (...,) season points for actual weeks, (S, ...) for simulated ones.
+    """
+    slots = BESTBALL_SLOTS if slots is None else slots
+    pool_points = np.asarray(pool_points, dtype=np.float32)
+    sims = pool_points.ndim == 3
+    pts3 = pool_points if sims else pool_points[None]  # (S, W, P)
+    n_sims, n_weeks, _ = pts3.shape
+
+    rosters = np.asarray(rosters)
+    lead, n = rosters.shape[:-1], rosters.shape[-1]
+    flat = rosters.reshape(-1, n)
+    pad = flat < 0
+    safe = np.where(pad, 0, flat)
+    pos = np.where(pad, -1, np.asarray(pool_pos)[safe])  # (B, N)
+
+    out = np.empty((n_sims, flat.shape[0]), dtype=np.float64)
+    step = max(1, _CHUNK_CELLS // max(1, n_weeks * n))
+    for s in range(n_sims):
+        for lo in range(0, flat.shape[0], step):
+            hi = lo + step
+            # (W, b, N) → (b, W, N)
+            wk = pts3[s][:, safe[lo:hi]].transpose(1, 0, 2)
+            wk = np.where(pad[lo:hi, None, :], np.nan, wk)
+            total, _ = optimal_lineup(wk, pos[lo:hi, None, :], slots)
+            out[s, lo:hi] = total.sum(axis=1)
+
+    out = out.reshape((n_sims, *lead))
+    return out if sims else out[0]
+
+
+def simulated_pool(
+    mean_weekly: np.ndarray,
+    positions: Sequence[str],
+    model: dict[str, np.ndarray],
+    *,
+    n_sims: int,
+    n_weeks: int = len(REGULAR_SEASON_WEEKS),
+    seed: int | None = None,
+) -> np.ndarray:
+    """(S, W, P) simulated weekly points from per-week means (see simulate)."""
+    from ffwb.simulate import sample_points
+
+    draws = sample_points(
+        mean_weekly, positions, model, n_sims * n_weeks, np.random.default_rng(seed)
+    )
+    return draws.reshape(n_sims, n_weeks, -1)
+
+
+def weekly_pool(
+    weekly: pd.DataFrame,
+    positions: pd.DataFrame,
+    *,
+    weeks: Sequence[int] = REGULAR_SEASON_WEEKS,
+    points_col: str = "fantasy_pts",
+) -> tuple[pd.Index, np.ndarray, np.ndarray]:
+    """
+    Dense pool from scored `actual_weekly` rows.
+
+    Returns (player_ids, points (W, P) float32, pos codes (P,)); a player
+    with no row in a week scores 0 that week.
+    """
+    pos = positions.drop_duplicates("player_id").set_index("player_id")["position"]
+    ids = pd.Index(pos.index)
+    pts = np.zeros((len(weeks), len(ids)), dtype=np.float32)
+
+    wk_idx = pd.Index(weeks).get_indexer(weekly["week"])
+    pl_idx = ids.get_indexer(weekly["player_id"])
+    ok = (wk_idx >= 0) & (pl_idx >= 0)
+    np.add.at(
+        pts,
+        (wk_idx[ok], pl_idx[ok]),
+        weekly[points_col].to_numpy(dtype=np.float32)[ok],
+    )
+    return ids, pts, position_codes(pos.to_numpy())
+
+
+def bestball_rosters(
+    rosters: pd.DataFrame,
+    weekly: pd.DataFrame,
+    positions: pd.DataFrame,
+    slots: dict[str, int] | None = None,
+    *,
+    team_col: str = "roster_id",
+    weeks: Sequence[int] = REGULAR_SEASON_WEEKS,
+    points_col: str = "fantasy_pts",
+) -> pd.DataFrame:
+    """
+    Backtest: best-ball season points per roster from actual weekly scores.
+
+    `rosters` is long format (team_col, player_id); `weekly` is scored
+    actual_weekly; `positions` maps player_id → position.
+    """
+    ids, pts, pos = weekly_pool(weekly, positions, weeks=weeks, points_col=points_col)
+
+    idx = ids.get_indexer(rosters["player_id"])
+    team = rosters.groupby(team_col, sort=False).ngroup().to_numpy()
+    spot = rosters.groupby(team_col, sort=False).cumcount().to_numpy()
+    dense = np.full((team.max() + 1, spot.max() + 1), -1, dtype=np.int64)
+    dense[team, spot] = idx
+
+    season = bestball_from_pool(pts, pos, dense, slots)
+    return pd.DataFrame(
+        {team_col: rosters[team_col].drop_duplicates().to_numpy(), "bb_pts": season}
+    )
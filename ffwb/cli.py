@@ -1,116 +1,97 @@
-from __future__ import annotations
-
-import argparse
-from pathlib import Path
-
-import pandas as pd
-from rich import print
-from rich.table import Table
-
-from ffwb.ingest.adp import ingest_adp, ADPError, _map_to_players
-from ffwb.ingest.ids import build_xwalk
-
-# from ffwb.ingest import io
-from ffwb import vor
-
+# ffwb/cli.py
+"""
+Single `ffwb` command tree.
 
-# --------------------------- helpers ----------------------------------------
-def _load_parquet(rel_path: str) -> pd.DataFrame:
-    path = Path.cwd() / "data" / rel_path
-    return pd.read_parquet(path) if path.exists() else pd.DataFrame()
+Only the standard library is imported here: each subcommand names the
+module that implements it, and that module (with pandas, pyarrow, rich,
+nfl_data_py, …) is imported only when the subcommand actually runs.
+"""
 
+from __future__ import annotations
 
-# --------------------------- CLI --------------------------------------------
-def draft_board() -> None:
-    parser = argparse.ArgumentParser(description="Show VOR draft board")
-    parser.add_argument("--season", type=int, required=True)
-    parser.add_argument("--teams", type=int, default=12)
-    parser.add_argument(
-        "--source",
-        choices=["fantasypros", "underdog", "ffc"],
-        default="ffc",
-        help="Online ADP source",
-    )
-    parser.add_argument(
-        "--adp-file",
-        help="Local CSV/JSON with columns full_name, position, adp "
-        "(overrides --source)",
+import argparse
+import os
+import sys
+from importlib import import_module
+
+# name → ("module:function", help).  Targets take `argv: list[str] | None`.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "board": ("ffwb.cli_board:draft_board", "Show the season VOR draft board"),
+    "calc-season": (
+        "ffwb.pipeline:calc_season_main",
+        "Score weekly stats → season totals",
+    ),
+    "calc-vor": ("ffwb.pipeline:calc_vor_main", "Season totals → VOR"),
+    "tank": ("ffwb.cli_proj_tank:tank_board", "Tank-01 weekly VOR board"),
+    "tank-backfill": (
+        "ffwb.cli_proj_tank:tank_backfill",
+        "Fetch Tank-01 projections for many weeks",
+    ),
+    "run": ("ffwb.runner:run_main", "Run the pipeline up to a target stage"),
+    "backtest": ("ffwb.backtest:backtest_main", "Backtest draft strategies"),
+    "tensor": ("ffwb.tensor:tensor_main", "Pack weekly stats into tensor stores"),
+    "ros": ("ffwb.ros:ros_main", "Rest-of-season VOR from weekly projections"),
+    "waivers": ("ffwb.waivers:waivers_main", "Free-agent lineup gains per team"),
+    "features": ("ffwb.features:features_main", "Rolling / EWMA form features"),
+    "pbp": ("ffwb.ingest.pbp:pbp_main", "Merge play-by-play stats into weekly"),
+    "sql": ("ffwb.sql:sql_main", "SQL over the data/ lake (DuckDB)"),
+    "metrics": ("ffwb.metrics:metrics_main", "Summarise recorded pipeline spans"),
+    "bench": (
+        "ffwb.bench.suite:bench_main",
+        "Benchmark core kernels on synthetic data",
+    ),
+    "adp-movers": (
+        "ffwb.ingest.adp_history:movers_main",
+        "ADP risers / fallers from dated snapshots",
+    ),
+}
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ffwb", description="Fantasy-football workbench"
     )
-    args = parser.parse_args()
-
-    # ---------- ADP ----------
-    if args.adp_file:
-        ext = Path(args.adp_file).suffix.lower()
-        if ext == ".csv":
-            adp_raw = pd.read_csv(args.adp_file)
-        elif ext in (".json", ".ndjson"):
-            adp_raw = pd.read_json(args.adp_file)
-        else:
-            print(f"[red]Unsupported file extension: {ext}[/red]")
-            return
-        adp = _map_to_players(adp_raw, args.season)
+    sub = parser.add_subparsers(dest="command", metavar="<command>")
+    for name, (_, help_) in COMMANDS.items():
+        # help/args of the subcommand itself are parsed by its own module
+        sub.add_parser(name, help=help_, add_help=False)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = _parser()
+
+    # the old `ffwb` script was the board: `ffwb --season 2024 …` still is
+    if argv and argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        argv = ["board", *argv]
+
+    if not argv or argv[0] not in COMMANDS:
+        parser.parse_args(argv)  # handles --help / unknown commands
+        parser.print_help()
+        return 1
+
+    target, _ = COMMANDS[argv[0]]
+    module, func = target.split(":")
+    # every command run is a span in data/_metrics/spans.jsonl, rotated past
+    # metrics.MAX_LOG_BYTES (FFWB_METRICS=0: off)
+    if argv[0] != "metrics" and os.getenv("FFWB_METRICS", "1") != "0":
+        from ffwb import metrics  # stdlib only
+
+        metrics.configure(log=True)
+        with metrics.span(f"cli.{argv[0]}"):
+            getattr(import_module(module), func)(argv[1:])
     else:
-        adp = _load_parquet(f"adp/season={args.season}/source={args.source}")
-        if adp.empty or "adp" not in adp.columns:
-            try:
-                adp = ingest_adp(args.season, source=args.source, teams=args.teams)
-            except ADPError as e:
-                print(
-                    f"[yellow]ADP fetch failed – {e}. "
-                    "Draft board will omit ADP columns.[/yellow]"
-                )
-                adp = pd.DataFrame()
-
-    # ---------- VOR ----------
-    vor_df = _load_parquet("vor")
-    if vor_df.empty:
-        print("[yellow]No VOR data – compute season totals first.[/yellow]")
-        return
-
-    board = vor.attach_adp(vor_df, adp)
-    exclude = ["DB", "DL", "LB", "P"]
-    board = board[~board["position"].isin(exclude)]
-    name_map = build_xwalk(
-        args.season
-    ).rename(  # returns columns: gsis_id, sleeper_id, full_name, position
-        columns={"sleeper_id": "player_id"}
-    )[
-        ["player_id", "full_name"]
-    ]
-    board = board.merge(name_map, on="player_id", how="left")
-
-    # Move full_name up front and drop raw IDs if you like
-    board = board.rename(columns={"full_name": "player_name"})
-    cols = ["player_name"] + [c for c in board.columns if c != "player_name"]
-    board = board[cols]
-    board = board.sort_values(
-        ["tier", "value_vs_adp", "fantasy_pts_season"], ascending=[True, False, False]
-    )
+        getattr(import_module(module), func)(argv[1:])
+    return 0
+
+
+def draft_board(argv: list[str] | None = None) -> None:
+    """Backwards-compatible entry point for the old `ffwb` script."""
+    from ffwb.cli_board import draft_board as _draft_board
 
-    table = Table(title=f"Draft Board {args.season}")
-    # show player_name instead of player_id
-    display_cols = [
-        "player_name",
-        "position",
-        "fantasy_pts_season",
-        "vor",
-        "tier",
-        "adp",
-        "value_vs_adp",
-    ]
-    for col in display_cols:
-        table.add_column(col.replace("_", " ").title())
-
-    for _, row in board.head(150).iterrows():
-        table.add_row(
-            *(
-                f"{x:.2f}" if isinstance(x, float) and not pd.isna(x) else str(x)
-                for x in row[display_cols]
-            )
-        )
-
-    print(table)
+    _draft_board(argv)
 
 
 if __name__ == "__main__":
-    draft_board()
+    sys.exit(main())
@@ -7,7 +7,7 @@ import pandas as pd
 from rich import print
 from rich.table import Table
 
-from ffwb.ingest.tank01 import ingest_tank01
+from ffwb.ingest.tank01 import RATE_LIMIT, backfill_tank01, ingest_tank01
 from ffwb import vor
 import numpy as np
 
@@ -15,12 +15,14 @@ import numpy as np
 ROSTER_SETTINGS = {"qb": 1, "rb": 2, "wr": 2, "te": 1}
 
 
-def tank_board() -> None:
-    p = argparse.ArgumentParser(description="Tank-01 weekly VOR draft board")
+def tank_board(argv: list[str] | None = None) -> None:
+    p = argparse.ArgumentParser(
+        prog="ffwb tank", description="Tank-01 weekly VOR draft board"
+    )
     p.add_argument("--season", type=int, required=True)
     p.add_argument("--week", type=int, required=True)
     p.add_argument("--teams", type=int, default=12)
-    args = p.parse_args()
+    args = p.parse_args(argv)
 
     # ------------------------------------------------------------------ #
     # pull projections (Sleeper IDs in player_id, plus names/teams)
@@ -67,5 +69,30 @@ def tank_board() -> None:
     print(tbl)
 
 
+def tank_backfill(argv: list[str] | None = None) -> None:
+    p = argparse.ArgumentParser(
+        prog="ffwb tank-backfill",
+        description="Fetch Tank-01 projections for many weeks / seasons",
+    )
+    p.add_argument("--season", type=int, nargs="+", required=True)
+    p.add_argument("--weeks", type=int, nargs="+", help="default: weeks 1–18")
+    p.add_argument("--jobs", type=int, default=6)
+    p.add_argument("--rate", type=float, default=RATE_LIMIT, help="requests / second")
+    p.add_argument("--force", action="store_true", help="re-fetch stored weeks")
+    args = p.parse_args(argv)
+
+    report = backfill_tank01(
+        args.season, args.weeks, jobs=args.jobs, rate=args.rate, force=args.force
+    )
+    counts = report["status"].value_counts().to_dict()
+    print(
+        f"[green]fetched {counts.get('fetched', 0)}[/green], "
+        f"skipped {counts.get('skipped', 0)}, "
+        f"[red]failed {counts.get('failed', 0)}[/red]"
+    )
+    for row in report[report["status"] == "failed"].itertuples():
+        print(f"[red]  {row.season} week {row.week}: {row.error}[/red]")
+
+
 if __name__ == "__main__":
     tank_board()
@@ -0,0 +1,346 @@
+# ffwb/features.py
+"""
+Recent-form features from `actual_weekly`: rolling means, EWMA and
+weight-weighted (e.g. snap-share) rolling means for every player × stat.
+
+Rows are sorted once and scattered into a dense (players × games × stats)
+array, so each feature family is a handful of whole-array operations:
+
+* rolling mean over the last `w` games → difference of cumulative sums
+* EWMA (pandas `adjust=False`)         → one recurrence step per game index
+* weighted rolling mean                → ratio of two cumulative-sum windows
+
+Features at a row include that row's game, i.e. they describe form *after*
+the week and are the inputs for projecting the next one.  Output is written
+to `data/features_weekly/season=…/week=…`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from ffwb.ingest.nflfast import STAT_COLS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOWS = (3, 5)
+DEFAULT_ALPHAS = (0.5,)
+
+_GROUP = ("player_id", "season")
+
+
+def rolling_col(stat: str, window: int) -> str:
+    return f"{stat}_r{window}"
+
+
+def weighted_col(stat: str, window: int) -> str:
+    return f"{stat}_w{window}"
+
+
+def ewm_col(stat: str, alpha: float) -> str:
+    return f"{stat}_ewm{round(alpha * 100):02d}"
+
+
+# --------------------------------------------------------------------------- #
+#  Dense layout
+# --------------------------------------------------------------------------- #
+def _layout(
+    df: pd.DataFrame, by: Sequence[str]
+) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """Sort rows; return (sorted df, group index, game index within group)."""
+    df = df.sort_values([*by, "week"], kind="mergesort").reset_index(drop=True)
+    grp = df.groupby(list(by), sort=False, observed=True).ngroup().to_numpy()
+    starts = np.flatnonzero(np.r_[True, grp[1:] != grp[:-1]])
+    sizes = np.diff(np.r_[starts, len(grp)])
+    game = np.arange(len(grp)) - np.repeat(starts, sizes)
+    return df, grp, game
+
+
+def _dense(values: np.ndarray, grp: np.ndarray, game: np.ndarray) -> np.ndarray:
+    """(rows, S) → (groups, games, S), zero padded."""
+    out = np.zeros((grp.max() + 1, game.max() + 1, values.shape[1]))
+    out[grp, game] = values
+    return out
+
+
+def _window_sum(dense: np.ndarray, window: int) -> np.ndarray:
+    """Trailing `window`-game sums along axis 1 (padding contributes 0)."""
+    cs = np.cumsum(dense, axis=1)
+    out = cs.copy()
+    out[:, window:] -= cs[:, :-window]
+    return out
+
+
+def _ewm(dense: np.ndarray, alpha: float, init: np.ndarray | None = None) -> np.ndarray:
+    """y_k = α·x_k + (1−α)·y_{k−1}, y_0 = x_0 (or seeded from `init`)."""
+    out = np.empty_like(dense)
+    prev = init
+    for k in range(dense.shape[1]):
+        x = dense[:, k]
+        prev = (
+            x
+            if prev is None
+            else np.where(np.isnan(prev), x, alpha * x + (1 - alpha) * prev)
+        )
+        out[:, k] = prev
+    return out
+
+
+def _rolling_block(
+    df: pd.DataFrame,
+    grp: np.ndarray,
+    game: np.ndarray,
+    stats: list[str],
+    windows: Sequence[int],
+    weight_col: str | None,
+) -> dict[str, np.ndarray]:
+    vals = df[stats].fillna(0).to_numpy(dtype=np.float64)
+    x = _dense(vals, grp, game)
+    out: dict[str, np.ndarray] = {}
+    n_games = game + 1
+    for w in windows:
+        mean = _window_sum(x, w)[grp, game] / np.minimum(n_games, w)[:, None]
+        for j, s in enumerate(stats):
+            out[rolling_col(s, w)] = mean[:, j]
+
+    if weight_col is not None:
+        wt = df[weight_col].fillna(0).to_numpy(dtype=np.float64)[:, None]
+        xw = _dense(vals * wt, grp, game)
+        ww = _dense(wt, grp, game)
+        for w in windows:
+            num = _window_sum(xw, w)[grp, game]
+            den = _window_sum(ww, w)[grp, game]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.where(den > 0, num / den, np.nan)
+            for j, s in enumerate(stats):
+                out[weighted_col(s, w)] = mean[:, j]
+    return out
+
+
+def _ewm_block(
+    df: pd.DataFrame,
+    grp: np.ndarray,
+    game: np.ndarray,
+    stats: list[str],
+    alphas: Sequence[float],
+    init: dict[float, np.ndarray] | None = None,
+) -> dict[str, np.ndarray]:
+    x = _dense(df[stats].fillna(0).to_numpy(dtype=np.float64), grp, game)
+    out: dict[str, np.ndarray] = {}
+    for a in alphas:
+        y = _ewm(x, a, None if init is None else init[a])[grp, game]
+        for j, s in enumerate(stats):
+            out[ewm_col(s, a)] = y[:, j]
+    return out
+
+
+def _stats_for(weekly: pd.DataFrame, stats: Sequence[str] | None) -> list[str]:
+    return [s for s in (stats or STAT_COLS) if s in weekly.columns]
+
+
+def _feature_cols(
+    stats: list[str],
+    windows: Sequence[int],
+    alphas: Sequence[float],
+    weight_col: str | None,
+) -> set[str]:
+    cols = {rolling_col(s, w) for s in stats for w in windows}
+    if weight_col is not None:
+        cols |= {weighted_col(s, w) for s in stats for w in windows}
+    return cols | {ewm_col(s, a) for s in stats for a in alphas}
+
+
+# --------------------------------------------------------------------------- #
+#  Public API
+# --------------------------------------------------------------------------- #
+def build_features(
+    weekly: pd.DataFrame,
+    *,
+    stats: Sequence[str] | None = None,
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    alphas: Sequence[float] = DEFAULT_ALPHAS,
+    weight_col: str | None = None,
+    by: Sequence[str] = _GROUP,
+) -> pd.DataFrame:
+    """
+    Windowed form features for every row of `weekly`.
+
+    Parameters
+    ----------
+    weekly : DataFrame
+        actual_weekly rows (player_id, season, week, stat columns…).
+    stats : list, optional
+        Stat columns to featurize; default `nflfast.STAT_COLS`.
+    windows : ints
+        Rolling windows in games (`{stat}_r{w}`, and `{stat}_w{w}` with
+        `weight_col`).
+    alphas : floats
+        EWMA smoothing factors (`{stat}_ewm{100·α}`).
+    weight_col : str, optional
+        Per-game weight (snap count / share) for weighted rolling means.
+    by : columns
+        Sequence key; default resets form at each season.
+    """
+    stats = _stats_for(weekly, stats)
+    df, grp, game = _layout(weekly, by)
+    feats = _rolling_block(df, grp, game, stats, windows, weight_col)
+    feats.update(_ewm_block(df, grp, game, stats, alphas))
+    keys = df[[*by, "week"]].reset_index(drop=True)
+    return pd.concat([keys, pd.DataFrame(feats)], axis=1)
+
+
+def update_features(
+    features: pd.DataFrame,
+    history: pd.DataFrame,
+    new: pd.DataFrame,
+    *,
+    stats: Sequence[str] | None = None,
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    alphas: Sequence[float] = DEFAULT_ALPHAS,
+    weight_col: str | None = None,
+    by: Sequence[str] = _GROUP,
+) -> pd.DataFrame:
+    """
+    Feature rows for newly landed weeks only.
+
+    Rolling windows need the last `max(windows) - 1` games of `history`
+    (raw weekly rows already featurized); EWMAs continue from each
+    player's latest row in `features`.  The result equals the matching
+    rows of `build_features(history + new)`.
+
+    Raises ValueError when `features` holds a different column set than
+    `stats`/`windows`/`alphas`/`weight_col` produce (rebuild instead).
+    """
+    stats = _stats_for(new, stats)
+    by = list(by)
+    expected = _feature_cols(stats, windows, alphas, weight_col)
+    stored = set(features.columns) - {*by, "week", "player_key"}
+    if stored != expected:
+        diff = sorted(expected - stored) or sorted(stored - expected)
+        raise ValueError(
+            "stored features were built with other stats/windows/alphas "
+            f"({'missing' if expected - stored else 'extra'}: "
+            f"{', '.join(diff[:5])}{' …' if len(diff) > 5 else ''}); rebuild them"
+        )
+    keep = max(windows) - 1
+    tail = (
+        history.sort_values([*by, "week"], kind="mergesort")
+        .groupby(by, sort=False, observed=True)
+        .tail(keep)
+        .merge(new[by].drop_duplicates(), on=by)  # only players with new games
+    )
+    both = pd.concat(
+        [tail.assign(_new=False), new.assign(_new=True)], ignore_index=True
+    )
+    df, grp, game = _layout(both, by)
+    is_new = df["_new"].to_numpy()
+    feats = {
+        k: v[is_new]
+        for k, v in _rolling_block(df, grp, game, stats, windows, weight_col).items()
+    }
+
+    # EWMA: recurrence over the new rows seeded from the last stored value
+    new_df, new_grp, new_game = _layout(new, by)
+    last = (
+        features.sort_values([*by, "week"], kind="mergesort")
+        .groupby(by, sort=False, observed=True)
+        .tail(1)
+    )
+    heads = new_df.loc[new_game == 0, by]
+    seed = heads.merge(last, on=by, how="left")
+    init = {
+        a: seed[[ewm_col(s, a) for s in stats]].to_numpy(dtype=np.float64)
+        for a in alphas
+    }
+    feats.update(_ewm_block(new_df, new_grp, new_game, stats, alphas, init))
+
+    keys = df.loc[is_new, [*by, "week"]].reset_index(drop=True)
+    out = pd.concat([keys, pd.DataFrame(feats)], axis=1)
+    # _layout sorts identically for `both[new]` and `new`, so rows line up
+    return out
+
+
+def write_features(
+    season: int,
+    *,
+    rebuild: bool = False,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Refresh `features_weekly/season=` from `actual_weekly/season=`.
+
+    Weeks already featurized are kept and only newer weeks are computed and
+    appended, unless `rebuild=True` or the stored columns were built with
+    other settings.  Returns the rows written.
+    """
+    from ffwb.ingest import io
+
+    weekly_path = io._DATA_ROOT / "actual_weekly" / f"season={season}"
+    if not weekly_path.exists():
+        raise FileNotFoundError(f"No weekly stats found at {weekly_path}")
+    weekly = pd.read_parquet(weekly_path).dropna(subset=["player_id"])
+    weekly["season"] = season
+    weekly["week"] = weekly["week"].astype(np.int64)
+
+    out_path = io._DATA_ROOT / "features_weekly" / f"season={season}"
+    if out_path.exists() and not rebuild:
+        features = pd.read_parquet(out_path)
+        features["season"] = season
+        features["week"] = features["week"].astype(np.int64)
+        done = int(features["week"].max())
+        new = weekly[weekly["week"] > done]
+        if new.empty:
+            return new.iloc[:0]
+        try:
+            rows = update_features(
+                features, weekly[weekly["week"] <= done], new, **kwargs
+            )
+        except ValueError as exc:
+            logger.warning("features_weekly %s: %s – rebuilding", season, exc)
+            return write_features(season, rebuild=True, **kwargs)
+    else:
+        shutil.rmtree(out_path, ignore_errors=True)
+        rows = build_features(weekly, **kwargs)
+
+    io.to_parquet(rows, "features_weekly", partition_cols=["season", "week"])
+    return rows
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def features_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb features", description="Rolling / EWMA form features"
+    )
+    parser.add_argument("--season", type=int, nargs="+", required=True)
+    parser.add_argument("--windows", type=int, nargs="+", default=list(DEFAULT_WINDOWS))
+    parser.add_argument("--alphas", type=float, nargs="+", default=list(DEFAULT_ALPHAS))
+    parser.add_argument("--weight-col", default=None)
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args(argv)
+
+    from rich import print
+
+    for season in args.season:
+        try:
+            rows = write_features(
+                season,
+                rebuild=args.rebuild,
+                windows=args.windows,
+                alphas=args.alphas,
+                weight_col=args.weight_col,
+            )
+        except FileNotFoundError as e:
+            print(f"[red]{e}[/red]")
+            continue
+        weeks = sorted(rows["week"].unique()) if len(rows) else []
+        print(
+            f"[green]features_weekly {season}: {len(rows)} rows, weeks {weeks}[/green]"
+        )
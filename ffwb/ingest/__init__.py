@@ -1,6 +1,11 @@
-from . import io as io
-from . import sleeper as sleeper
-from . import nflfast as nflfast
-from . import adp as adp  # ← add this line
+from importlib import import_module
 
-__all__ = ["io", "sleeper", "nflfast", "adp"]
+# Submodules load on first attribute access: `nflfast` pulls in nfl_data_py
+# and the API clients read .env, neither of which a cheap command needs.
+__all__ = ["io", "sleeper", "nflfast", "adp", "pbp"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import io as _io
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # from typing import List
 
+import numpy as np
 import pandas as pd
 import requests
 
-from . import io, ids
+from . import adp_history, io, names
+from .names import NameIndex
 
 # ---------- public endpoints ----------
 FANTASYPROS_URL = "https://www.fantasypros.com/nfl/adp/overall.php?csv=1"
@@ -22,6 +26,9 @@ HEADERS = {
 }
 
 
+logger = logging.getLogger(__name__)
+
+
 class ADPError(RuntimeError): ...
 
 
@@ -90,44 +97,140 @@ def _load_ffc_json(season: int, teams: int = 12) -> pd.DataFrame:
             "pos": "position",
             "overall": "adp",
             "average_pick": "adp",
+            "stdev": "adp_stdev",
         }
     )
     if not {"full_name", "position", "adp"}.issubset(df.columns):
         raise ADPError("FFC JSON missing expected columns")
 
-    return df[["full_name", "position", "adp"]]
+    cols = ["full_name", "position", "adp"]
+    return df[cols + ["adp_stdev"] if "adp_stdev" in df.columns else cols]
 
 
 # ---------------------------- mapping helper ---------------------------------
-def _map_to_players(adp_raw: pd.DataFrame, season: int) -> pd.DataFrame:
-    roster = ids.build_xwalk(season)[["sleeper_id", "full_name"]]
-    adp = (
-        adp_raw.merge(roster, on="full_name", how="left")
-        .dropna(subset=["sleeper_id"])
-        .rename(columns={"sleeper_id": "player_id"})
+def _map_to_players(
+    adp_raw: pd.DataFrame, season: int, index: NameIndex | None = None
+) -> pd.DataFrame:
+    """
+    Resolve feed names to Sleeper ids (exact, then fuzzy within position);
+    unresolved names are logged by `NameIndex.resolve` and dropped.
+    """
+    index = index or names.season_index(season)
+    hits = index.resolve(
+        adp_raw["full_name"],
+        adp_raw["position"] if "position" in adp_raw.columns else None,
+        adp_raw["team"] if "team" in adp_raw.columns else None,
     )
-    adp["adp_stdev"] = float("nan")
-    return adp[["player_id", "position", "adp"]]
+    adp = adp_raw.reset_index(drop=True).assign(player_id=hits["player_id"])
+    adp = adp.dropna(subset=["player_id"])
+    if "adp_stdev" not in adp.columns:
+        adp["adp_stdev"] = float("nan")
+    # two feed rows resolved to one player: keep the earlier pick
+    adp = adp.sort_values("adp").drop_duplicates("player_id")
+    return adp[["player_id", "position", "adp", "adp_stdev"]]
+
+
+# ---------------------------- consensus --------------------------------------
+SOURCES = ("fantasypros", "underdog", "ffc")
+CONSENSUS = "consensus"
+
+# relative trust per source in the consensus mean
+SOURCE_WEIGHTS: dict[str, float] = {"fantasypros": 1.0, "underdog": 1.0, "ffc": 1.0}
+
+
+def _load_source(source: str, season: int, teams: int) -> pd.DataFrame:
+    if source == "fantasypros":
+        return _load_fpros_csv()
+    if source == "underdog":
+        return _load_underdog_json()
+    if source == "ffc":
+        return _load_ffc_json(season, teams)
+    raise ValueError(f"source must be one of {SOURCES} or {CONSENSUS!r}")
+
+
+def consensus_adp(
+    frames: dict[str, pd.DataFrame],
+    weights: dict[str, float] | None = None,
+) -> pd.DataFrame:
+    """
+    Combine per-source mapped ADP (player_id, position, adp, adp_stdev).
+
+    Returns player_id, position, adp (weighted mean), adp_stdev and
+    n_sources.  The spread is the weighted law-of-total-variance mix of
+    each source's own stdev (0 when unknown) and the between-source
+    disagreement; it is NaN for a single source without its own stdev.
+    """
+    weights = weights or SOURCE_WEIGHTS
+    long = pd.concat(
+        [f.assign(_w=weights.get(src, 1.0)) for src, f in frames.items() if len(f)],
+        ignore_index=True,
+    )
+    long = long.dropna(subset=["adp"])
+    codes, players = pd.factorize(long["player_id"])
+    w = long["_w"].to_numpy(dtype=float)
+    x = long["adp"].to_numpy(dtype=float)
+    s = long["adp_stdev"].to_numpy(dtype=float)
+
+    n = len(players)
+    w_sum = np.bincount(codes, w, n)
+    mean = np.bincount(codes, w * x, n) / w_sum
+    within = np.bincount(codes, w * np.nan_to_num(s) ** 2, n)
+    between = np.bincount(codes, w * (x - mean[codes]) ** 2, n)
+    stdev = np.sqrt((within + between) / w_sum)
+    n_sources = np.bincount(codes, minlength=n)
+    known = np.bincount(codes, ~np.isnan(s), n) > 0
+    stdev[(n_sources == 1) & ~known] = np.nan
+
+    first = long.drop_duplicates("player_id").set_index("player_id")["position"]
+    return pd.DataFrame(
+        {
+            "player_id": players,
+            "position": first.reindex(players).to_numpy(),
+            "adp": mean,
+            "adp_stdev": stdev,
+            "n_sources": n_sources.astype(np.int16),
+        }
+    ).sort_values("adp", ignore_index=True)
+
+
+def _fetch_consensus(season: int, teams: int, sources: tuple[str, ...]) -> pd.DataFrame:
+    """Download every source concurrently, map once, combine."""
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {s: pool.submit(_load_source, s, season, teams) for s in sources}
+        raw: dict[str, pd.DataFrame] = {}
+        for src, fut in futures.items():
+            try:
+                raw[src] = fut.result()
+            except (ADPError, requests.RequestException, KeyError) as exc:
+                logger.warning("consensus ADP: %s unavailable (%s)", src, exc)
+    if not raw:
+        raise ADPError(f"No ADP source reachable ({', '.join(sources)})")
+
+    index = names.season_index(season)
+    mapped = {src: _map_to_players(df, season, index) for src, df in raw.items()}
+    return consensus_adp(mapped)
 
 
 # ---------------------------- public ingest ----------------------------------
 def ingest_adp(
     season: int,
     *,
-    source: str = "ffc",  # "fantasypros" | "underdog" | "ffc"
+    source: str = "ffc",  # "fantasypros" | "underdog" | "ffc" | "consensus"
     teams: int = 12,
+    sources: tuple[str, ...] = SOURCES,
 ) -> pd.DataFrame:
-    if source == "fantasypros":
-        adp_raw = _load_fpros_csv()
-    elif source == "underdog":
-        adp_raw = _load_underdog_json()
-    elif source == "ffc":
-        adp_raw = _load_ffc_json(season, teams)
+    if source == CONSENSUS:
+        adp = _fetch_consensus(season, teams, sources)
     else:
-        raise ValueError("source must be 'fantasypros', 'underdog', or 'ffc'")
-
-    adp = _map_to_players(adp_raw, season)
+        adp = _map_to_players(_load_source(source, season, teams), season)
     adp["season"] = season
     adp["source"] = source
-    io.to_parquet(adp, "adp", partition_cols=["season", "source"])
+
+    # the adp table holds the latest board (the old one is restored if the
+    # write fails); history keeps one file per day
+    with io.replacing(
+        [io._DATA_ROOT / "adp" / f"season={season}" / f"source={source}"]
+    ):
+        io.to_parquet(adp, "adp", partition_cols=["season", "source"])
+    adp_history.snapshot_adp(adp, season, source)
     return adp
@@ -0,0 +1,232 @@
+# ffwb/ingest/adp_history.py
+"""
+Dated ADP snapshots and trend queries.
+
+Every `ingest_adp` call also stores that day's board as one small file:
+
+    data/adp_history/season=2024/source=ffc/date=2024-08-01/snapshot.parquet
+
+Rows are sorted by ADP and ADP is stored as int32 hundredths, so the
+column is monotone and DELTA_BINARY_PACKED shrinks it to a few bits per
+row; ids and positions are dictionary encoded.  A re-run on the same day
+replaces that day's file.  Queries list the `date=` directories first and
+open only the snapshots in the requested range.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import io
+
+_SCHEMA = pa.schema(
+    [
+        pa.field("player_id", pa.string()),
+        pa.field("position", pa.string()),
+        pa.field("adp_x100", pa.int32()),
+        pa.field("stdev_x100", pa.int32()),  # -1 = unknown
+    ]
+)
+
+
+def _source_dir(season: int, source: str) -> Path:
+    return io._DATA_ROOT / "adp_history" / f"season={season}" / f"source={source}"
+
+
+def _as_date(d: dt.date | str | None) -> dt.date:
+    if d is None:
+        return dt.date.today()
+    return d if isinstance(d, dt.date) else dt.date.fromisoformat(d)
+
+
+# --------------------------------------------------------------------------- #
+#  Write
+# --------------------------------------------------------------------------- #
+def snapshot_adp(
+    adp: pd.DataFrame,
+    season: int,
+    source: str,
+    *,
+    date: dt.date | str | None = None,
+) -> Path:
+    """Store `adp` (player_id, position, adp[, adp_stdev]) as one day's snapshot."""
+    day = _as_date(date)
+    df = adp.dropna(subset=["player_id", "adp"]).sort_values("adp", kind="mergesort")
+    sd = (
+        df["adp_stdev"].to_numpy(float)
+        if "adp_stdev" in df.columns
+        else np.full(len(df), np.nan)
+    )
+    table = pa.table(
+        {
+            "player_id": df["player_id"].astype(str).to_numpy(),
+            # unknown position → "" (astype(str) alone would store "nan")
+            "position": df["position"].fillna("").astype(str).to_numpy(),
+            "adp_x100": np.rint(df["adp"].to_numpy(float) * 100).astype(np.int32),
+            "stdev_x100": np.where(np.isnan(sd), -1, np.rint(sd * 100)).astype(
+                np.int32
+            ),
+        },
+        schema=_SCHEMA,
+    )
+
+    out_dir = _source_dir(season, source) / f"date={day.isoformat()}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / "snapshot.parquet"
+    tmp = out_dir / "snapshot.parquet.tmp"
+    pq.write_table(
+        table,
+        tmp,
+        use_dictionary=["player_id", "position"],
+        column_encoding={"adp_x100": "DELTA_BINARY_PACKED"},
+        compression="zstd",
+    )
+    tmp.replace(path)
+    return path
+
+
+# --------------------------------------------------------------------------- #
+#  Query
+# --------------------------------------------------------------------------- #
+def snapshot_dates(season: int, source: str) -> list[dt.date]:
+    """Sorted snapshot dates (directory listing only, nothing is read)."""
+    root = _source_dir(season, source)
+    if not root.exists():
+        return []
+    return sorted(
+        dt.date.fromisoformat(p.name.split("=", 1)[1])
+        for p in root.glob("date=*")
+        if (p / "snapshot.parquet").exists()
+    )
+
+
+def _read(
+    season: int,
+    source: str,
+    day: dt.date,
+    players: list[str] | None = None,
+) -> pd.DataFrame:
+    path = _source_dir(season, source) / f"date={day.isoformat()}" / "snapshot.parquet"
+    filters = [("player_id", "in", players)] if players else None
+    df = pq.read_table(path, filters=filters).to_pandas()
+    df["date"] = day
+    df["adp"] = df.pop("adp_x100") / 100.0
+    stdev = df.pop("stdev_x100")
+    df["adp_stdev"] = np.where(stdev >= 0, stdev / 100.0, np.nan)
+    return df
+
+
+def read_snapshots(
+    season: int,
+    source: str,
+    *,
+    start: dt.date | str | None = None,
+    end: dt.date | str | None = None,
+    players: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Long frame (date, player_id, position, adp, adp_stdev) for a date range."""
+    lo = _as_date(start) if start is not None else dt.date.min
+    hi = _as_date(end) if end is not None else dt.date.max
+    ids = list(players) if players is not None else None
+    days = [d for d in snapshot_dates(season, source) if lo <= d <= hi]
+    if not days:
+        return pd.DataFrame(
+            columns=["player_id", "position", "date", "adp", "adp_stdev"]
+        )
+    return pd.concat([_read(season, source, d, ids) for d in days], ignore_index=True)
+
+
+def _on_or_before(dates: list[dt.date], day: dt.date) -> dt.date | None:
+    i = np.searchsorted(
+        np.array(dates, dtype="datetime64[D]"), np.datetime64(day), "right"
+    )
+    return dates[i - 1] if i > 0 else None
+
+
+def adp_movers(
+    season: int,
+    source: str,
+    *,
+    days: int = 7,
+    as_of: dt.date | str | None = None,
+    top: int | None = None,
+) -> pd.DataFrame:
+    """
+    ADP change over the last `days` days: latest snapshot on/before `as_of`
+    vs the latest on/before `as_of - days` (only those two are read).
+    Positive `change` = rising (being drafted earlier).
+    """
+    dates = snapshot_dates(season, source)
+    now_day = _on_or_before(dates, _as_date(as_of))
+    then_day = (
+        _on_or_before(dates, now_day - dt.timedelta(days=days)) if now_day else None
+    )
+    if now_day is None or then_day is None:
+        raise FileNotFoundError(
+            f"Need ADP snapshots {days} days apart for {season}/{source}; "
+            f"have {[d.isoformat() for d in dates]}"
+        )
+
+    now = _read(season, source, now_day)
+    then = _read(season, source, then_day)[["player_id", "adp"]]
+    out = now.merge(then, on="player_id", how="inner", suffixes=("", "_then"))
+    out = out.rename(columns={"adp": "adp_now"})
+    out["change"] = out["adp_then"] - out["adp_now"]
+    out = out[["player_id", "position", "adp_then", "adp_now", "change"]]
+    out = out.sort_values("change", ascending=False, ignore_index=True)
+    out.attrs.update(then=then_day, now=now_day)
+    if top:
+        out = pd.concat([out.head(top), out.tail(top)]).drop_duplicates("player_id")
+    return out
+
+
+def adp_series(
+    players: Iterable[str],
+    season: int,
+    source: str,
+    *,
+    start: dt.date | str | None = None,
+    end: dt.date | str | None = None,
+) -> pd.DataFrame:
+    """(date × player_id) ADP time series for a few players."""
+    long = read_snapshots(season, source, start=start, end=end, players=players)
+    return long.pivot(index="date", columns="player_id", values="adp")
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def movers_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb adp-movers", description="Biggest ADP risers and fallers"
+    )
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--source", default="ffc")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    try:
+        movers = adp_movers(args.season, args.source, days=args.days, top=args.top)
+    except FileNotFoundError as e:
+        print(f"[red]{e}[/red]")
+        return
+
+    then, now = movers.attrs["then"], movers.attrs["now"]
+    table = Table(title=f"ADP movers {args.source} {then} → {now}")
+    for col in movers.columns:
+        table.add_column(col.replace("_", " ").title())
+    for row in movers.itertuples(index=False):
+        table.add_row(*(f"{x:.2f}" if isinstance(x, float) else str(x) for x in row))
+    print(table)
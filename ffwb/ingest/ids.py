@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import pandas as pd
-from nfl_data_py import import_seasonal_rosters
 
 
 def build_xwalk(season: int) -> pd.DataFrame:
@@ -12,6 +11,8 @@ def build_xwalk(season: int) -> pd.DataFrame:
 
     Handles both old and new nfl_data_py roster schemas.
     """
+    from nfl_data_py import import_seasonal_rosters  # heavy; load on first use
+
     roster = import_seasonal_rosters([season])
 
     # ---------- harmonise GSIS id ----------
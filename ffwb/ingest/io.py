@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Iterator
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
+from ffwb import metrics
+
 _DATA_ROOT = Path.cwd() / "data"
 
 # --------------------------------------------------------------------------- #
@@ -16,6 +23,7 @@ _DATA_ROOT = Path.cwd() / "data"
 # --------------------------------------------------------------------------- #
 DTYPE_MAP: Dict[str, pa.DataType] = {
     "player_id": pa.string(),
+    "player_key": pa.int32(),
     "league_id": pa.string(),
     "team_id": pa.string(),
     "season": pa.int16(),
@@ -25,6 +33,32 @@ DTYPE_MAP: Dict[str, pa.DataType] = {
 }
 
 
+# namespace of `player_id` per table (everything else holds Sleeper ids)
+ID_SOURCE: Dict[str, str] = {
+    "projection_weekly_tank01": "tank01",
+    "tank01_players": "tank01",
+}
+
+
+def _player_keys(table: str, ids, sleeper_ids=None) -> np.ndarray:
+    """Registry keys for `ids`, linking Tank-01 ids to Sleeper ids on the way."""
+    from . import registry
+
+    source = ID_SOURCE.get(table, "sleeper")
+    if source != "sleeper" and sleeper_ids is not None:
+        registry.link(ids, sleeper_ids, source)
+    return registry.keys_for(ids, source)
+
+
+def _with_player_key(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """Stamp the registry's int32 `player_key` next to string `player_id`."""
+    if "player_id" not in df.columns or "player_key" in df.columns:
+        return df
+    return df.assign(
+        player_key=_player_keys(table, df["player_id"], df.get("sleeper_id"))
+    )
+
+
 # --------------------------------------------------------------------------- #
 #  Helper
 # --------------------------------------------------------------------------- #
@@ -39,6 +73,7 @@ def to_parquet(
     Only columns present in DTYPE_MAP (plus partition_cols) get included.
     """
     partition_cols = partition_cols or []
+    df = _with_player_key(df, table)
 
     # ---------- Arrow schema (project dtypes + partitions) ----------
     selected_fields = {}
@@ -62,20 +97,144 @@ def to_parquet(
 
     schema = pa.schema(list(selected_fields.values())) if selected_fields else None
 
-    # ---------- write ----------
-    table_path = _DATA_ROOT / table
-    table_path.mkdir(parents=True, exist_ok=True)
-
     pa_table = (
         pa.Table.from_pandas(df, schema=schema, preserve_index=False)
         if schema is not None
         else pa.Table.from_pandas(df, preserve_index=False)
     )
+    return _write_dataset(pa_table, table, partition_cols)
 
-    pq.write_to_dataset(
-        pa_table,
-        root_path=str(table_path),
-        partition_cols=partition_cols,
-        compression="snappy",
-    )
+
+def write_table(
+    data: pa.Table | pa.RecordBatch,
+    table: str,
+    *,
+    partition_cols: list[str] | None = None,
+) -> Path:
+    """
+    Write Arrow data built by a columnar parser to `data/{table}/` as-is
+    (its schema is kept; `player_key` is stamped like `to_parquet`).
+    """
+    if isinstance(data, pa.RecordBatch):
+        data = pa.Table.from_batches([data])
+    names = data.column_names
+    if "player_id" in names and "player_key" not in names:
+        keys = _player_keys(
+            table,
+            data.column("player_id").to_numpy(zero_copy_only=False),
+            (
+                data.column("sleeper_id").to_numpy(zero_copy_only=False)
+                if "sleeper_id" in names
+                else None
+            ),
+        )
+        data = data.append_column(
+            pa.field("player_key", DTYPE_MAP["player_key"]),
+            pa.array(keys, type=DTYPE_MAP["player_key"]),
+        )
+    return _write_dataset(data, table, partition_cols or [])
+
+
+def _write_dataset(pa_table: pa.Table, table: str, partition_cols: list[str]) -> Path:
+    table_path = _DATA_ROOT / table
+    table_path.mkdir(parents=True, exist_ok=True)
+    with metrics.span("io.write", table=table) as sp:
+        written: list[str] = []
+        pq.write_to_dataset(
+            pa_table,
+            root_path=str(table_path),
+            partition_cols=partition_cols,
+            compression="snappy",
+            file_visitor=lambda f: written.append(f.path),
+        )
+        sp.set(
+            rows_out=pa_table.num_rows,
+            files=len(written),
+            bytes_written=sum(os.path.getsize(p) for p in written),
+        )
     return table_path
+
+
+def read_table(
+    table: str,
+    *,
+    season: int | None = None,
+    columns: list[str] | None = None,
+) -> pa.Table:
+    """
+    Read `data/{table}/` as an Arrow Table (no pandas conversion).
+    Hive partitions become columns; `season` is pushed down as a partition
+    filter and DTYPE_MAP columns are cast to their canonical types.
+    """
+    table_path = _DATA_ROOT / table
+    if not table_path.exists():
+        raise FileNotFoundError(f"No {table} table at {table_path}")
+    with metrics.span("io.read", table=table, season=season) as sp:
+        dataset = ds.dataset(table_path, format="parquet", partitioning="hive")
+        filt = ds.field("season") == season if season is not None else None
+        out = dataset.to_table(columns=columns, filter=filt)
+        files = [f.path for f in dataset.get_fragments(filter=filt)]
+        sp.set(
+            rows_out=out.num_rows,
+            files=len(files),
+            bytes_read=sum(os.path.getsize(p) for p in files),
+        )
+    for i, name in enumerate(out.column_names):
+        if name in DTYPE_MAP and out.schema.field(i).type != DTYPE_MAP[name]:
+            out = out.set_column(i, name, out.column(i).cast(DTYPE_MAP[name]))
+    return out
+
+
+# --------------------------------------------------------------------------- #
+#  Replacing partitions without a window of data loss
+# --------------------------------------------------------------------------- #
+# Old copies are parked under a "."-prefixed sibling name, which dataset
+# discovery (pyarrow, pandas) and `ffwb sql` skip.
+def _aside(path: Path) -> Path:
+    return path.with_name(f".{path.name}.prev.{os.getpid()}")
+
+
+def swap_dir(new: Path, target: Path) -> None:
+    """
+    Put directory `new` in place of `target` (same filesystem).  The old
+    `target` is deleted only once `new` has been renamed into place.
+    """
+    old = _aside(target)
+    shutil.rmtree(old, ignore_errors=True)
+    if target.exists():
+        target.rename(old)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        new.rename(target)
+    except BaseException:
+        if old.exists():
+            old.rename(target)
+        raise
+    shutil.rmtree(old, ignore_errors=True)
+
+
+@contextmanager
+def replacing(paths: Iterable[Path]) -> Iterator[None]:
+    """
+    Move existing `paths` aside while the block rewrites them from scratch.
+    On success the old copies are deleted; if the block raises, whatever
+    it wrote there is removed and the old copies are restored.
+    """
+    paths = list(paths)
+    moved: list[tuple[Path, Path]] = []
+    try:
+        for path in paths:
+            if path.exists():
+                old = _aside(path)
+                shutil.rmtree(old, ignore_errors=True)
+                path.rename(old)
+                moved.append((path, old))
+        yield
+    except BaseException:
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+        for path, old in moved:
+            old.rename(path)
+        raise
+    for _, old in moved:
+        shutil.rmtree(old, ignore_errors=True)
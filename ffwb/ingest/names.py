@@ -0,0 +1,223 @@
+# ffwb/ingest/names.py
+"""
+Player-name resolution for feeds that only carry a display name
+(ADP sources, user `--adp-file` uploads, Tank-01 rows without a Sleeper id).
+
+Names are normalized (case, accents, punctuation, Jr/III suffixes, common
+nicknames) and looked up exactly first, disambiguated by position/team
+when a name is shared.  Only the misses go to the fuzzy stage: character
+trigrams are held as an inverted index (postings per trigram), so scoring
+one query against the whole roster is one `np.bincount` over the postings
+of its trigrams, restricted to the same position (and team, if known).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SUFFIXES = ("jr", "sr", "ii", "iii", "iv", "v")
+
+# first-name variants → one canonical spelling (applied to both sides)
+NICKNAMES: dict[str, str] = {
+    "mike": "michael",
+    "mitch": "mitchell",
+    "matt": "matthew",
+    "chris": "christopher",
+    "josh": "joshua",
+    "joe": "joseph",
+    "gabe": "gabriel",
+    "dave": "david",
+    "tom": "thomas",
+    "nate": "nathaniel",
+    "nathan": "nathaniel",
+    "ken": "kenneth",
+    "kenny": "kenneth",
+    "rob": "robert",
+    "robbie": "robert",
+    "bob": "robert",
+    "will": "william",
+    "bill": "william",
+    "jon": "jonathan",
+    "zach": "zachary",
+    "zack": "zachary",
+    "alex": "alexander",
+    "tony": "anthony",
+    "hollywood": "marquise",
+}
+
+_SUFFIX_RE = re.compile(rf"\s+(?:{'|'.join(SUFFIXES)})$")
+_PUNCT_RE = re.compile(r"[.'’`,]")
+_SPACE_RE = re.compile(r"[\s\-]+")
+
+
+def normalize_names(names: pd.Series | list) -> pd.Series:
+    """Vectorized canonical name key ("D.J. Moore Jr." → "dj moore")."""
+    s = pd.Series(names, dtype="object").fillna("").astype(str)
+    s = (
+        s.str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace(_PUNCT_RE, "", regex=True)
+        .str.replace(_SPACE_RE, " ", regex=True)
+        .str.strip()
+        .str.replace(_SUFFIX_RE, "", regex=True)
+    )
+    first = s.str.split(" ", n=1)
+    head = first.str[0].map(lambda t: NICKNAMES.get(t, t))
+    tail = first.str[1].fillna("")
+    return (head + " " + tail).str.strip()
+
+
+def _norm_pos(pos: pd.Series | list | None, n: int) -> np.ndarray:
+    if pos is None:
+        return np.full(n, "", dtype=object)
+    # "WR12" (FantasyPros positional rank) → "WR"; DST/DEF unify
+    p = pd.Series(pos, dtype="object").fillna("").astype(str).str.upper()
+    p = p.str.replace(r"\d+$", "", regex=True).replace({"DST": "DEF", "D/ST": "DEF"})
+    return p.to_numpy(dtype=object)
+
+
+def _trigrams(key: str) -> list[str]:
+    padded = f"  {key} "
+    return [padded[i : i + 3] for i in range(len(padded) - 2)]
+
+
+class NameIndex:
+    """
+    Resolve free-text names to ids of one roster.
+
+    Parameters
+    ----------
+    roster : DataFrame
+        `id_col`, full_name and optionally position / team
+        (e.g. `ids.build_xwalk` or the `tank01_players` table).
+    """
+
+    def __init__(self, roster: pd.DataFrame, *, id_col: str = "sleeper_id") -> None:
+        roster = roster.dropna(subset=[id_col, "full_name"]).reset_index(drop=True)
+        self.ids = roster[id_col].astype(str).to_numpy()
+        self.keys = normalize_names(roster["full_name"]).to_numpy(dtype=object)
+        self.pos = _norm_pos(roster.get("position"), len(roster))
+        self.team = (
+            roster["team"].fillna("").astype(str).str.upper().to_numpy(dtype=object)
+            if "team" in roster.columns
+            else np.full(len(roster), "", dtype=object)
+        )
+
+        # exact lookups: unique names, then name|position for shared names
+        key_s = pd.Series(self.keys)
+        unique = ~key_s.duplicated(keep=False)
+        self._by_key = pd.Index(self.keys[unique.to_numpy()])
+        self._by_key_rows = np.flatnonzero(unique.to_numpy())
+        kp = key_s + "|" + self.pos
+        kp_unique = ~kp.duplicated(keep=False)
+        self._by_kp = pd.Index(kp[kp_unique].to_numpy())
+        self._by_kp_rows = np.flatnonzero(kp_unique.to_numpy())
+
+        # trigram inverted index (CSR: postings of trigram t = rows[ptr[t]:ptr[t+1]])
+        grams = [sorted(set(_trigrams(k))) for k in self.keys]
+        self._n_grams = np.array([len(g) for g in grams], dtype=np.float64)
+        flat = pd.Series([t for g in grams for t in g], dtype="object")
+        rows = np.repeat(np.arange(len(grams)), self._n_grams.astype(int))
+        codes, vocab = pd.factorize(flat)
+        self._vocab = pd.Index(vocab)
+        order = np.argsort(codes, kind="stable")
+        self._post_rows = rows[order]
+        self._post_ptr = np.searchsorted(codes[order], np.arange(len(vocab) + 1))
+
+    # ------------------------------------------------------------------ #
+    def _exact(self, keys: np.ndarray, pos: np.ndarray) -> np.ndarray:
+        row = np.full(len(keys), -1)
+        hit = self._by_kp.get_indexer(pd.Series(keys) + "|" + pos)
+        row[hit >= 0] = self._by_kp_rows[hit[hit >= 0]]
+        miss = row < 0
+        hit = self._by_key.get_indexer(keys[miss])
+        row[np.flatnonzero(miss)[hit >= 0]] = self._by_key_rows[hit[hit >= 0]]
+        return row
+
+    def _fuzzy(self, key: str, pos: str, team: str) -> tuple[int, float]:
+        grams = self._vocab.get_indexer(sorted(set(_trigrams(key))))
+        grams = grams[grams >= 0]
+        if not len(grams):
+            return -1, 0.0
+        post = np.concatenate(
+            [self._post_rows[self._post_ptr[g] : self._post_ptr[g + 1]] for g in grams]
+        )
+        shared = np.bincount(post, minlength=len(self.keys)).astype(np.float64)
+        n_query = len(set(_trigrams(key)))
+        score = 2.0 * shared / (n_query + self._n_grams)  # Dice coefficient
+        if pos:
+            score[(self.pos != pos) & (self.pos != "")] = 0.0
+        if team:
+            score[(self.team != team) & (self.team != "")] = 0.0
+        best = int(np.argmax(score))
+        top = score == score[best]
+        if score[best] > 0 and len(set(self.ids[top])) > 1:
+            return -1, float(score[best])  # homonyms the filters cannot split
+        return best, float(score[best])
+
+    def resolve(
+        self,
+        names: pd.Series | list,
+        positions: pd.Series | list | None = None,
+        teams: pd.Series | list | None = None,
+        *,
+        threshold: float = 0.6,
+    ) -> pd.DataFrame:
+        """
+        One row per input name: player_id (NaN when unresolved), score and
+        method ("exact", "fuzzy", "ambiguous" or "unmatched").  A name that
+        fits several players equally well (e.g. a shared name queried
+        without position or team) is "ambiguous" and left unresolved.
+        """
+        names = pd.Series(names, dtype="object").reset_index(drop=True)
+        keys = normalize_names(names).to_numpy(dtype=object)
+        pos = _norm_pos(positions, len(names))
+        team = (
+            pd.Series(teams, dtype="object").fillna("").astype(str).str.upper()
+            if teams is not None
+            else pd.Series("", index=names.index)
+        ).to_numpy(dtype=object)
+
+        row = self._exact(keys, pos)
+        score = np.where(row >= 0, 1.0, 0.0)
+        method = np.where(row >= 0, "exact", "unmatched").astype(object)
+        for i in np.flatnonzero(row < 0):
+            best, s = self._fuzzy(keys[i], pos[i], team[i])
+            if s >= threshold:
+                row[i], score[i] = best, s
+                method[i] = "fuzzy" if best >= 0 else "ambiguous"
+
+        out = pd.DataFrame(
+            {
+                "name": names,
+                "player_id": np.where(row >= 0, self.ids[np.maximum(row, 0)], None),
+                "score": score,
+                "method": method,
+            }
+        )
+        unmatched = out.loc[out["player_id"].isna(), "name"]
+        if len(unmatched):
+            logger.warning(
+                "NameIndex: %d of %d names unmatched or ambiguous → %s",
+                len(unmatched),
+                len(out),
+                ", ".join(map(str, unmatched.head(20))),
+            )
+        return out
+
+
+@lru_cache(maxsize=8)
+def season_index(season: int) -> NameIndex:
+    """NameIndex over the season's crosswalk (built once per process)."""
+    from .ids import build_xwalk
+
+    return NameIndex(build_xwalk(season))
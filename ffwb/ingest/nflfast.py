@@ -1,13 +1,18 @@
 # ffwb/ingest/nflfast.py
 from __future__ import annotations
 
+import logging
 from typing import List
 
 import pandas as pd
 
+from ffwb import metrics
+
 from ._nfl_compat import import_weekly_data
 from . import ids, io
 
+logger = logging.getLogger(__name__)
+
 # ---------------------- canonical scoring columns ---------------------------
 STAT_COLS: List[str] = [
     "pass_yds",
@@ -36,11 +41,23 @@ _ALIAS_MAP = {
 
 
 # --------------------------------------------------------------------------- #
+def normalize_gsis(s: pd.Series) -> pd.Series:
+    """Strip dashes and leading zeros so raw IDs match roster xwalk."""
+    return (
+        s.astype("string").str.replace("-", "", regex=True).str.lstrip("0").str.strip()
+    )
+
+
+# --------------------------------------------------------------------------- #
+@metrics.timed("ingest.actual_weekly")
 def ingest_actual_weekly(season: int, weeks: list[int] | None = None) -> pd.DataFrame:
     if weeks is None:
         weeks = list(range(1, 19))
 
-    raw = import_weekly_data([season]).query("week in @weeks").reset_index(drop=True)
+    with metrics.span("ingest.nflverse_weekly", season=season) as sp:
+        raw = import_weekly_data([season])
+        raw = raw.query("week in @weeks").reset_index(drop=True)
+        sp.set(rows_out=len(raw))
 
     # --- normalize GSIS id (code unchanged) ---
     id_variants = ("gsis_id", "gsis_it_id", "player_id")
@@ -62,26 +79,22 @@ def ingest_actual_weekly(season: int, weeks: list[int] | None = None) -> pd.Data
     # ------------------- x-walk and export -----------------------------------
     xwalk = ids.build_xwalk(season)
 
-    # ─── DEBUG & NORMALIZE GSIS IDs ─────────────────────────────────────────
-    # Strip dashes and leading zeros so raw IDs match roster xwalk
-    def normalize(s):
-        return (
-            s.astype("string")
-            .str.replace("-", "", regex=True)
-            .str.lstrip("0")
-            .str.strip()
+    # ─── NORMALIZE GSIS IDs ─────────────────────────────────────────────────
+    raw["gsis_id"] = normalize_gsis(raw["gsis_id"])
+    xwalk["gsis_id"] = normalize_gsis(xwalk["gsis_id"])
+
+    with metrics.span("ingest.xwalk_merge", rows_in=len(raw)) as sp:
+        merged = raw.merge(xwalk, on="gsis_id", how="left")
+        unmatched = merged["sleeper_id"].isna()
+        sp.set(rows_out=len(merged), unmatched=int(unmatched.sum()))
+    if unmatched.any():
+        logger.debug(
+            "actual_weekly %s: %d rows without a Sleeper id, e.g. %s",
+            season,
+            unmatched.sum(),
+            ", ".join(merged.loc[unmatched, "gsis_id"].dropna().unique()[:10]),
         )
 
-    raw["gsis_id"] = normalize(raw["gsis_id"])
-    xwalk["gsis_id"] = normalize(xwalk["gsis_id"])
-
-    print("WEEKLY gsis_id sample:", raw["gsis_id"].drop_duplicates().head(10))
-    print("ROSTER  gsis_id sample:", xwalk["gsis_id"].drop_duplicates().head(10))
-    common = set(raw["gsis_id"].dropna()) & set(xwalk["gsis_id"].dropna())
-    print("Common GSIS IDs:", len(common))
-
-    merged = raw.merge(xwalk, on="gsis_id", how="left")
-
     df = (
         merged[["sleeper_id", "season", "week", *STAT_COLS]]
         .rename(columns={"sleeper_id": "player_id"})
@@ -0,0 +1,280 @@
+# ffwb/ingest/pbp.py
+"""
+Play-by-play derived stats (first downs, red-zone usage, big plays and
+long touchdowns).
+
+A season's nflverse pbp parquet (~50 MB, ~370 columns) is downloaded once
+to `data/_cache/pbp/` and then streamed in row batches with only the
+columns we need, so peak memory is one batch plus the per-player-week
+accumulator, independent of how many seasons are processed.  The
+aggregated columns (`PBP_STAT_COLS`) are merged into `actual_weekly` next
+to the canonical `STAT_COLS` and can be referenced by scoring rules.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import requests
+
+from . import io
+
+PBP_URL = (
+    "https://github.com/nflverse/nflverse-data/releases/download/pbp/"
+    "play_by_play_{season}.parquet"
+)
+
+BATCH_ROWS = 16_384
+BIG_PLAY_YDS = 40
+LONG_TD_YDS = (40, 50)  # `*_td_40` counts every TD of 40+ yards, incl. 50+
+RED_ZONE_YDS = 20
+
+PBP_COLUMNS = [
+    "season_type",
+    "week",
+    "yardline_100",
+    "passer_player_id",
+    "rusher_player_id",
+    "receiver_player_id",
+    "pass_attempt",
+    "rush_attempt",
+    "complete_pass",
+    "first_down_pass",
+    "first_down_rush",
+    "passing_yards",
+    "rushing_yards",
+    "receiving_yards",
+    "pass_touchdown",
+    "rush_touchdown",
+]
+
+# custom per-player-week stats, canonical naming like nflfast.STAT_COLS
+PBP_STAT_COLS = [
+    "pass_fd",
+    "pass_40",
+    "pass_td_40",
+    "pass_td_50",
+    "rush_fd",
+    "rush_rz_att",
+    "rush_40",
+    "rush_td_40",
+    "rush_td_50",
+    "rec_fd",
+    "rec_rz_tgt",
+    "rec_40",
+    "rec_td_40",
+    "rec_td_50",
+]
+
+
+# --------------------------------------------------------------------------- #
+#  Download
+# --------------------------------------------------------------------------- #
+def pbp_path(season: int) -> Path:
+    return io._DATA_ROOT / "_cache" / "pbp" / f"play_by_play_{season}.parquet"
+
+
+def download_pbp(season: int, *, force: bool = False) -> Path:
+    """Fetch a season's pbp parquet to the local cache (streamed to disk)."""
+    path = pbp_path(season)
+    if path.exists() and not force:
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".part")
+    with requests.get(PBP_URL.format(season=season), stream=True, timeout=30) as resp:
+        resp.raise_for_status()
+        with tmp.open("wb") as fh:
+            for chunk in resp.iter_content(chunk_size=1 << 20):
+                fh.write(chunk)
+    tmp.replace(path)
+    return path
+
+
+# --------------------------------------------------------------------------- #
+#  Streaming aggregation
+# --------------------------------------------------------------------------- #
+def _flag(batch: pd.DataFrame, col: str) -> np.ndarray:
+    return batch[col].fillna(0).to_numpy(dtype=np.float64) > 0
+
+
+def _role_stats(batch: pd.DataFrame) -> list[tuple[str, dict[str, np.ndarray]]]:
+    """(player id column, {stat: per-play 0/1}) for each role on a play."""
+    yl = batch["yardline_100"].fillna(100).to_numpy(dtype=np.float64)
+    pass_yds = batch["passing_yards"].fillna(0).to_numpy(dtype=np.float64)
+    rush_yds = batch["rushing_yards"].fillna(0).to_numpy(dtype=np.float64)
+    rec_yds = batch["receiving_yards"].fillna(0).to_numpy(dtype=np.float64)
+    complete = _flag(batch, "complete_pass")
+    pass_fd = _flag(batch, "first_down_pass") & complete
+    red_zone = yl <= RED_ZONE_YDS
+    pass_td = _flag(batch, "pass_touchdown") & complete
+    rush_td = _flag(batch, "rush_touchdown")
+
+    def long_td(prefix: str, td: np.ndarray, yds: np.ndarray) -> dict:
+        return {f"{prefix}_td_{d}": td & (yds >= d) for d in LONG_TD_YDS}
+
+    return [
+        (
+            "passer_player_id",
+            {
+                "pass_fd": pass_fd,
+                "pass_40": pass_yds >= BIG_PLAY_YDS,
+                **long_td("pass", pass_td, pass_yds),
+            },
+        ),
+        (
+            "rusher_player_id",
+            {
+                "rush_fd": _flag(batch, "first_down_rush"),
+                "rush_rz_att": _flag(batch, "rush_attempt") & red_zone,
+                "rush_40": rush_yds >= BIG_PLAY_YDS,
+                **long_td("rush", rush_td, rush_yds),
+            },
+        ),
+        (
+            "receiver_player_id",
+            {
+                "rec_fd": pass_fd,
+                "rec_rz_tgt": _flag(batch, "pass_attempt") & red_zone,
+                "rec_40": rec_yds >= BIG_PLAY_YDS,
+                **long_td("rec", pass_td, rec_yds),
+            },
+        ),
+    ]
+
+
+def _aggregate_batch(batch: pd.DataFrame) -> pd.DataFrame:
+    """One batch of plays → (gsis_id, week) × PBP_STAT_COLS counts."""
+    parts = []
+    for id_col, stats in _role_stats(batch):
+        ids = batch[id_col]
+        has = ids.notna().to_numpy()
+        if not has.any():
+            continue
+        part = pd.DataFrame({k: v[has] for k, v in stats.items()}, dtype=np.int16)
+        part["gsis_id"] = ids.to_numpy()[has]
+        part["week"] = batch["week"].to_numpy()[has]
+        parts.append(part)
+    if not parts:
+        return pd.DataFrame(columns=["gsis_id", "week", *PBP_STAT_COLS])
+    long = pd.concat(parts, ignore_index=True).fillna(0)
+    return long.groupby(["gsis_id", "week"], sort=False).sum()
+
+
+def aggregate_pbp(
+    path: Path | str,
+    *,
+    batch_rows: int = BATCH_ROWS,
+    season_type: str = "REG",
+) -> pd.DataFrame:
+    """
+    Stream a pbp parquet and return per-(gsis_id, week) counts of
+    `PBP_STAT_COLS`.  Only `PBP_COLUMNS` are read, one row batch at a time.
+    """
+    pf = pq.ParquetFile(path)
+    columns = [c for c in PBP_COLUMNS if c in pf.schema_arrow.names]
+    acc: pd.DataFrame | None = None
+    for rb in pf.iter_batches(batch_size=batch_rows, columns=columns):
+        batch = rb.to_pandas()
+        for col in PBP_COLUMNS:
+            if col not in batch.columns:
+                batch[col] = np.nan
+        if season_type and "season_type" in columns:
+            batch = batch[batch["season_type"] == season_type]
+        if batch.empty:
+            continue
+        part = _aggregate_batch(batch)
+        acc = part if acc is None else acc.add(part, fill_value=0)
+
+    if acc is None:
+        return pd.DataFrame(columns=["gsis_id", "week", *PBP_STAT_COLS])
+    acc = acc.reindex(columns=PBP_STAT_COLS, fill_value=0)
+    out = acc.fillna(0).astype(np.int16).reset_index()
+    out["week"] = out["week"].astype("int8")
+    return out
+
+
+# --------------------------------------------------------------------------- #
+#  Merge into actual_weekly
+# --------------------------------------------------------------------------- #
+def merge_into_weekly(weekly: pd.DataFrame, stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace `PBP_STAT_COLS` on `weekly` (player_id, week, …) with `stats`
+    (player_id, week, …); player-weeks without plays get 0.
+    """
+    weekly = weekly.drop(columns=[c for c in PBP_STAT_COLS if c in weekly.columns])
+    weekly = weekly.astype({"week": "int8"})
+    out = weekly.merge(stats, on=["player_id", "week"], how="left")
+    out[PBP_STAT_COLS] = out[PBP_STAT_COLS].fillna(0).astype(np.int16)
+    return out
+
+
+def ingest_pbp_stats(season: int, *, batch_rows: int = BATCH_ROWS) -> pd.DataFrame:
+    """
+    Download + stream one season's pbp and merge the custom stats into
+    `actual_weekly/season=` (which must already exist).
+    """
+    from .ids import build_xwalk
+    from .nflfast import normalize_gsis
+
+    weekly_path = io._DATA_ROOT / "actual_weekly" / f"season={season}"
+    if not weekly_path.exists():
+        raise FileNotFoundError(
+            f"No weekly stats at {weekly_path} – ingest actual_weekly first"
+        )
+
+    agg = aggregate_pbp(download_pbp(season), batch_rows=batch_rows)
+    xwalk = build_xwalk(season)[["gsis_id", "sleeper_id"]]
+    agg["gsis_id"] = normalize_gsis(agg["gsis_id"])
+    xwalk["gsis_id"] = normalize_gsis(xwalk["gsis_id"])
+    stats = (
+        agg.merge(xwalk, on="gsis_id", how="inner")
+        .rename(columns={"sleeper_id": "player_id"})
+        .groupby(["player_id", "week"], as_index=False)[PBP_STAT_COLS]
+        .sum()
+    )
+
+    weekly = pd.read_parquet(weekly_path)
+    weekly["season"] = season
+    df = merge_into_weekly(weekly, stats).astype({"season": "int16"})
+
+    # write next to the live partition, then swap: a failed write leaves
+    # the season's base stats untouched
+    staging = f"_staging/actual_weekly.{os.getpid()}"
+    try:
+        staged = io.to_parquet(df, staging, partition_cols=["season", "week"])
+        io.swap_dir(staged / f"season={season}", weekly_path)
+    finally:
+        shutil.rmtree(io._DATA_ROOT / staging, ignore_errors=True)
+    return df
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def pbp_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb pbp",
+        description="Merge play-by-play stats (first downs, red zone, big plays)",
+    )
+    parser.add_argument("--season", type=int, nargs="+", required=True)
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    args = parser.parse_args(argv)
+
+    from rich import print
+
+    for season in args.season:  # one season resident at a time
+        try:
+            df = ingest_pbp_stats(season, batch_rows=args.batch_rows)
+        except FileNotFoundError as e:
+            print(f"[red]{e}[/red]")
+            continue
+        print(
+            f"[green]actual_weekly {season}: merged {', '.join(PBP_STAT_COLS)} "
+            f"into {len(df)} rows[/green]"
+        )
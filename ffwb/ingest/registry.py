@@ -0,0 +1,225 @@
+# ffwb/ingest/registry.py
+"""
+Persistent player registry: stable int32 surrogate keys for string ids.
+
+    data/player_registry/registry.parquet
+        player_key int32 | source string | external_id string
+
+Sleeper ids and Tank-01 ids live in separate namespaces (`source`) but map
+to the same `player_key` once linked (Tank-01's roster carries the Sleeper
+id).  `io.to_parquet` stamps `player_key` next to `player_id` on every
+write, so joins between tables can be integer array lookups instead of
+string hash merges.
+
+Several processes write tables (separate `ffwb` runs, the runner, uvicorn
+workers), so key assignment is a read-modify-write under an exclusive
+`flock` on `registry.lock`, and the cached frame is reloaded whenever the
+file on disk is not the one it was read from.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import io
+
+SOURCES = ("sleeper", "tank01")
+NO_KEY = -1
+
+_SCHEMA = pa.schema(
+    [
+        pa.field("player_key", pa.int32()),
+        pa.field("source", pa.string()),
+        pa.field("external_id", pa.string()),
+    ]
+)
+
+_lock = threading.Lock()
+_cache: dict[str, object] = {"root": None, "stamp": None, "df": None, "index": {}}
+
+
+def _path() -> Path:
+    return io._DATA_ROOT / "player_registry" / "registry.parquet"
+
+
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@contextmanager
+def _exclusive() -> Iterator[None]:
+    """Cross-process lock for read-modify-write (caller holds `_lock`)."""
+    path = _path().with_suffix(".lock")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _load() -> pd.DataFrame:
+    """
+    Registry frame for the current data root, re-read when the file has
+    been replaced since it was cached (caller holds lock).
+    """
+    path = _path()
+    stamp = _stamp(path)
+    if _cache["root"] != io._DATA_ROOT or _cache["stamp"] != stamp:
+        df = (
+            pq.read_table(path).to_pandas()
+            if stamp is not None
+            else _SCHEMA.empty_table().to_pandas()
+        )
+        _cache.update(root=io._DATA_ROOT, stamp=stamp, df=df, index={})
+    return _cache["df"]  # type: ignore[return-value]
+
+
+def _index(source: str) -> tuple[pd.Index, np.ndarray]:
+    """(external_id index, keys) for one namespace (caller holds lock)."""
+    df = _load()
+    idx = _cache["index"]
+    if source not in idx:  # type: ignore[operator]
+        sub = df[df["source"] == source]
+        idx[source] = (  # type: ignore[index]
+            pd.Index(sub["external_id"].to_numpy()),
+            sub["player_key"].to_numpy(dtype=np.int32),
+        )
+    return idx[source]  # type: ignore[index]
+
+
+def _append(rows: pd.DataFrame) -> None:
+    """Add rows and persist atomically (caller holds `_lock` and `_exclusive`)."""
+    df = pd.concat([_load(), rows], ignore_index=True)
+    path = _path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    pq.write_table(pa.Table.from_pandas(df, schema=_SCHEMA, preserve_index=False), tmp)
+    tmp.replace(path)
+    _cache.update(stamp=_stamp(path), df=df, index={})
+
+
+def _next_key() -> int:
+    df = _load()  # fresh: only called under `_exclusive`
+    return int(df["player_key"].max()) + 1 if len(df) else 0
+
+
+# --------------------------------------------------------------------------- #
+#  Public API
+# --------------------------------------------------------------------------- #
+def keys_for(
+    ids: pd.Series | np.ndarray | list,
+    source: str = "sleeper",
+    *,
+    create: bool = True,
+) -> np.ndarray:
+    """
+    int32 keys for `ids` in namespace `source`.  Unseen ids get new keys
+    (persisted) unless `create=False`, in which case they map to -1.
+    """
+    if source not in SOURCES:
+        raise ValueError(f"source must be one of {SOURCES}")
+    ext = pd.Series(ids, dtype="object").fillna("").astype(str).to_numpy()
+    with _lock:
+        index, keys = _index(source)
+        pos = index.get_indexer(ext)
+        missing = (pos < 0) & (ext != "")
+        if create and missing.any():
+            with _exclusive():  # another process may have added some meanwhile
+                index, keys = _index(source)
+                pos = index.get_indexer(ext)
+                missing = (pos < 0) & (ext != "")
+                if missing.any():
+                    new_ids = pd.unique(ext[missing])
+                    start = _next_key()
+                    _append(
+                        pd.DataFrame(
+                            {
+                                "player_key": np.arange(
+                                    start, start + len(new_ids), dtype=np.int32
+                                ),
+                                "source": source,
+                                "external_id": new_ids,
+                            }
+                        )
+                    )
+                    index, keys = _index(source)
+                    pos = index.get_indexer(ext)
+        return np.where(pos >= 0, keys[np.maximum(pos, 0)], NO_KEY).astype(np.int32)
+
+
+def link(source_ids, sleeper_ids, source: str = "tank01") -> None:
+    """
+    Register `source_ids` under the same keys as the matching Sleeper ids
+    (pairs with an empty Sleeper id are registered on their own).
+    """
+    pairs = pd.DataFrame(
+        {
+            "ext": pd.Series(source_ids, dtype="object").fillna("").astype(str),
+            "sleeper": pd.Series(sleeper_ids, dtype="object").fillna("").astype(str),
+        }
+    )
+    pairs = pairs[pairs["ext"] != ""].drop_duplicates("ext")
+
+    has_sleeper = pairs["sleeper"] != ""
+    sleeper_keys = keys_for(pairs.loc[has_sleeper, "sleeper"], "sleeper")
+    with _lock, _exclusive():
+        index, _ = _index(source)
+        new = pairs.loc[has_sleeper, "ext"].to_numpy()
+        fresh = index.get_indexer(new) < 0
+        if fresh.any():
+            _append(
+                pd.DataFrame(
+                    {
+                        "player_key": sleeper_keys[fresh],
+                        "source": source,
+                        "external_id": new[fresh],
+                    }
+                )
+            )
+    keys_for(pairs.loc[~has_sleeper, "ext"], source)
+
+
+def attach_keys(
+    df: pd.DataFrame, source: str = "sleeper", *, id_col: str = "player_id"
+) -> pd.DataFrame:
+    """Return `df` with an int32 `player_key` column next to `id_col`."""
+    out = df.copy(deep=False)
+    out["player_key"] = keys_for(out[id_col], source)
+    return out
+
+
+def key_join(left: pd.DataFrame, right: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    """
+    Left join `cols` of `right` onto `left` by `player_key` as an integer
+    array lookup (first row per key in `right` wins; no fan-out).
+    """
+    right = right[right["player_key"] != NO_KEY].drop_duplicates("player_key")
+    pos = pd.Index(right["player_key"].to_numpy()).get_indexer(
+        left["player_key"].to_numpy()
+    )
+    out = left.copy(deep=False)
+    hit = pos >= 0
+    for col in cols:
+        vals = right[col].to_numpy()
+        taken = vals[np.maximum(pos, 0)] if len(vals) else np.full(len(pos), None)
+        out[col] = pd.Series(taken, index=left.index).where(hit)
+    return out
+
+
+def has_keys(*frames: pd.DataFrame) -> bool:
+    return all("player_key" in f.columns for f in frames)
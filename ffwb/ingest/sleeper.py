@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 # import os
+import json
+
 import requests
 import pandas as pd
 from typing import TypedDict
@@ -37,7 +39,7 @@ def ingest_league(league_id: str) -> pd.DataFrame:
                 "league_id": raw["league_id"],
                 "season": int(raw["season"]),
                 "host": "sleeper",
-                "scoring_json": raw["scoring_settings"],
+                "scoring_json": json.dumps(raw["scoring_settings"]),
             }
         ]
     )
@@ -1,74 +1,271 @@
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import Dict, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
 import json
 import logging
+from functools import lru_cache
+
 from ffwb.ingest import io as io_utils
-from dotenv import load_dotenv
 
-load_dotenv()
+HOST = "tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com"
+URL = f"https://{HOST}/getNFLProjections"
 
-URL = (
-    "https://tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com/"
-    "getNFLProjections"
-)
+TABLE = "projection_weekly_tank01"
+REGULAR_WEEKS = list(range(1, 19))
+RATE_LIMIT = 5.0  # requests / second (RapidAPI plan limit)
 
-HEADERS = {
-    "x-rapidapi-host": "tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com",
-    "x-rapidapi-key": os.getenv("RAPIDAPI_TANK01_KEY", ""),
+# default = half-PPR
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "pointsPerReception": 0.5,
+    "passYards": 0.04,
+    "passTD": 4,
+    "passInterceptions": -2,
+    "rushYards": 0.1,
+    "rushTD": 6,
+    "receivingYards": 0.1,
+    "receivingTD": 6,
+    "fumbles": -2,
 }
 
-KEEP = ["player_id", "season", "week", "position", "fantasy_pts", "full_name", "team"]
+KEEP = [
+    "player_id",
+    "sleeper_id",
+    "season",
+    "week",
+    "position",
+    "fantasy_pts",
+    "full_name",
+    "team",
+]
 
 
 # --------------------------------------------------------------------------- #
 # helpers
 # --------------------------------------------------------------------------- #
-def _request(week: int, season: int, weights: Dict[str, str]) -> List[dict]:
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Read .env once, on the first API call rather than at import."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _headers() -> Dict[str, str]:
+    _load_env()
+    return {
+        "x-rapidapi-host": HOST,
+        "x-rapidapi-key": os.getenv("RAPIDAPI_TANK01_KEY", ""),
+    }
+
+
+def _loads(content: bytes):
+    """orjson when installed (the `fast` extra), else the stdlib parser."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(content)
+    return orjson.loads(content)
+
+
+# payload section / key → canonical column (nflfast.STAT_COLS naming)
+STAT_FIELDS: Dict[str, tuple[str, str]] = {
+    "pass_yds": ("Passing", "passYds"),
+    "pass_tds": ("Passing", "passTD"),
+    "pass_ints": ("Passing", "int"),
+    "rush_yds": ("Rushing", "rushYds"),
+    "rush_tds": ("Rushing", "rushTD"),
+    "rec_rec": ("Receiving", "receptions"),
+    "rec_yds": ("Receiving", "recYds"),
+    "rec_tds": ("Receiving", "recTD"),
+    "rec_targets": ("Receiving", "targets"),
+}
+
+PROJ_SCHEMA = pa.schema(
+    [
+        pa.field("player_id", pa.string()),
+        pa.field("sleeper_id", pa.string()),
+        pa.field("full_name", pa.string()),
+        pa.field("position", pa.string()),
+        pa.field("fantasy_pts", pa.float32()),
+        *(pa.field(c, pa.float32()) for c in STAT_FIELDS),
+        pa.field("fumbles_lost", pa.float32()),
+    ]
+)
+
+_EMPTY: dict = {}
+
+
+def _num(values: list) -> pa.Array:
+    """Payload numbers arrive as strings ("254.3", "") → float32, blanks → 0."""
+    arr = pa.array(
+        [None if v in ("", None) else str(v) for v in values], type=pa.string()
+    )
+    return pc.fill_null(arr.cast(pa.float32()), 0.0)
+
+
+def _parse_projections(pp: list[dict], scoring: str = "PPR") -> pa.RecordBatch:
+    """
+    Gather `playerProjections` values column by column into one
+    RecordBatch with `PROJ_SCHEMA` (no per-player row dicts).
+    """
+    sections = {
+        sec: [p.get(sec) or _EMPTY for p in pp]
+        for sec in ("Passing", "Rushing", "Receiving")
+    }
+    points = [p.get("fantasyPointsDefault") or _EMPTY for p in pp]
+    columns = {
+        "player_id": pa.array([str(p.get("playerID")) for p in pp], pa.string()),
+        "sleeper_id": pa.array(
+            [p.get("sleeperBotID") or None for p in pp], pa.string()
+        ),
+        "full_name": pa.array([p.get("longName") for p in pp], pa.string()),
+        "position": pc.utf8_upper(pa.array([p.get("pos") for p in pp], pa.string())),
+        "fantasy_pts": _num([d.get(scoring) for d in points]),
+        **{
+            col: _num([d.get(key) for d in sections[sec]])
+            for col, (sec, key) in STAT_FIELDS.items()
+        },
+        "fumbles_lost": _num([p.get("fumblesLost") for p in pp]),
+    }
+    return pa.RecordBatch.from_arrays(list(columns.values()), schema=PROJ_SCHEMA)
+
+
+def _request(week: int, season: int, weights: Dict[str, str]) -> pa.RecordBatch:
     params = {"week": week, "archiveSeason": season, **weights}
-    resp = requests.get(URL, headers=HEADERS, params=params, timeout=15)
+    resp = requests.get(URL, headers=_headers(), params=params, timeout=15)
     resp.raise_for_status()
-    data = resp.json()
+    data = _loads(resp.content)
 
     try:
         pp = data["body"]["playerProjections"]
     except (KeyError, TypeError):
 
-        logging.warning("Tank-01 unexpected response: %s", json.dumps(data)[:400])
+        logging.warning("Tank-01 unexpected response: %s", resp.text[:400])
         raise RuntimeError("Tank-01 response missing 'body→playerProjections'")
 
-    rows: list[dict] = []
-    for proj in pp.values():  # keys are Tank IDs – use sleeperBotID inside
-        rows.append(
-            {
-                "player_id": str(proj.get("playerID")),
-                "position": proj.get("pos"),
-                "fantasy_pts": float(
-                    proj.get("fantasyPointsDefault", {}).get("PPR", 0)
-                ),
-                # flatten sub-dicts
-                **{
-                    f"pass_{k.lower()}": float(v)
-                    for k, v in proj.get("Passing", {}).items()
-                },
-                **{
-                    f"rush_{k.lower()}": float(v)
-                    for k, v in proj.get("Rushing", {}).items()
-                },
-                **{
-                    f"rec_{k.lower()}": float(v)
-                    for k, v in proj.get("Receiving", {}).items()
-                },
-                "fumbles_lost": float(proj.get("fumblesLost", 0)),
-                "full_name": str(proj.get("longName")),
-            }
-        )
-
-    return rows
+    # keys are Tank IDs – sleeperBotID inside links them to Sleeper
+    return _parse_projections(list(pp.values()))
+
+
+# --------------------------------------------------------------------------- #
+# rate limiting + stored-week manifest
+# --------------------------------------------------------------------------- #
+class RateLimiter:
+    """Thread-safe token bucket: at most `rate` calls/second, bursts of `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def scoring_hash(weights: Dict[str, float]) -> str:
+    return hashlib.sha1(json.dumps(weights, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def _table_dir() -> Path:
+    return io_utils._DATA_ROOT / TABLE
+
+
+def _manifest_path() -> Path:
+    return _table_dir() / "_manifest.json"
+
+
+def _load_manifest() -> Dict[str, str]:
+    path = _manifest_path()
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _save_manifest(manifest: Dict[str, str]) -> None:
+    path = _manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    tmp.replace(path)
+
+
+def _week_key(season: int, week: int) -> str:
+    return f"{season}/{week}"
+
+
+def _fetch_week(
+    season: int,
+    week: int,
+    weights: Dict[str, float],
+    limiter: RateLimiter | None = None,
+    retries: int = 3,
+) -> pa.Table:
+    """One week's projections with season/week columns (retries on HTTP 429)."""
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            batch = _request(week, season, weights)
+            break
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else None
+            if status != 429 or attempt == retries:
+                raise
+            time.sleep(2**attempt)
+    n = batch.num_rows
+    table = pa.Table.from_batches([batch])
+    table = table.append_column(
+        pa.field("season", pa.int16()), pa.array(np.full(n, season), pa.int16())
+    )
+    return table.append_column(
+        pa.field("week", pa.int8()), pa.array(np.full(n, week), pa.int8())
+    )
+
+
+def _replace_weeks(tables: list[pa.Table], weeks: list[tuple[int, int]], h: str):
+    """
+    Replace the week partitions with `tables` (one write) and record the
+    hash.  Old weeks are kept aside until the write succeeds and restored
+    if it fails; the manifest lists the weeks only once they are stored.
+    """
+    manifest = _load_manifest()
+    keys = {_week_key(s, w) for s, w in weeks}
+    # a crash mid-swap must not leave these weeks marked as stored
+    _save_manifest({k: v for k, v in manifest.items() if k not in keys})
+    paths = [_table_dir() / f"season={s}" / f"week={w}" for s, w in weeks]
+    try:
+        with io_utils.replacing(paths):
+            io_utils.write_table(
+                pa.concat_tables(tables), TABLE, partition_cols=["season", "week"]
+            )
+    except BaseException:
+        _save_manifest(manifest)  # old partitions are back in place
+        raise
+    manifest.update(dict.fromkeys(keys, h))
+    _save_manifest(manifest)
 
 
 # --------------------------------------------------------------------------- #
@@ -84,38 +281,65 @@ def ingest_tank01(
     Fetch Tank-01 projections for one week, map to Sleeper IDs, store Parquet,
     and return a tidy DataFrame.
     """
-    if not HEADERS["x-rapidapi-key"]:
+    if not _headers()["x-rapidapi-key"]:
         raise RuntimeError("Set RAPIDAPI_TANK01_KEY env var with your RapidAPI key")
 
-    # default = half-PPR
-    weights = scoring_weights or {
-        "pointsPerReception": 0.5,
-        "passYards": 0.04,
-        "passTD": 4,
-        "passInterceptions": -2,
-        "rushYards": 0.1,
-        "rushTD": 6,
-        "receivingYards": 0.1,
-        "receivingTD": 6,
-        "fumbles": -2,
-    }
+    weights = scoring_weights or DEFAULT_WEIGHTS
+    table = _fetch_week(season, week, weights)
+    _replace_weeks([table], [(season, week)], scoring_hash(weights))
+    proj = table.to_pandas()
+    return proj[[c for c in KEEP if c in proj.columns]]
+
+
+def backfill_tank01(
+    seasons: list[int],
+    weeks: list[int] | None = None,
+    *,
+    scoring_weights: Dict[str, float] | None = None,
+    jobs: int = 6,
+    rate: float = RATE_LIMIT,
+    force: bool = False,
+) -> pd.DataFrame:
+    """
+    Fetch many (season, week) projections concurrently under `rate`
+    requests/second, skipping weeks already stored with the same scoring
+    weights (unless `force`), and write everything in one dataset write.
+
+    Returns one status row per (season, week): fetched / skipped / failed.
+    """
+    if not _headers()["x-rapidapi-key"]:
+        raise RuntimeError("Set RAPIDAPI_TANK01_KEY env var with your RapidAPI key")
 
-    rows = _request(week, season, weights)
-    df = pd.json_normalize(rows)
+    weights = scoring_weights or DEFAULT_WEIGHTS
+    h = scoring_hash(weights)
+    manifest = _load_manifest()
+    wanted = [(s, w) for s in seasons for w in (weeks or REGULAR_WEEKS)]
+    todo = [sw for sw in wanted if force or manifest.get(_week_key(*sw)) != h]
 
-    df["season"] = season
-    df["week"] = week
-    df["position"] = df["position"].str.upper()
+    limiter = RateLimiter(rate, burst=max(1, int(rate)))
+    status = {sw: ("skipped", None, None) for sw in wanted if sw not in todo}
+    tables: list[pa.Table] = []
+    done: list[tuple[int, int]] = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_fetch_week, s, w, weights, limiter): (s, w) for s, w in todo
+        }
+        for fut in as_completed(futures):
+            sw = futures[fut]
+            try:
+                table = fut.result()
+            except (requests.RequestException, RuntimeError) as exc:
+                logging.warning("Tank-01 %s week %s failed: %s", *sw, exc)
+                status[sw] = ("failed", 0, str(exc))
+                continue
+            tables.append(table)
+            done.append(sw)
+            status[sw] = ("fetched", table.num_rows, None)
 
-    # ------------------------------------------------------------------ #
-    # attach names & teams from cached roster
-    # ------------------------------------------------------------------ #
+    if tables:
+        _replace_weeks(tables, done, h)
 
-    # ------------------------------------------------------------------ #
-    # final tidy frame
-    # ------------------------------------------------------------------ #
-    proj = df[[c for c in KEEP if c in df.columns]].copy()
-    io_utils.to_parquet(
-        proj, "projection_weekly_tank01", partition_cols=["season", "week"]
+    return pd.DataFrame(
+        [(s, w, *status[(s, w)]) for s, w in wanted],
+        columns=["season", "week", "status", "rows", "error"],
     )
-    return proj
@@ -1,19 +1,13 @@
 from __future__ import annotations
 
-import os
 from typing import List, Dict
 
 import pandas as pd
 import requests
-from dotenv import load_dotenv
 from ffwb.ingest import io as io_utils
+from ffwb.ingest.tank01 import HOST, _headers
 
-load_dotenv()
-
-_URL = (
-    "https://tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com/"
-    "getNFLTeamRoster?teamAbv="
-)
+_URL = f"https://{HOST}/getNFLTeamRoster?teamAbv="
 _TEAMS = [
     "BUF",
     "MIA",
@@ -49,24 +43,36 @@ _TEAMS = [
     "SF",
 ]
 
-_HEADERS: Dict[str, str] = {
-    "x-rapidapi-host": "tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com",
-    "x-rapidapi-key": os.getenv("RAPIDAPI_TANK01_KEY", ""),
-}
+_KEEP = ["player_id", "sleeper_id", "full_name", "pos", "team"]
+
 
-_KEEP = ["player_id", "full_name", "pos", "team", "tank_id"]
+def _fill_sleeper_ids(df: pd.DataFrame, season: int) -> pd.DataFrame:
+    """Resolve missing `sleeperBotID`s by name within position."""
+    from ffwb.ingest.names import season_index
 
+    missing = df["sleeper_id"] == ""
+    if missing.any():
+        hits = season_index(season).resolve(
+            df.loc[missing, "full_name"], df.loc[missing, "pos"]
+        )
+        df.loc[missing, "sleeper_id"] = hits["player_id"].fillna("").to_numpy()
+    return df
 
-def ingest_player_list() -> pd.DataFrame:
-    """Pull every team roster from Tank-01, cache to Parquet, and return DF."""
-    if not _HEADERS["x-rapidapi-key"]:
+
+def ingest_player_list(season: int | None = None) -> pd.DataFrame:
+    """
+    Pull every team roster from Tank-01, cache to Parquet, and return DF.
+    With `season`, players Tank-01 has no Sleeper id for are matched by name.
+    """
+    headers = _headers()
+    if not headers["x-rapidapi-key"]:
         raise RuntimeError("Set RAPIDAPI_TANK01_KEY env var")
 
     rows: List[Dict] = []
 
     for team in _TEAMS:
         url = f"{_URL}{team}&getStats=true&fantasyPoints=true"
-        resp = requests.get(url, headers=_HEADERS, timeout=15)
+        resp = requests.get(url, headers=headers, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -89,5 +95,8 @@ def ingest_player_list() -> pd.DataFrame:
         .reset_index(drop=True)
     )
 
+    if season is not None:
+        df = _fill_sleeper_ids(df, season)
+
     io_utils.to_parquet(df, "tank01_players")  # data/tank01_players/*.parquet
     return df
@@ -0,0 +1,210 @@
+# ffwb/lineup.py
+"""
+Batched start/sit lineup optimiser.
+
+Slot eligibility in a QB/RB/WR/TE/FLEX/SUPERFLEX lineup is *nested*
+(each position ⊂ FLEX ⊂ SUPERFLEX, QB ⊂ SUPERFLEX), so the assignment
+problem has an exact solution by filling the narrowest slots first: the
+top-k players at each position take the dedicated slots, the best remaining
+RB/WR/TE take FLEX, and the best remaining of everyone take SUPERFLEX.
+Any optimal lineup can be exchanged into this one without losing points,
+so no general-purpose matching solver is needed and the whole thing is a
+few masked top-k selections over a (teams × roster) array.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+# Default lineup (matches pipeline.ROSTER_SETTINGS + one FLEX)
+SLOTS: dict[str, int] = {"qb": 1, "rb": 2, "wr": 2, "te": 1, "flex": 1}
+
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+POS_CODE = {p: i for i, p in enumerate(POSITIONS)}
+FLEX_ELIGIBLE = ("RB", "WR", "TE")
+SUPERFLEX_ELIGIBLE = ("QB", "RB", "WR", "TE")
+
+BENCH = -1
+
+
+def slot_names(slots: dict[str, int]) -> list[str]:
+    """Slot labels in kernel order; index into this with `slot_of` codes."""
+    dedicated = [p for p in POSITIONS if slots.get(p.lower(), 0)]
+    flex = [s.upper() for s in ("flex", "superflex") if slots.get(s, 0)]
+    return dedicated + flex
+
+
+def position_codes(positions: Sequence[str] | pd.Series) -> np.ndarray:
+    """Map position strings → int8 codes (unknown positions → -1)."""
+    s = pd.Series(positions, dtype="object").str.upper()
+    return s.map(POS_CODE).fillna(-1).to_numpy(dtype=np.int8)
+
+
+# --------------------------------------------------------------------------- #
+#  Array kernel
+# --------------------------------------------------------------------------- #
+def _take_top(
+    key: np.ndarray, k: int, assigned: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pick the k largest finite entries of each row of `key` (B, N)."""
+    n = key.shape[1]
+    k = min(k, n)
+    if k == 0:
+        return np.zeros(key.shape[0]), np.zeros((key.shape[0], 0), dtype=np.intp)
+    idx = (
+        np.argpartition(-key, k - 1, axis=1)[:, :k]
+        if k < n
+        else np.broadcast_to(np.arange(n), key.shape).copy()
+    )
+    vals = np.take_along_axis(key, idx, axis=1)
+    ok = np.isfinite(vals)
+    rows = np.broadcast_to(np.arange(key.shape[0])[:, None], idx.shape)
+    assigned[rows[ok], idx[ok]] = True
+    idx = np.where(ok, idx, -1)
+    return np.where(ok, vals, 0.0).sum(axis=1), idx
+
+
+def optimal_lineup(
+    points: np.ndarray,
+    pos: np.ndarray,
+    slots: dict[str, int] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Exact optimal lineup for every row of a batch.
+
+    Parameters
+    ----------
+    points : ndarray (..., N)
+        Projected points per roster spot; NaN marks an empty spot.
+    pos : ndarray (..., N) or (N,)
+        Position codes from `position_codes` (-1 = not startable).
+    slots : dict
+        {"qb": 1, "rb": 2, ..., "flex": 1, "superflex": 0}
+
+    Returns
+    -------
+    total : ndarray (...)
+        Points of the optimal lineup.
+    slot_of : ndarray (..., N) int8
+        Index into `slot_names(slots)` for starters, -1 for bench.
+    """
+    slots = SLOTS if slots is None else slots
+    points = np.asarray(points, dtype=np.float64)
+    lead, n = points.shape[:-1], points.shape[-1]
+    pts = points.reshape(-1, n)
+    codes = np.broadcast_to(np.asarray(pos), points.shape).reshape(-1, n)
+
+    pts = np.where(np.isnan(pts) | (codes < 0), -np.inf, pts)
+    assigned = np.zeros(pts.shape, dtype=bool)
+    slot_of = np.full(pts.shape, BENCH, dtype=np.int8)
+    total = np.zeros(pts.shape[0])
+    rows = np.arange(pts.shape[0])[:, None]
+
+    groups: list[tuple[int, np.ndarray]] = [
+        (slots[p.lower()], codes == POS_CODE[p])
+        for p in POSITIONS
+        if slots.get(p.lower(), 0)
+    ]
+    flex_mask = np.isin(codes, [POS_CODE[p] for p in FLEX_ELIGIBLE])
+    sflex_mask = np.isin(codes, [POS_CODE[p] for p in SUPERFLEX_ELIGIBLE])
+    if slots.get("flex", 0):
+        groups.append((slots["flex"], flex_mask))
+    if slots.get("superflex", 0):
+        groups.append((slots["superflex"], sflex_mask))
+
+    # narrowest eligibility first: dedicated → FLEX → SUPERFLEX
+    for code, (k, eligible) in enumerate(groups):
+        key = np.where(eligible & ~assigned, pts, -np.inf)
+        pts_sum, idx = _take_top(key, k, assigned)
+        total += pts_sum
+        hit = idx >= 0
+        slot_of[np.broadcast_to(rows, idx.shape)[hit], idx[hit]] = code
+
+    return total.reshape(lead), slot_of.reshape(points.shape)
+
+
+# --------------------------------------------------------------------------- #
+#  DataFrame API
+# --------------------------------------------------------------------------- #
+def explode_roster_weekly(roster: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sleeper `roster_weekly` (one row per roster with a `players` list) →
+    one row per (league_id, week, roster_id, player_id).
+    """
+    keep = [c for c in ("league_id", "week", "roster_id", "matchup_id") if c in roster]
+    out = roster[keep + ["players"]].explode("players", ignore_index=True)
+    return out.rename(columns={"players": "player_id"}).dropna(subset=["player_id"])
+
+
+def optimize_lineups(
+    rosters: pd.DataFrame,
+    projections: pd.DataFrame,
+    slots: dict[str, int] | None = None,
+    *,
+    team_cols: Sequence[str] = ("league_id", "roster_id"),
+    points_col: str = "fantasy_pts",
+) -> pd.DataFrame:
+    """
+    Optimal starters for every team in one vectorised call.
+
+    Parameters
+    ----------
+    rosters : DataFrame
+        Long format: `team_cols` + `player_id` (see `explode_roster_weekly`).
+    projections : DataFrame
+        `player_id`, `position`, `points_col`; ids must use the same scheme
+        as the rosters.  Rostered players without a projection score 0.
+    slots : dict, optional
+        Lineup slot counts, default `SLOTS`.
+
+    Returns
+    -------
+    DataFrame
+        One row per rostered player: team_cols, player_id, position,
+        `points_col`, `slot` ("QB", "FLEX", …, or "BN") and `starter`.
+    """
+    slots = SLOTS if slots is None else slots
+    team_cols = list(team_cols)
+
+    df = rosters[team_cols + ["player_id"]].merge(
+        projections[["player_id", "position", points_col]].drop_duplicates("player_id"),
+        on="player_id",
+        how="left",
+    )
+    df[points_col] = df[points_col].fillna(0.0)
+
+    team = df.groupby(team_cols, sort=False).ngroup().to_numpy()
+    spot = df.groupby(team_cols, sort=False).cumcount().to_numpy()
+    n_teams = int(team.max()) + 1 if len(df) else 0
+    width = int(spot.max()) + 1 if len(df) else 0
+
+    pts = np.full((n_teams, width), np.nan)
+    pos = np.full((n_teams, width), -1, dtype=np.int8)
+    pts[team, spot] = df[points_col].to_numpy(dtype=np.float64)
+    pos[team, spot] = position_codes(df["position"])
+
+    _, slot_of = optimal_lineup(pts, pos, slots)
+
+    labels = np.array(slot_names(slots) + ["BN"], dtype=object)
+    codes = slot_of[team, spot]
+    df["slot"] = labels[np.where(codes >= 0, codes, len(labels) - 1)]
+    df["starter"] = codes >= 0
+    return df
+
+
+def lineup_totals(
+    lineups: pd.DataFrame,
+    *,
+    team_cols: Sequence[str] = ("league_id", "roster_id"),
+    points_col: str = "fantasy_pts",
+) -> pd.DataFrame:
+    """Sum starters' points per team from `optimize_lineups` output."""
+    return (
+        lineups[lineups["starter"]]
+        .groupby(list(team_cols), as_index=False)[points_col]
+        .sum()
+        .rename(columns={points_col: "lineup_pts"})
+    )
@@ -0,0 +1,280 @@
+# ffwb/metrics.py
+"""
+Lightweight spans for pipeline stages and I/O calls.
+
+    with metrics.span("calc_season", season=2024) as sp:
+        ...
+        sp.set(rows_in=len(weekly), rows_out=len(totals))
+
+Each finished span is one record: name, parent span, wall and CPU seconds,
+peak RSS, tracemalloc peak (only when tracing is on: `FFWB_TRACEMALLOC=1`
+or `configure(trace_memory=True)`), and whatever counters the code set
+(`rows_in`, `rows_out`, `bytes_read`, `bytes_written`, …).  Records go to
+an in-process ring buffer (served by the web app's `/metrics`) and, when
+logging is on, are appended to a file as JSON lines.  `ffwb` commands
+log to `data/_metrics/spans.jsonl`, rotated to `spans.jsonl.1` past
+`MAX_LOG_BYTES`; `ffwb metrics` summarises that file.
+
+tracemalloc is process-wide: it runs while any traced span is open, and
+concurrent spans (e.g. runner stages on worker threads) share one peak,
+measured from when the first of them started.
+
+Standard library only, so importing it costs nothing on the CLI fast path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+import functools
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+LOG_NAME = Path("_metrics") / "spans.jsonl"  # relative to the data root
+RING_SIZE = 2000
+MAX_LOG_BYTES = 8 * 2**20  # then rotate to spans.jsonl.1 (one old file kept)
+
+_lock = threading.Lock()
+_records: deque[dict] = deque(maxlen=RING_SIZE)
+_config: dict = {
+    "log": False,
+    "path": None,
+    "trace_memory": os.getenv("FFWB_TRACEMALLOC") == "1",
+}
+_current: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "ffwb_span", default=None
+)
+_tracing = {"spans": 0, "owned": False}  # open traced spans (under _lock)
+
+
+def configure(
+    *,
+    log: bool | None = None,
+    path: Path | str | None = None,
+    trace_memory: bool | None = None,
+) -> None:
+    """
+    `log=True` appends records to `path` (default `data/_metrics/spans.jsonl`,
+    resolved when written); `trace_memory` toggles tracemalloc peaks.
+    """
+    with _lock:
+        if log is not None:
+            _config["log"] = log
+        if path is not None:
+            _config["path"] = Path(path)
+        if trace_memory is not None:
+            _config["trace_memory"] = trace_memory
+
+
+def default_log_path() -> Path:
+    from ffwb.ingest import io
+
+    return io._DATA_ROOT / LOG_NAME
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+class Span:
+    """Counters for one timed block; set values with `set` or `add`."""
+
+    def __init__(self, name: str, attrs: dict) -> None:
+        self.name = name
+        self.values: dict = dict(attrs)
+
+    def set(self, **values) -> None:
+        self.values.update(values)
+
+    def add(self, **values) -> None:
+        for k, v in values.items():
+            self.values[k] = self.values.get(k, 0) + v
+
+
+def _emit(record: dict) -> None:
+    with _lock:
+        _records.append(record)
+        if not _config["log"]:
+            return
+        path = _config["path"] or default_log_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size >= MAX_LOG_BYTES:
+            os.replace(path, path.with_name(path.name + ".1"))
+        with open(path, "a") as fh:
+            fh.write(json.dumps(record, default=str) + "\n")
+
+
+def _trace_enter() -> None:
+    """Start (or join) process-wide tracing; the first open span resets the peak."""
+    with _lock:
+        if _tracing["spans"] == 0:
+            if tracemalloc.is_tracing():  # someone else's tracing: leave it on
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                _tracing["owned"] = True
+        _tracing["spans"] += 1
+
+
+def _trace_exit() -> None:
+    """Stop tracing when the last traced span closes (if we started it)."""
+    with _lock:
+        _tracing["spans"] -= 1
+        if _tracing["spans"] == 0 and _tracing["owned"]:
+            tracemalloc.stop()
+            _tracing["owned"] = False
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Span]:
+    """Time the block and record it (also when it raises)."""
+    sp = Span(name, attrs)
+    parent = _current.get()
+    token = _current.set(name)
+    trace = _config["trace_memory"]
+    if trace:
+        _trace_enter()
+    t0, c0 = time.perf_counter(), time.process_time()
+    error = None
+    try:
+        yield sp
+    except BaseException as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        record = {
+            "ts": round(time.time(), 3),
+            "name": name,
+            "parent": parent,
+            "wall_s": round(time.perf_counter() - t0, 6),
+            "cpu_s": round(time.process_time() - c0, 6),
+            "rss_peak_mb": _rss_mb(),
+        }
+        if trace:
+            record["py_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+            _trace_exit()
+        record.update(sp.values)
+        if error:
+            record["error"] = error
+        _current.reset(token)
+        _emit(record)
+
+
+def timed(name: str | None = None) -> Callable:
+    """Decorator form of `span` (name defaults to module.function)."""
+
+    def deco(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__.removeprefix('ffwb.')}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return deco
+
+
+def path_bytes(path: Path | str) -> int:
+    """Size of a file, or of every file below a directory."""
+    p = Path(path)
+    if p.is_file():
+        return p.stat().st_size
+    return sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+
+
+# --------------------------------------------------------------------------- #
+#  Reading / summarising
+# --------------------------------------------------------------------------- #
+def recent(n: int | None = None) -> list[dict]:
+    """Records from this process's ring buffer (oldest first)."""
+    with _lock:
+        out = list(_records)
+    return out[-n:] if n else out
+
+
+def read_log(path: Path | str | None = None) -> list[dict]:
+    path = Path(path) if path is not None else default_log_path()
+    if not path.exists():
+        return []
+    with open(path) as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+_SUM_KEYS = ("rows_in", "rows_out", "bytes_read", "bytes_written")
+
+
+def summarize(records: Iterable[dict]) -> list[dict]:
+    """One row per span name: calls, errors, wall/CPU totals, peaks, counters."""
+    rows: dict[str, dict] = {}
+    for r in records:
+        s = rows.setdefault(
+            r["name"],
+            {"name": r["name"], "calls": 0, "errors": 0, "wall_s": 0.0, "cpu_s": 0.0},
+        )
+        s["calls"] += 1
+        s["errors"] += "error" in r
+        s["wall_s"] += r.get("wall_s", 0.0)
+        s["cpu_s"] += r.get("cpu_s", 0.0)
+        s["wall_max_s"] = max(s.get("wall_max_s", 0.0), r.get("wall_s", 0.0))
+        for key in ("rss_peak_mb", "py_peak_mb"):
+            if key in r:
+                s[key] = max(s.get(key, 0.0), r[key])
+        for key in _SUM_KEYS:
+            if key in r:
+                s[key] = s.get(key, 0) + r[key]
+    return sorted(rows.values(), key=lambda s: -s["wall_s"])
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def metrics_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb metrics", description="Summarise recorded pipeline spans"
+    )
+    parser.add_argument("--file", help=f"default: data/{LOG_NAME.as_posix()}")
+    parser.add_argument("--last", type=int, help="only the last N records")
+    parser.add_argument("--clear", action="store_true", help="delete the log")
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    path = Path(args.file) if args.file else default_log_path()
+    if args.clear:
+        path.unlink(missing_ok=True)
+        print(f"[green]Cleared {path}[/green]")
+        return
+    records = read_log(path)
+    if args.last:
+        records = records[-args.last :]
+    if not records:
+        print(f"[yellow]No spans recorded in {path}[/yellow]")
+        return
+
+    cols = ["name", "calls", "errors", "wall_s", "wall_max_s", "cpu_s"]
+    cols += ["rss_peak_mb", "py_peak_mb", *_SUM_KEYS]
+    table = Table(title=f"{len(records)} spans from {path}")
+    for col in cols:
+        table.add_column(col, justify="left" if col == "name" else "right")
+    for s in summarize(records):
+        table.add_row(
+            *(
+                f"{s[c]:.3f}" if isinstance(s.get(c), float) else str(s.get(c, ""))
+                for c in cols
+            )
+        )
+    print(table)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import logging
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from rich import print
-import sys
-from ffwb import scoring, vor
+from ffwb import metrics, scoring, vor
 from ffwb.ingest import io
+from ffwb.rules import CompiledRules, compile_rules, league_rules
+
+logger = logging.getLogger(__name__)
 
 DATA_DIR = Path.cwd() / "data"
 
@@ -32,89 +38,204 @@ ROSTER_SETTINGS = {"qb": 1, "rb": 2, "wr": 2, "te": 1}
 # --------------------------------------------------------------------------- #
 #  calc‑season: weekly → season totals
 # --------------------------------------------------------------------------- #
-def calc_season_main() -> None:
-    print(f"cwd: {Path.cwd()}")
-    print(f"DATA_DIR: {DATA_DIR}")
-    print(f"sys.argv: {sys.argv}")
-    parser = argparse.ArgumentParser(description="Score weekly stats → season totals")
-    parser.add_argument("--season", type=int, required=True)
-    args = parser.parse_args()
+def _season_positions(season: int) -> pd.DataFrame:
+    from ffwb.ingest.ids import build_xwalk
+
+    xwalk = build_xwalk(season).rename(columns={"sleeper_id": "player_id"})
+    return xwalk[["player_id", "position"]]
 
-    wk_path = DATA_DIR / "actual_weekly" / f"season={args.season}"
-    if not wk_path.exists():
-        print(f"[red]No weekly stats found at {wk_path}[/red]")
-        return
 
-    print(f"[green]Loading weekly stats from {wk_path}[/green]")
-    df_weekly = pd.read_parquet(wk_path)
-    print(
-        f"Loaded weekly DataFrame: {df_weekly.shape} rows, columns {list(df_weekly.columns)}"
+def _with_season(table: pa.Table, season: int) -> pa.Table:
+    if "season" in table.column_names:
+        return table
+    return table.append_column(
+        pa.field("season", io.DTYPE_MAP["season"]),
+        pa.array(np.full(table.num_rows, season, dtype=np.int16)),
     )
 
+
+def _calc_season_arrow(
+    season: int, wk_path: Path, rules: dict[str, float] | CompiledRules | None
+) -> pa.Table:
+    """`calc_season` without leaving Arrow (parquet → compute → parquet)."""
+    with metrics.span("pipeline.read_weekly", backend="arrow") as sp:
+        weekly = _with_season(pq.read_table(wk_path), season)
+        sp.set(rows_out=weekly.num_rows, bytes_read=metrics.path_bytes(wk_path))
+    compiled = compile_rules(rules or DEFAULT_RULES)
+    if "fantasy_pts" not in weekly.column_names:
+        if compiled.position and "position" not in weekly.column_names:
+            positions = pa.Table.from_pandas(
+                _season_positions(season), preserve_index=False
+            )
+            weekly = weekly.join(positions, "player_id", join_type="left outer")
+        with metrics.span("scoring.score_weekly", rows_in=weekly.num_rows):
+            weekly = scoring.score_weekly(weekly, compiled, backend="arrow")
+    with metrics.span("scoring.aggregate_season", rows_in=weekly.num_rows) as sp:
+        totals = scoring.aggregate_season(weekly, backend="arrow")
+        sp.set(rows_out=totals.num_rows)
+    io.write_table(totals, "totals", partition_cols=["season"])
+    return totals
+
+
+def calc_season(
+    season: int,
+    rules: dict[str, float] | CompiledRules | None = None,
+    *,
+    backend: str = "pandas",
+) -> pd.DataFrame | pa.Table:
+    """
+    Score `actual_weekly/season=` and write `totals/season=`.
+    `rules` is anything `rules.compile_rules` accepts (default half-PPR).
+    backend="arrow" keeps the data in Arrow throughout and returns a Table.
+    """
+    wk_path = DATA_DIR / "actual_weekly" / f"season={season}"
+    if not wk_path.exists():
+        raise FileNotFoundError(f"No weekly stats found at {wk_path}")
+    with metrics.span("pipeline.calc_season", season=season, backend=backend) as sp:
+        if backend == "arrow":
+            totals = _calc_season_arrow(season, wk_path, rules)
+        else:
+            totals = _calc_season_pandas(season, wk_path, rules)
+        sp.set(rows_out=len(totals))
+    return totals
+
+
+def _calc_season_pandas(
+    season: int, wk_path: Path, rules: dict[str, float] | CompiledRules | None
+) -> pd.DataFrame:
+    with metrics.span("pipeline.read_weekly", backend="pandas") as sp:
+        df_weekly = pd.read_parquet(wk_path)
+        sp.set(rows_out=len(df_weekly), bytes_read=metrics.path_bytes(wk_path))
+
     if "season" not in df_weekly.columns:
-        df_weekly["season"] = args.season
+        df_weekly["season"] = season
 
     if "fantasy_pts" not in df_weekly.columns:
-        df_weekly = scoring.score_weekly(df_weekly, DEFAULT_RULES)
-
-    print(f"[green]Loading weekly stats from {wk_path}[/green]")
-    # df_weekly = pd.read_parquet(wk_path)
-    print(df_weekly.head(10).loc[:, ["player_id", "season", "week", "fantasy_pts"]])
-    print("Unique seasons:", df_weekly["season"].unique())
-    print("Unique players:", df_weekly["player_id"].nunique())
-    print(
-        "fantasy_pts range:",
+        compiled = compile_rules(rules or DEFAULT_RULES)
+        if compiled.position and "position" not in df_weekly.columns:
+            df_weekly = df_weekly.merge(
+                _season_positions(season), on="player_id", how="left"
+            )
+        with metrics.span("scoring.score_weekly", rows_in=len(df_weekly)):
+            df_weekly = scoring.score_weekly(df_weekly, compiled)
+
+    logger.debug(
+        "calc_season %s: %d players, fantasy_pts %.1f..%.1f",
+        season,
+        df_weekly["player_id"].nunique(),
         df_weekly["fantasy_pts"].min(),
-        "to",
         df_weekly["fantasy_pts"].max(),
     )
-    totals = scoring.aggregate_season(df_weekly)
-    print(
-        f"Aggregated season totals: {totals.shape} rows, columns {list(totals.columns)}"
+    with metrics.span("scoring.aggregate_season", rows_in=len(df_weekly)) as sp:
+        totals = scoring.aggregate_season(df_weekly)
+        sp.set(rows_out=len(totals))
+    io.to_parquet(totals, "totals", partition_cols=["season"])
+    return totals
+
+
+def calc_season_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb calc-season", description="Score weekly stats → season totals"
     )
-    out_path = io.to_parquet(totals, "totals", partition_cols=["season"])
-    print(f"[green]to_parquet returned path: {out_path}[/green]")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument(
+        "--league-id", help="score with this Sleeper league's scoring_settings"
+    )
+    parser.add_argument("--backend", choices=scoring.BACKENDS, default="pandas")
+    args = parser.parse_args(argv)
+
+    try:
+        rules = league_rules(args.league_id) if args.league_id else None
+        calc_season(args.season, rules, backend=args.backend)
+    except (FileNotFoundError, KeyError) as exc:
+        print(f"[red]{exc}[/red]")
+        return
     print(f"[green]Wrote season totals to data/totals/season={args.season}[/green]")
 
 
 # --------------------------------------------------------------------------- #
 #  calc‑vor: season totals → VOR
 # --------------------------------------------------------------------------- #
-def calc_vor_main() -> None:
-    parser = argparse.ArgumentParser(description="Season totals → VOR")
-    parser.add_argument("--season", type=int, required=True)
-    parser.add_argument("--teams", type=int, default=12)
-    args = parser.parse_args()
-
-    part_path = DATA_DIR / "totals" / f"season={args.season}"
+@metrics.timed("pipeline.calc_vor")
+def calc_vor(
+    season: int,
+    teams: int = 12,
+    roster_settings: dict[str, int] | None = None,
+    *,
+    backend: str = "pandas",
+) -> pd.DataFrame | pa.Table:
+    """
+    Read `totals/season=`, attach positions, write `vor/season=`.
+    backend="arrow" keeps the data in Arrow throughout and returns a Table.
+    """
+    part_path = DATA_DIR / "totals" / f"season={season}"
     root_path = DATA_DIR / "totals"
 
+    if backend == "arrow":
+        if not part_path.exists():
+            raise FileNotFoundError(f"No season totals found at {part_path}")
+        totals = _with_season(pq.read_table(part_path), season)
+        positions = pa.Table.from_pandas(
+            _season_positions(season), preserve_index=False
+        )
+        totals = totals.join(positions, "player_id", join_type="left outer")
+        with metrics.span("vor.compute_vor", rows_in=totals.num_rows):
+            vor_tbl = vor.compute_vor(
+                totals,
+                roster_settings=roster_settings or ROSTER_SETTINGS,
+                num_teams=teams,
+                backend="arrow",
+            )
+        io.write_table(vor_tbl, "vor", partition_cols=["season"])
+        return vor_tbl
+
     if part_path.exists():
         totals = pd.read_parquet(part_path)
-        totals["season"] = args.season
+        totals["season"] = season
     elif root_path.exists():
         # fall back: load full dataset and filter
-        totals = pd.read_parquet(root_path).query("season == @args.season")
+        totals = pd.read_parquet(root_path).query("season == @season")
         if totals.empty:
-            print(f"[red]No rows for season {args.season} in {root_path}[/red]")
-            return
+            raise FileNotFoundError(f"No rows for season {season} in {root_path}")
     else:
-        print(f"[red]No season totals found at {root_path}[/red]")
-        return
+        raise FileNotFoundError(f"No season totals found at {root_path}")
+    from ffwb.ingest import registry
     from ffwb.ingest.ids import build_xwalk
 
     # build_xwalk returns gsis_id → sleeper_id, full_name, position
-    xwalk = build_xwalk(args.season).rename(columns={"sleeper_id": "player_id"})[
+    xwalk = build_xwalk(season).rename(columns={"sleeper_id": "player_id"})[
         ["player_id", "position"]
     ]
-    totals = totals.merge(xwalk, on="player_id", how="left")
+    if registry.has_keys(totals):
+        xwalk = registry.attach_keys(xwalk, "sleeper")
+        totals = registry.key_join(totals, xwalk, ["position"])
+    else:
+        totals = totals.merge(xwalk, on="player_id", how="left")
 
-    vor_df = vor.compute_vor(
-        totals,
-        roster_settings=ROSTER_SETTINGS,
-        num_teams=args.teams,
-    )
-    vor_df["season"] = args.season
+    with metrics.span("vor.compute_vor", rows_in=len(totals)):
+        vor_df = vor.compute_vor(
+            totals,
+            roster_settings=roster_settings or ROSTER_SETTINGS,
+            num_teams=teams,
+        )
+    vor_df["season"] = season
 
     io.to_parquet(vor_df, "vor", partition_cols=["season"])
+    return vor_df
+
+
+def calc_vor_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb calc-vor", description="Season totals → VOR"
+    )
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--backend", choices=scoring.BACKENDS, default="pandas")
+    args = parser.parse_args(argv)
+
+    try:
+        calc_vor(args.season, args.teams, backend=args.backend)
+    except FileNotFoundError as exc:
+        print(f"[red]{exc}[/red]")
+        return
     print(f"[green]Wrote VOR table to data/vor/season={args.season}[/green]")
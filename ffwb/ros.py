@@ -0,0 +1,245 @@
+# ffwb/ros.py
+"""
+Rest-of-season (ROS) values from weekly projections.
+
+`projection_weekly_tank01` is held as one dense (players × weeks) float32
+array; bye weeks and unprojected weeks are 0, so the schedule is already in
+the array.  Alongside it we keep suffix sums `ros[:, w] = Σ_{k ≥ w} pts[:, k]`,
+so "weeks N..18" totals for every player are a single column read.  When a
+week is re-projected only that column changes and the suffix sums are
+patched with its delta (columns ≤ week), instead of re-aggregating.
+
+State is cached in `data/ros/season=…/state.npz` together with a version
+stamp per week partition; `refresh_ros` reads only weeks whose files
+changed since.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ffwb import vor
+
+N_WEEKS = 18
+ROSTER_SETTINGS = {"qb": 1, "rb": 2, "wr": 2, "te": 1}
+
+
+@dataclass
+class RestOfSeason:
+    season: int
+    player_ids: pd.Index
+    position: np.ndarray  # (P,) object
+    full_name: np.ndarray  # (P,) object
+    pts: np.ndarray  # (P, W) float32 weekly projections
+    ros: np.ndarray  # (P, W) float32 suffix sums
+    versions: dict[str, str] = field(default_factory=dict)  # week → stamp
+
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def empty(cls, season: int, n_weeks: int = N_WEEKS) -> RestOfSeason:
+        z = np.zeros((0, n_weeks), dtype=np.float32)
+        e = np.array([], dtype=object)
+        return cls(season, pd.Index([], dtype=object), e, e.copy(), z, z.copy())
+
+    @classmethod
+    def from_projections(
+        cls, proj: pd.DataFrame, season: int, n_weeks: int = N_WEEKS
+    ) -> RestOfSeason:
+        """Build from long rows (player_id, position, week, fantasy_pts…)."""
+        state = cls.empty(season, n_weeks)
+        for week, rows in proj.groupby("week", sort=True):
+            state.update_week(int(week), rows)
+        return state
+
+    def _grow(self, rows: pd.DataFrame) -> None:
+        """Append players seen for the first time."""
+        new = rows.loc[~rows["player_id"].isin(self.player_ids)]
+        new = new.drop_duplicates("player_id")
+        if new.empty:
+            return
+        self.player_ids = self.player_ids.append(pd.Index(new["player_id"]))
+        self.position = np.concatenate(
+            [self.position, new["position"].str.upper().to_numpy(dtype=object)]
+        )
+        names = new["full_name"] if "full_name" in new.columns else new["player_id"]
+        self.full_name = np.concatenate([self.full_name, names.to_numpy(dtype=object)])
+        pad = np.zeros((len(new), self.pts.shape[1]), dtype=np.float32)
+        self.pts = np.vstack([self.pts, pad])
+        self.ros = np.vstack([self.ros, pad])
+
+    def update_week(self, week: int, rows: pd.DataFrame) -> None:
+        """
+        Replace week `week` with `rows` (player_id, position, fantasy_pts);
+        players missing from `rows` are 0 that week.  O(players × week).
+        """
+        n_weeks = self.pts.shape[1]
+        if not 1 <= week <= n_weeks:
+            raise ValueError(
+                f"week {week} outside 1..{n_weeks} for season {self.season}"
+            )
+        rows = rows.drop_duplicates("player_id", keep="last")
+        self._grow(rows)
+        col = np.zeros(len(self.player_ids), dtype=np.float32)
+        idx = self.player_ids.get_indexer(rows["player_id"])
+        col[idx] = rows["fantasy_pts"].fillna(0).to_numpy(dtype=np.float32)
+
+        w = week - 1
+        delta = col - self.pts[:, w]
+        self.pts[:, w] = col
+        self.ros[:, : w + 1] += delta[:, None]
+
+    # ------------------------------------------------------------------ #
+    def totals(self, start_week: int) -> pd.DataFrame:
+        """Projected points for weeks `start_week`..end, one row per player."""
+        w = max(start_week, 1) - 1
+        remaining = (self.pts[:, w:] > 0).sum(axis=1)
+        return pd.DataFrame(
+            {
+                "player_id": self.player_ids,
+                "full_name": self.full_name,
+                "position": self.position,
+                "fantasy_pts_season": self.ros[:, w] if w < self.ros.shape[1] else 0.0,
+                "weeks_left": remaining.astype(np.int8),
+                "season": self.season,
+            }
+        )
+
+    def vor(
+        self,
+        start_week: int,
+        roster_settings: dict[str, int] | None = None,
+        *,
+        teams: int = 12,
+    ) -> pd.DataFrame:
+        """Rest-of-season VOR and tiers (same columns as season boards)."""
+        out = vor.compute_vor(
+            self.totals(start_week),
+            roster_settings=roster_settings or ROSTER_SETTINGS,
+            num_teams=teams,
+        )
+        return out.sort_values("vor", ascending=False, ignore_index=True)
+
+    # ------------------------------------------------------------------ #
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp,
+            player_ids=self.player_ids.to_numpy(dtype=str),
+            position=self.position.astype(str),
+            full_name=self.full_name.astype(str),
+            pts=self.pts,
+            ros=self.ros,
+            versions=np.array(json.dumps(self.versions)),
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, season: int) -> RestOfSeason:
+        z = np.load(path)
+        return cls(
+            season,
+            pd.Index(z["player_ids"].astype(object)),
+            z["position"].astype(object),
+            z["full_name"].astype(object),
+            z["pts"],
+            z["ros"],
+            json.loads(str(z["versions"])),
+        )
+
+
+# --------------------------------------------------------------------------- #
+#  Stored projections → cached state
+# --------------------------------------------------------------------------- #
+_NO_ROWS = pd.DataFrame(columns=["player_id", "position", "fantasy_pts"])
+
+
+def _week_version(path: Path) -> str:
+    h = hashlib.sha1()
+    for f in sorted(path.rglob("*.parquet")):
+        st = f.stat()
+        h.update(f"{f.name}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest()[:16]
+
+
+def _state_path(season: int) -> Path:
+    from ffwb.ingest import io
+
+    return io._DATA_ROOT / "ros" / f"season={season}" / "state.npz"
+
+
+def refresh_ros(season: int) -> RestOfSeason:
+    """
+    Load the cached ROS state and fold in only the week partitions of
+    `projection_weekly_tank01/season=` that are new or changed.  Weeks
+    whose partition was deleted (or re-ingested empty) are zeroed.
+    """
+    from ffwb.ingest import io
+
+    root = io._DATA_ROOT / "projection_weekly_tank01" / f"season={season}"
+    if not root.exists():
+        raise FileNotFoundError(f"No Tank-01 projections at {root}")
+
+    path = _state_path(season)
+    state = (
+        RestOfSeason.load(path, season) if path.exists() else RestOfSeason.empty(season)
+    )
+    week_dirs = {
+        int(d.name[5:]): d
+        for d in root.glob("week=*")
+        if next(d.rglob("*.parquet"), None) is not None
+    }
+    changed = False
+    for week in sorted(week_dirs):
+        version = _week_version(week_dirs[week])
+        if state.versions.get(str(week)) == version:
+            continue
+        state.update_week(week, pd.read_parquet(week_dirs[week]))
+        state.versions[str(week)] = version
+        changed = True
+    for week in [w for w in state.versions if int(w) not in week_dirs]:
+        state.update_week(int(week), _NO_ROWS)
+        del state.versions[week]
+        changed = True
+    if changed:
+        state.save(path)
+    return state
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def ros_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb ros", description="Rest-of-season VOR from weekly projections"
+    )
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--week", type=int, required=True, help="first week counted")
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--top", type=int, default=60)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    try:
+        state = refresh_ros(args.season)
+    except FileNotFoundError as e:
+        print(f"[red]{e}[/red]")
+        return
+    board = state.vor(args.week, teams=args.teams)
+
+    cols = ["full_name", "position", "fantasy_pts_season", "weeks_left", "vor", "tier"]
+    table = Table(title=f"Rest of season {args.season}, weeks {args.week}–{N_WEEKS}")
+    for col in cols:
+        table.add_column(col.replace("_", " ").title())
+    for row in board.head(args.top)[cols].itertuples(index=False):
+        table.add_row(*(f"{x:.1f}" if isinstance(x, float) else str(x) for x in row))
+    print(table)
@@ -0,0 +1,252 @@
+# ffwb/rules.py
+"""
+Scoring-rule compiler.
+
+League settings are compiled once into a few weight arrays and evaluated
+over a whole stats frame with array expressions only:
+
+* linear terms        → stats (n × k) @ weights (k)
+* threshold bonuses   → (stats (n × m) >= thresholds (m)) @ points (m)
+* clipped tiers       → clip(stat − lo, 0, hi − lo) @ weights
+* position weights    → per-position weight rows gathered by position code
+
+Accepted inputs (`compile_rules`):
+
+* `{stat: weight}`                      – the original linear rule dicts
+* `{"linear": …, "bonuses": […], "tiers": […], "position": {pos: {…}}}`
+* Sleeper `scoring_settings` (keys mapped through `SLEEPER_*` below)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------- #
+#  Sleeper scoring keys → canonical stat columns
+# --------------------------------------------------------------------------- #
+SLEEPER_LINEAR: dict[str, str] = {
+    "pass_yd": "pass_yds",
+    "pass_td": "pass_tds",
+    "pass_int": "pass_ints",
+    "pass_fd": "pass_fd",
+    "pass_cmp_40p": "pass_40",
+    "rush_yd": "rush_yds",
+    "rush_td": "rush_tds",
+    "rush_fd": "rush_fd",
+    "rush_40p": "rush_40",
+    "rec": "rec_rec",
+    "rec_yd": "rec_yds",
+    "rec_td": "rec_tds",
+    "rec_fd": "rec_fd",
+    "rec_40p": "rec_40",
+    # long-TD bonuses stack: a 55-yard TD counts in both _40 and _50
+    "pass_td_40p": "pass_td_40",
+    "pass_td_50p": "pass_td_50",
+    "rush_td_40p": "rush_td_40",
+    "rush_td_50p": "rush_td_50",
+    "rec_td_40p": "rec_td_40",
+    "rec_td_50p": "rec_td_50",
+    "fum_lost": "fumbles_lost",
+}
+
+# key → (stat columns summed, threshold)
+SLEEPER_BONUS: dict[str, tuple[tuple[str, ...], float]] = {
+    "bonus_pass_yd_300": (("pass_yds",), 300),
+    "bonus_pass_yd_400": (("pass_yds",), 400),
+    "bonus_rush_yd_100": (("rush_yds",), 100),
+    "bonus_rush_yd_200": (("rush_yds",), 200),
+    "bonus_rec_yd_100": (("rec_yds",), 100),
+    "bonus_rec_yd_200": (("rec_yds",), 200),
+    "bonus_rush_rec_yd_100": (("rush_yds", "rec_yds"), 100),
+    "bonus_rush_rec_yd_200": (("rush_yds", "rec_yds"), 200),
+}
+
+# key → (position, stat): extra weight on top of the linear term
+SLEEPER_POSITION: dict[str, tuple[str, str]] = {
+    "bonus_rec_te": ("TE", "rec_rec"),
+    "bonus_rec_rb": ("RB", "rec_rec"),
+    "bonus_rec_wr": ("WR", "rec_rec"),
+}
+
+# Sleeper keys that are not also canonical column names (pass_fd, …)
+_SLEEPER_KEYS = {*SLEEPER_LINEAR, *SLEEPER_BONUS, *SLEEPER_POSITION} - set(
+    SLEEPER_LINEAR.values()
+)
+_STRUCTURED_KEYS = {"linear", "bonuses", "tiers", "position"}
+
+
+@dataclass(frozen=True)
+class Bonus:
+    """`points` once when the sum of `stats` reaches `at`."""
+
+    stats: tuple[str, ...]
+    at: float
+    points: float
+
+
+@dataclass(frozen=True)
+class Tier:
+    """`weight` per unit of `stat` between `lo` and `hi` (clipped)."""
+
+    stat: str
+    lo: float
+    weight: float
+    hi: float = np.inf
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    linear: dict[str, float] = field(default_factory=dict)
+    bonuses: tuple[Bonus, ...] = ()
+    tiers: tuple[Tier, ...] = ()
+    position: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def stats(self) -> list[str]:
+        """Every stat column referenced, in first-use order."""
+        cols = [*self.linear]
+        cols += [s for b in self.bonuses for s in b.stats]
+        cols += [t.stat for t in self.tiers]
+        cols += [s for w in self.position.values() for s in w]
+        return list(dict.fromkeys(cols))
+
+    # ------------------------------------------------------------------ #
+    def evaluate(
+        self, df: pd.DataFrame, *, position_col: str = "position"
+    ) -> np.ndarray:
+        """Fantasy points per row of `df` (missing stat columns count as 0)."""
+        present = [c for c in self.stats if c in df.columns]
+        missing = [c for c in self.stats if c not in df.columns]
+        if not present:
+            raise ValueError("No valid stat columns found to score")
+        if missing:
+            logger.warning(
+                "score_weekly: stat columns not found in DataFrame and treated "
+                "as 0 → %s",
+                ", ".join(missing),
+            )
+
+        # one (n × k) float matrix; column k = zeros for a missing stat
+        n = len(df)
+        col = {c: i for i, c in enumerate(self.stats)}
+        X = np.zeros((n, len(col)))
+        for c in present:
+            X[:, col[c]] = df[c].fillna(0).to_numpy(dtype=np.float64)
+
+        pts = np.zeros(n)
+        if self.linear:
+            w = np.array(list(self.linear.values()))
+            pts += X[:, [col[c] for c in self.linear]] @ w
+
+        if self.bonuses:
+            # (n × B) summed-stat matrix via a (k × B) 0/1 incidence product
+            inc = np.zeros((len(col), len(self.bonuses)))
+            for j, b in enumerate(self.bonuses):
+                inc[[col[s] for s in b.stats], j] = 1.0
+            at = np.array([b.at for b in self.bonuses])
+            points = np.array([b.points for b in self.bonuses])
+            pts += ((X @ inc) >= at) @ points
+
+        if self.tiers:
+            v = X[:, [col[t.stat] for t in self.tiers]]
+            lo = np.array([t.lo for t in self.tiers])
+            hi = np.array([t.hi for t in self.tiers])
+            w = np.array([t.weight for t in self.tiers])
+            pts += np.clip(v - lo, 0, hi - lo) @ w
+
+        if self.position:
+            if position_col not in df.columns:
+                raise KeyError(
+                    f"Position-specific rules need a `{position_col}` column "
+                    "(merge it from ids.build_xwalk)"
+                )
+            pos = df[position_col].fillna("").astype(str).str.upper().to_numpy()
+            names = sorted(self.position)
+            W = np.zeros((len(names) + 1, len(col)))  # last row: no override
+            for i, p in enumerate(names):
+                for c, wt in self.position[p].items():
+                    W[i, col[c]] = wt
+            code = pd.Index(names).get_indexer(pos)
+            code[code < 0] = len(names)
+            pts += np.einsum("nk,nk->n", X, W[code])
+
+        return pts
+
+
+# --------------------------------------------------------------------------- #
+#  Compilers
+# --------------------------------------------------------------------------- #
+def from_sleeper(settings: Mapping[str, float] | str) -> CompiledRules:
+    """Compile Sleeper `scoring_settings` (dict or its JSON string)."""
+    if isinstance(settings, str):
+        settings = json.loads(settings)
+
+    linear: dict[str, float] = {}
+    bonuses: list[Bonus] = []
+    position: dict[str, dict[str, float]] = {}
+    unmapped: list[str] = []
+    for key, value in settings.items():
+        value = float(value or 0)
+        if value == 0:
+            continue
+        if key in SLEEPER_LINEAR:
+            stat = SLEEPER_LINEAR[key]
+            linear[stat] = linear.get(stat, 0.0) + value
+        elif key in SLEEPER_BONUS:
+            stats, at = SLEEPER_BONUS[key]
+            bonuses.append(Bonus(stats, at, value))
+        elif key in SLEEPER_POSITION:
+            pos, stat = SLEEPER_POSITION[key]
+            position.setdefault(pos, {})[stat] = value
+        else:
+            unmapped.append(key)
+    if unmapped:
+        logger.warning(
+            "from_sleeper: ignoring unmapped keys (not scored) → %s",
+            ", ".join(unmapped),
+        )
+    return CompiledRules(linear, tuple(bonuses), (), position)
+
+
+def compile_rules(rules) -> CompiledRules:
+    """Compile any supported rule format (see module docstring)."""
+    if isinstance(rules, CompiledRules):
+        return rules
+    if isinstance(rules, str):
+        rules = json.loads(rules)
+    if set(rules) & _STRUCTURED_KEYS:
+        return CompiledRules(
+            dict(rules.get("linear", {})),
+            tuple(
+                Bonus(
+                    (b["stat"],) if isinstance(b["stat"], str) else tuple(b["stat"]),
+                    b["at"],
+                    b["points"],
+                )
+                for b in rules.get("bonuses", [])
+            ),
+            tuple(Tier(**t) for t in rules.get("tiers", [])),
+            {p.upper(): dict(w) for p, w in rules.get("position", {}).items()},
+        )
+    if set(rules) & _SLEEPER_KEYS:
+        return from_sleeper(rules)
+    return CompiledRules(linear={k: float(v) for k, v in rules.items()})
+
+
+def league_rules(league_id: str) -> CompiledRules:
+    """Compiled rules for a league stored by `sleeper.ingest_league`."""
+    from ffwb.ingest import io
+
+    league = pd.read_parquet(io._DATA_ROOT / "league")
+    row = league[league["league_id"] == str(league_id)]
+    if row.empty:
+        raise KeyError(f"League {league_id} not in league table")
+    return from_sleeper(row["scoring_json"].iloc[-1])
@@ -0,0 +1,368 @@
+# ffwb/runner.py
+"""
+Dependency-aware pipeline runner.
+
+    ffwb run --season 2024 --target board
+
+Each stage declares the partitions it reads and writes.  Before running, a
+stage is fingerprinted from its parameters (rules, roster settings, …) and
+the *content* of its input partitions; if the fingerprint matches the last
+successful run and the outputs still exist, the stage is skipped.  Stages
+whose dependencies are satisfied run concurrently in a thread pool (the
+expensive ones are network / parquet I/O bound).
+
+Source stages (network ingests) have no input partitions, so they only
+re-run when their outputs are missing, their parameters change, or they are
+named in `--refresh`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+import hashlib
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from ffwb import metrics
+from ffwb.ingest import io
+
+STATE_FILE = Path("_runs") / "state.json"  # relative to the data root
+
+
+@dataclass
+class RunContext:
+    season: int
+    teams: int = 12
+    adp_source: str = "ffc"
+    rules: dict[str, float] | None = None
+    roster_settings: dict[str, int] | None = None
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[RunContext], object]
+    deps: tuple[str, ...] = ()
+    inputs: Callable[[RunContext], list[str]] = lambda ctx: []
+    outputs: Callable[[RunContext], list[str]] = lambda ctx: []
+    params: Callable[[RunContext], dict] = lambda ctx: {}
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str  # "ran" | "skipped" | "failed" | "blocked"
+    seconds: float = 0.0
+    error: str | None = None
+    fingerprint: str | None = field(default=None, repr=False)
+
+
+# --------------------------------------------------------------------------- #
+#  Default stages
+# --------------------------------------------------------------------------- #
+def _ingest_weekly(ctx: RunContext) -> None:
+    from ffwb.ingest.nflfast import ingest_actual_weekly
+
+    ingest_actual_weekly(ctx.season)
+
+
+def _ingest_adp(ctx: RunContext) -> None:
+    from ffwb.ingest.adp import ingest_adp
+
+    ingest_adp(ctx.season, source=ctx.adp_source, teams=ctx.teams)
+
+
+def _totals(ctx: RunContext) -> None:
+    from ffwb.pipeline import calc_season
+
+    calc_season(ctx.season, ctx.rules)
+
+
+def _vor(ctx: RunContext) -> None:
+    from ffwb.pipeline import calc_vor
+
+    calc_vor(ctx.season, ctx.teams, ctx.roster_settings)
+
+
+def _board(ctx: RunContext) -> None:
+    import pandas as pd
+
+    from ffwb import vor
+
+    root = io._DATA_ROOT
+    vor_df = pd.read_parquet(root / "vor" / f"season={ctx.season}")
+    adp_path = root / "adp" / f"season={ctx.season}" / f"source={ctx.adp_source}"
+    adp_df = pd.read_parquet(adp_path) if adp_path.exists() else pd.DataFrame()
+    if "player_id" not in adp_df.columns:
+        adp_df = pd.DataFrame(columns=["player_id"])
+
+    board = vor.attach_adp(vor_df, adp_df)
+    board["season"] = ctx.season
+    io.to_parquet(board, "board", partition_cols=["season"])
+
+
+def _features(ctx: RunContext) -> None:
+    from ffwb.features import write_features
+
+    write_features(ctx.season, rebuild=True)
+
+
+def _pipeline_params(ctx: RunContext) -> dict:
+    from ffwb.pipeline import DEFAULT_RULES, ROSTER_SETTINGS
+
+    return {
+        "rules": ctx.rules or DEFAULT_RULES,
+        "roster": ctx.roster_settings or ROSTER_SETTINGS,
+        "teams": ctx.teams,
+    }
+
+
+def default_stages() -> list[Stage]:
+    return [
+        Stage(
+            "actual_weekly",
+            _ingest_weekly,
+            outputs=lambda c: [f"actual_weekly/season={c.season}"],
+            params=lambda c: {"season": c.season},
+        ),
+        Stage(
+            "adp",
+            _ingest_adp,
+            outputs=lambda c: [f"adp/season={c.season}/source={c.adp_source}"],
+            params=lambda c: {"season": c.season, "teams": c.teams},
+        ),
+        Stage(
+            "totals",
+            _totals,
+            deps=("actual_weekly",),
+            inputs=lambda c: [f"actual_weekly/season={c.season}"],
+            outputs=lambda c: [f"totals/season={c.season}"],
+            params=lambda c: {"rules": _pipeline_params(c)["rules"]},
+        ),
+        Stage(
+            "features",
+            _features,
+            deps=("actual_weekly",),
+            inputs=lambda c: [f"actual_weekly/season={c.season}"],
+            outputs=lambda c: [f"features_weekly/season={c.season}"],
+        ),
+        Stage(
+            "vor",
+            _vor,
+            deps=("totals",),
+            inputs=lambda c: [f"totals/season={c.season}"],
+            outputs=lambda c: [f"vor/season={c.season}"],
+            params=lambda c: {
+                k: v for k, v in _pipeline_params(c).items() if k != "rules"
+            },
+        ),
+        Stage(
+            "board",
+            _board,
+            deps=("vor", "adp"),
+            inputs=lambda c: [
+                f"vor/season={c.season}",
+                f"adp/season={c.season}/source={c.adp_source}",
+            ],
+            outputs=lambda c: [f"board/season={c.season}"],
+        ),
+    ]
+
+
+# --------------------------------------------------------------------------- #
+#  Fingerprints + state
+# --------------------------------------------------------------------------- #
+def content_hash(rel: str) -> str:
+    """Hash of the bytes of every parquet file under a partition (name-agnostic)."""
+    root = io._DATA_ROOT / rel
+    if not root.exists():
+        return "missing"
+    digests = sorted(
+        hashlib.sha1(f.read_bytes()).hexdigest() for f in root.rglob("*.parquet")
+    )
+    return hashlib.sha1("".join(digests).encode()).hexdigest()
+
+
+def fingerprint(stage: Stage, ctx: RunContext) -> str:
+    state = {
+        "params": stage.params(ctx),
+        "inputs": {rel: content_hash(rel) for rel in stage.inputs(ctx)},
+    }
+    blob = json.dumps(state, sort_keys=True, default=str).encode()
+    return hashlib.sha1(blob).hexdigest()
+
+
+def _state_path() -> Path:
+    return io._DATA_ROOT / STATE_FILE
+
+
+def _load_state() -> dict[str, str]:
+    path = _state_path()
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _save_state(state: dict[str, str]) -> None:
+    path = _state_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+# --------------------------------------------------------------------------- #
+#  Scheduler
+# --------------------------------------------------------------------------- #
+def _plan(stages: dict[str, Stage], target: str) -> list[str]:
+    """Target plus its transitive dependencies, in dependency order."""
+    if target not in stages:
+        raise KeyError(f"Unknown stage {target!r}; choose from {sorted(stages)}")
+    order: list[str] = []
+
+    def visit(name: str, path: tuple[str, ...]) -> None:
+        if name in path:
+            raise ValueError(f"Cycle in stage graph: {' → '.join(path + (name,))}")
+        if name in order:
+            return
+        for dep in stages[name].deps:
+            visit(dep, path + (name,))
+        order.append(name)
+
+    visit(target, ())
+    return order
+
+
+def _execute(stage: Stage, ctx: RunContext, fp: str) -> StageResult:
+    # outputs are replaced wholesale so reruns never append duplicate files;
+    # the previous outputs are restored if the stage fails
+    outputs = [io._DATA_ROOT / rel for rel in stage.outputs(ctx)]
+    t0 = time.perf_counter()
+    with io.replacing(outputs), metrics.span(f"stage.{stage.name}", season=ctx.season):
+        stage.run(ctx)
+    return StageResult(stage.name, "ran", time.perf_counter() - t0, fingerprint=fp)
+
+
+def run_pipeline(
+    ctx: RunContext,
+    target: str = "board",
+    *,
+    stages: list[Stage] | None = None,
+    refresh: set[str] | None = None,
+    force: bool = False,
+    jobs: int = 4,
+) -> list[StageResult]:
+    """
+    Bring `target` up to date, skipping current stages and running ready
+    stages concurrently.  Returns one StageResult per planned stage.
+    """
+    graph = {s.name: s for s in (stages or default_stages())}
+    order = _plan(graph, target)
+    refresh = refresh or set()
+    state = _load_state()
+    key = lambda name: f"{name}@{ctx.season}"  # noqa: E731
+
+    results: dict[str, StageResult] = {}
+    pending = list(order)
+    running: dict[Future, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for name in list(pending):
+                stage = graph[name]
+                dep_status = [results.get(d) for d in stage.deps]
+                if any(r is None for r in dep_status):
+                    continue  # dependency still running
+                pending.remove(name)
+
+                if any(r.status in ("failed", "blocked") for r in dep_status):
+                    results[name] = StageResult(name, "blocked")
+                    continue
+
+                # fingerprint only once inputs are final
+                fp = fingerprint(stage, ctx)
+                current = (
+                    not force
+                    and name not in refresh
+                    and state.get(key(name)) == fp
+                    and all((io._DATA_ROOT / o).exists() for o in stage.outputs(ctx))
+                )
+                if current:
+                    results[name] = StageResult(name, "skipped", fingerprint=fp)
+                    continue
+                # copy the context so stage spans nest under the caller's span
+                run = contextvars.copy_context().run
+                running[pool.submit(run, _execute, stage, ctx, fp)] = name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                try:
+                    res = fut.result()
+                except Exception as exc:  # keep independent branches going
+                    res = StageResult(
+                        name, "failed", error=f"{type(exc).__name__}: {exc}"
+                    )
+                    state.pop(key(name), None)
+                else:
+                    state[key(name)] = res.fingerprint
+                results[name] = res
+                _save_state(state)
+
+    return [results[n] for n in order]
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def run_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb run", description="Run the pipeline up to a target stage"
+    )
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--target", default="board")
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument(
+        "--adp-source",
+        choices=["fantasypros", "underdog", "ffc", "consensus"],
+        default="ffc",
+    )
+    parser.add_argument(
+        "--refresh",
+        default="",
+        help="Comma-separated stages to re-run regardless of fingerprint "
+        "(e.g. actual_weekly,adp for a nightly refresh)",
+    )
+    parser.add_argument("--force", action="store_true", help="Re-run every stage")
+    parser.add_argument("--jobs", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    ctx = RunContext(args.season, teams=args.teams, adp_source=args.adp_source)
+    results = run_pipeline(
+        ctx,
+        args.target,
+        refresh={s for s in args.refresh.split(",") if s},
+        force=args.force,
+        jobs=args.jobs,
+    )
+
+    colour = {"ran": "green", "skipped": "dim", "failed": "red", "blocked": "yellow"}
+    table = Table(title=f"ffwb run → {args.target} ({args.season})")
+    for col in ("stage", "status", "seconds", "error"):
+        table.add_column(col)
+    for r in results:
+        table.add_row(
+            r.name,
+            f"[{colour[r.status]}]{r.status}[/{colour[r.status]}]",
+            f"{r.seconds:.2f}",
+            r.error or "",
+        )
+    print(table)
@@ -6,41 +6,29 @@ from typing import Dict
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+
+from ffwb import arrow_ops
+from ffwb.rules import CompiledRules, compile_rules
 
 logger = logging.getLogger(__name__)
 
+BACKENDS = ("pandas", "arrow")
 
-def _validate_rules(df: pd.DataFrame, rules: Dict[str, float]) -> Dict[str, float]:
-    """
-    Ensure every key in `rules` exists in `df`.
-    • If a column is missing, create it with zeros and warn once.
-    • Return a *copy* of rules containing only the cols present in df
-      (so we can pass directly to DataFrame.mul).
-    """
-    usable_rules: Dict[str, float] = {}
-    missing: list[str] = []
-
-    for col, weight in rules.items():
-        if col in df.columns:
-            usable_rules[col] = weight
-        else:
-            missing.append(col)
-            df[col] = 0  # back‑fill with zeros
-
-    if missing:
-        logger.warning(
-            "score_weekly: stat columns not found in DataFrame and treated as 0 → %s",
-            ", ".join(missing),
-        )
-    return usable_rules
+
+def _check_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    return backend
 
 
 def score_weekly(
     stats: pd.DataFrame,
-    rules: Dict[str, float],
+    rules: Dict[str, float] | CompiledRules,
     *,
     drop_stat_cols: bool = False,
-) -> pd.DataFrame:
+    backend: str = "pandas",
+) -> pd.DataFrame | pa.Table:
     """
     Vector‑compute fantasy points for each row.
 
@@ -49,27 +37,33 @@ def score_weekly(
     stats : DataFrame
         Must contain the raw stat columns referenced in `rules`.
         Additional columns (player_id, week, etc.) are left untouched.
-    rules : dict
-        Mapping {stat_column: weight}. e.g. {"pass_td": 4, "pass_yds": 0.04}
+        Position-specific rules also need a `position` column.
+    rules : dict or CompiledRules
+        Mapping {stat_column: weight}. e.g. {"pass_td": 4, "pass_yds": 0.04},
+        a structured / Sleeper `scoring_settings` dict (see `ffwb.rules`),
+        or an already compiled rule set.
     drop_stat_cols : bool, default False
         If True, remove the individual stat columns after computing points
         (keeps DataFrame compact).
+    backend : {"pandas", "arrow"}
+        "arrow" scores with `pyarrow.compute` and returns a `pa.Table`
+        (`stats` may then be a Table; see `ffwb.arrow_ops`).
 
     Returns
     -------
     DataFrame  (new copy)  with an extra column  `fantasy_pts`
     """
-    df = stats.copy(deep=False)  # shallow copy keeps memory low
-
-    usable_rules = _validate_rules(df, rules)
-    if not usable_rules:
-        raise ValueError("No valid stat columns found to score")
+    compiled = compile_rules(rules)
+    if _check_backend(backend) == "arrow":
+        return arrow_ops.score_weekly(
+            arrow_ops.as_table(stats), compiled, drop_stat_cols=drop_stat_cols
+        )
 
-    # Multiply each stat column by its weight and sum row‑wise
-    df["fantasy_pts"] = df[list(usable_rules)].mul(usable_rules).sum(axis=1)
+    df = stats.copy(deep=False)  # shallow copy keeps memory low
+    df["fantasy_pts"] = compiled.evaluate(df)
 
     if drop_stat_cols:
-        df = df.drop(columns=list(usable_rules))
+        df = df.drop(columns=[c for c in compiled.stats if c in df.columns])
 
     return df
 
@@ -79,7 +73,8 @@ def aggregate_season(
     *,
     agg: str | dict[str, str] = "sum",
     points_col: str = "fantasy_pts",
-) -> pd.DataFrame:
+    backend: str = "pandas",
+) -> pd.DataFrame | pa.Table:
     """
     Collapse weekly rows to one row per (player_id, season).
 
@@ -92,13 +87,16 @@ def aggregate_season(
         You can also pass dict ({"fantasy_pts": "mean", "rush_yds": "sum"}).
     points_col : str, default "fantasy_pts"
         Name of the points column to aggregate.
+    backend : {"pandas", "arrow"}
+        "arrow" uses an Arrow hash group-by and returns a `pa.Table`.
 
     Returns
     -------
     DataFrame
         Columns: player_id, season, <aggregated stats...>
     """
-    if points_col not in scored.columns:
+    columns = scored.column_names if isinstance(scored, pa.Table) else scored.columns
+    if points_col not in columns:
         raise KeyError(f"{points_col} not found in DataFrame")
 
     if isinstance(agg, str):
@@ -106,6 +104,11 @@ def aggregate_season(
     else:
         agg_map = agg
 
+    if _check_backend(backend) == "arrow":
+        return arrow_ops.aggregate_season(
+            arrow_ops.as_table(scored), agg_map, points_col
+        )
+
     out = (
         scored.groupby(["player_id", "season"], as_index=False)
         .agg(agg_map)
@@ -0,0 +1,204 @@
+# ffwb/simulate.py
+"""
+Monte Carlo matchup simulator on top of weekly point projections.
+
+Each player's weekly score is sampled as `projection × (1 + r)` where `r` is
+drawn from the empirical distribution of relative residuals for the
+player's position, fitted from `actual_weekly` history.  Everything is held
+as (simulations × players) arrays, so league-wide win probabilities are one
+matrix product and a start/sit swap is an O(simulations) column update
+reusing the same draws (common random numbers keep the deltas stable).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+ResidualModel = dict[str, np.ndarray]  # position → pooled relative residuals
+
+_FALLBACK = "*"  # key for the all-positions pool
+
+
+# --------------------------------------------------------------------------- #
+#  Fitting
+# --------------------------------------------------------------------------- #
+def fit_residuals(
+    weekly: pd.DataFrame,
+    positions: pd.DataFrame | None = None,
+    *,
+    points_col: str = "fantasy_pts",
+    min_games: int = 4,
+    min_mean: float = 3.0,
+) -> ResidualModel:
+    """
+    Per-position pools of `pts / player_season_mean - 1`.
+
+    Parameters
+    ----------
+    weekly : DataFrame
+        Scored `actual_weekly` rows: player_id, season, week, `points_col`
+        (and `position` unless `positions` is given).
+    positions : DataFrame, optional
+        player_id → position lookup (e.g. from `ids.build_xwalk`).
+    min_games, min_mean : filters so fringe players don't dominate the tails.
+    """
+    df = weekly
+    if positions is not None:
+        df = df.merge(
+            positions[["player_id", "position"]].drop_duplicates("player_id"),
+            on="player_id",
+            how="left",
+        )
+    keys = ["player_id", "season"] if "season" in df.columns else ["player_id"]
+    grp = df.groupby(keys)[points_col]
+    mean = grp.transform("mean")
+    games = grp.transform("size")
+
+    keep = (games >= min_games) & (mean >= min_mean) & df["position"].notna()
+    resid = (df.loc[keep, points_col] / mean[keep] - 1.0).astype(np.float32)
+    pos = df.loc[keep, "position"].str.upper()
+
+    model: ResidualModel = {
+        p: np.sort(resid[pos == p].to_numpy()) for p in pos.unique()
+    }
+    model[_FALLBACK] = np.sort(resid.to_numpy())
+    return model
+
+
+def sample_points(
+    mean: np.ndarray,
+    positions: Iterable[str],
+    model: ResidualModel,
+    n_sims: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """(n_sims × players) float32 draws of weekly points around `mean`."""
+    mean = np.asarray(mean, dtype=np.float32)
+    pos = np.asarray([str(p).upper() for p in positions], dtype=object)
+    out = np.empty((n_sims, mean.size), dtype=np.float32)
+    for p in np.unique(pos):
+        cols = np.flatnonzero(pos == p)
+        pool = model.get(p, model[_FALLBACK])
+        draws = pool[rng.integers(0, pool.size, size=(n_sims, cols.size))]
+        out[:, cols] = mean[cols] * (1.0 + draws)
+    return out
+
+
+# --------------------------------------------------------------------------- #
+#  Matchups
+# --------------------------------------------------------------------------- #
+def _win_prob(ours: np.ndarray, theirs: np.ndarray) -> np.ndarray:
+    """P(ours > theirs) over axis 0, ties count half."""
+    return (ours > theirs).mean(axis=0) + 0.5 * (ours == theirs).mean(axis=0)
+
+
+class MatchupSim:
+    """
+    Simulated week for one league.
+
+    Parameters
+    ----------
+    projections : DataFrame
+        player_id, position, `points_col` for every player that may start
+        (starters *and* bench / free-agent candidates for swaps).
+    lineups : DataFrame
+        team_col, player_id, matchup_id — the current starters
+        (e.g. `lineup.optimize_lineups(...).query("starter")` or Sleeper
+        `starters` exploded).  Teams sharing a matchup_id play each other.
+    model : ResidualModel
+        From `fit_residuals`.
+    """
+
+    def __init__(
+        self,
+        projections: pd.DataFrame,
+        lineups: pd.DataFrame,
+        model: ResidualModel,
+        *,
+        n_sims: int = 10_000,
+        seed: int | None = None,
+        team_col: str = "roster_id",
+        points_col: str = "fantasy_pts",
+    ) -> None:
+        proj = projections.drop_duplicates("player_id").reset_index(drop=True)
+        self.player_ids = pd.Index(proj["player_id"])
+        self.samples = sample_points(
+            proj[points_col].fillna(0.0).to_numpy(),
+            proj["position"].fillna(""),
+            model,
+            n_sims,
+            np.random.default_rng(seed),
+        )
+
+        lu = lineups[[team_col, "player_id", "matchup_id"]]
+        teams = lu.drop_duplicates(team_col)
+        self.teams = pd.Index(teams[team_col])
+        col = self.player_ids.get_indexer(lu["player_id"])
+        row = self.teams.get_indexer(lu[team_col])
+        known = col >= 0  # unprojected starters score 0
+
+        # (players × teams) incidence → team totals in one matmul
+        inc = np.zeros((len(self.player_ids), len(self.teams)), dtype=np.float32)
+        inc[col[known], row[known]] = 1.0
+        self.totals = self.samples @ inc  # (sims × teams)
+
+        # opponent column for every team (bye weeks / odd leagues → -1)
+        self.opponent = np.full(len(self.teams), -1)
+        for _, grp in teams.groupby("matchup_id"):
+            idx = self.teams.get_indexer(grp[team_col])
+            if len(idx) == 2:
+                self.opponent[idx[0]], self.opponent[idx[1]] = idx[1], idx[0]
+
+    # ------------------------------------------------------------------ #
+    def win_probabilities(self) -> pd.DataFrame:
+        has_opp = self.opponent >= 0
+        wp = np.full(len(self.teams), np.nan)
+        opp = self.totals[:, np.where(has_opp, self.opponent, 0)]
+        wp[has_opp] = _win_prob(self.totals, opp)[has_opp]
+        return pd.DataFrame(
+            {
+                "team": self.teams,
+                "opponent": [self.teams[o] if o >= 0 else None for o in self.opponent],
+                "win_prob": wp,
+                "mean_pts": self.totals.mean(axis=0),
+                "p10": np.percentile(self.totals, 10, axis=0),
+                "p90": np.percentile(self.totals, 90, axis=0),
+            }
+        )
+
+    def swap_win_probs(
+        self, team, out_ids: Iterable[str], in_ids: Iterable[str]
+    ) -> pd.DataFrame:
+        """
+        Win probability for `team` after each (out → in) substitution,
+        evaluated together as a (sims × swaps) array on the cached draws.
+        """
+        t = self.teams.get_loc(team)
+        o = self.opponent[t]
+        if o < 0:
+            raise ValueError(f"Team {team!r} has no opponent this week")
+
+        out_ids, in_ids = list(out_ids), list(in_ids)
+        out_c = self.player_ids.get_indexer(out_ids)
+        in_c = self.player_ids.get_indexer(in_ids)
+        if (out_c < 0).any() or (in_c < 0).any():
+            missing = [p for p, c in zip(out_ids + in_ids, [*out_c, *in_c]) if c < 0]
+            raise KeyError(f"No projection for {missing}")
+
+        base = self.totals[:, [t]]
+        swapped = base - self.samples[:, out_c] + self.samples[:, in_c]
+        opp = self.totals[:, [o]]
+        before = float(_win_prob(base, opp)[0])
+        after = _win_prob(swapped, opp)
+        return pd.DataFrame(
+            {
+                "out": out_ids,
+                "in": in_ids,
+                "win_prob_before": before,
+                "win_prob_after": after,
+                "delta": after - before,
+            }
+        )
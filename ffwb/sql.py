@@ -0,0 +1,123 @@
+# ffwb/sql.py
+"""
+Ad-hoc SQL over the `data/` lake with an embedded DuckDB (the `sql` extra).
+
+Every table directory under `data/` that holds parquet files is registered
+as a view of the same name (`actual_weekly`, `totals`, `vor`, `adp`,
+`projection_weekly_tank01`, `adp_history`, …).  Views read the files in
+place with hive partitioning, so `WHERE season BETWEEN 2019 AND 2023`
+prunes `season=` directories, only referenced columns are decoded, and
+scans run on DuckDB's worker threads.  Nothing is loaded up front.
+
+    ffwb sql "SELECT v.player_id, v.season, v.vor, a.adp
+              FROM vor v JOIN adp a USING (player_id, season)
+              WHERE v.position = 'WR' AND v.season BETWEEN 2019 AND 2023
+                AND a.adp > 100
+              ORDER BY v.vor DESC LIMIT 20"
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+
+def _duckdb():
+    try:
+        import duckdb
+    except ImportError as exc:
+        raise ImportError(
+            "ffwb sql needs duckdb: pip install 'fantasy-football-workbench[sql]'"
+        ) from exc
+    return duckdb
+
+
+def _root(root: Path | str | None) -> Path:
+    from ffwb.ingest import io
+
+    return Path(root) if root is not None else io._DATA_ROOT
+
+
+def lake_tables(root: Path | str | None = None) -> dict[str, Path]:
+    """Table name → directory for every parquet table under the data root."""
+    base = _root(root)
+    if not base.exists():
+        return {}
+    return {
+        d.name: d
+        for d in sorted(base.iterdir())
+        # `_cache` etc. hold raw downloads, not tables
+        if d.is_dir() and d.name[0] not in "_." and next(d.rglob("*.parquet"), None)
+    }
+
+
+def connect(root: Path | str | None = None, *, threads: int | None = None):
+    """In-memory DuckDB connection with one view per lake table."""
+    duckdb = _duckdb()
+    con = duckdb.connect(database=":memory:")
+    if threads:
+        con.execute(f"SET threads = {int(threads)}")
+    for name, path in lake_tables(root).items():
+        glob = (path / "**" / "*.parquet").as_posix().replace("'", "''")
+        con.execute(
+            f'CREATE VIEW "{name}" AS SELECT * FROM read_parquet('
+            f"'{glob}', hive_partitioning = true, union_by_name = true)"
+        )
+    return con
+
+
+def query(sql: str, root: Path | str | None = None, *, arrow: bool = False):
+    """Run `sql` against the lake; a DataFrame (or `pa.Table` with arrow=True)."""
+    con = connect(root)
+    try:
+        rel = con.execute(sql)
+        return rel.arrow() if arrow else rel.df()
+    finally:
+        con.close()
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def sql_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb sql", description="SQL over the data/ lake (DuckDB)"
+    )
+    parser.add_argument("query", nargs="?", help="SQL text, or - to read stdin")
+    parser.add_argument("--tables", action="store_true", help="list tables")
+    parser.add_argument("--csv", action="store_true", help="print CSV")
+    parser.add_argument("--max-rows", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    if args.tables or not args.query:
+        for name, path in lake_tables().items():
+            print(f"{name}\t{path}")
+        return
+
+    text = args.query
+    if text == "-":
+        text = sys.stdin.read()
+    try:
+        out: pd.DataFrame = query(text)
+    except ImportError as exc:
+        print(f"[red]{exc}[/red]")
+        return
+    except Exception as exc:  # duckdb.Error subclasses; keep the CLI tidy
+        print(f"[red]{type(exc).__name__}: {exc}[/red]")
+        return
+
+    if args.csv:
+        out.to_csv(sys.stdout, index=False)
+        return
+    table = Table(title=f"{len(out)} rows")
+    for col in out.columns:
+        table.add_column(str(col))
+    for row in out.head(args.max_rows).itertuples(index=False):
+        table.add_row(*(f"{x:.2f}" if isinstance(x, float) else str(x) for x in row))
+    print(table)
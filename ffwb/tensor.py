@@ -0,0 +1,196 @@
+# ffwb/tensor.py
+"""
+Dense player × week × stat store for fast re-scoring.
+
+A season of `actual_weekly` is packed into one float32 array saved as .npy
+and memory-mapped on load, plus a JSON sidecar mapping row → player_id,
+column → week and depth → stat name:
+
+    data/tensor/season=2023/stats.npy
+    data/tensor/season=2023/index.json
+
+Scoring any linear rule set for any week window is then a single
+`tensordot` over the stat axis, and loading many seasons only touches the
+pages that are actually read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# identifiers, partitions and derived points: never packed as stats
+_KEYS = ("player_id", "player_key", "season", "week", "fantasy_pts")
+
+
+def _tensor_dir(season: int, data_root: Path | None = None) -> Path:
+    from ffwb.ingest import io
+
+    return (data_root or io._DATA_ROOT) / "tensor" / f"season={season}"
+
+
+# --------------------------------------------------------------------------- #
+#  Build
+# --------------------------------------------------------------------------- #
+def build_season_tensor(
+    weekly: pd.DataFrame,
+    season: int,
+    *,
+    stats: Sequence[str] | None = None,
+    data_root: Path | None = None,
+) -> Path:
+    """
+    Pack long-format weekly stats into `tensor/season=/stats.npy`.
+
+    Parameters
+    ----------
+    weekly : DataFrame
+        actual_weekly rows for one season (player_id, week, stat columns…).
+    stats : list, optional
+        Stat columns to store; default every numeric column that is not an
+        id, partition or `fantasy_pts`.
+    """
+    if stats is None:
+        stats = [
+            c
+            for c in weekly.columns
+            if c not in _KEYS and pd.api.types.is_numeric_dtype(weekly[c])
+        ]
+    stats = list(stats)
+    weekly = weekly.dropna(subset=["player_id"])
+    # hive partition columns come back categorical
+    week = weekly["week"].astype(np.int64).to_numpy()
+
+    players = pd.Index(np.sort(weekly["player_id"].astype(str).unique()))
+    weeks = np.arange(1, int(week.max()) + 1)
+
+    out_dir = _tensor_dir(season, data_root)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / "stats.npy.tmp"
+    arr = np.lib.format.open_memmap(
+        tmp, mode="w+", dtype=np.float32, shape=(len(players), len(weeks), len(stats))
+    )
+    arr[:] = 0.0
+
+    p = players.get_indexer(weekly["player_id"].astype(str))
+    w = week - 1
+    vals = weekly[stats].fillna(0).to_numpy(dtype=np.float32)
+    np.add.at(arr, (p, w), vals)  # duplicate rows (split stints) accumulate
+    arr.flush()
+    del arr
+
+    index = {"player_ids": players.tolist(), "weeks": weeks.tolist(), "stats": stats}
+    tmp_index = out_dir / "index.json.tmp"
+    tmp_index.write_text(json.dumps(index))
+    # both files are complete before either is swapped in; `load` rejects
+    # a pair left mismatched by a crash between the two renames
+    tmp.replace(out_dir / "stats.npy")
+    tmp_index.replace(out_dir / "index.json")
+    return out_dir
+
+
+# --------------------------------------------------------------------------- #
+#  Load + score
+# --------------------------------------------------------------------------- #
+@dataclass
+class SeasonTensor:
+    season: int
+    data: np.ndarray  # (players, weeks, stats) float32, memory-mapped
+    player_ids: pd.Index
+    weeks: np.ndarray
+    stats: list[str]
+
+    @classmethod
+    def load(cls, season: int, data_root: Path | None = None) -> SeasonTensor:
+        path = _tensor_dir(season, data_root)
+        index = json.loads((path / "index.json").read_text())
+        data = np.load(path / "stats.npy", mmap_mode="r")
+        shape = (len(index["player_ids"]), len(index["weeks"]), len(index["stats"]))
+        if data.shape != shape:
+            raise ValueError(
+                f"{path}: stats.npy {data.shape} does not match index.json "
+                f"{shape}; rebuild with `ffwb tensor --season {season}`"
+            )
+        return cls(
+            season,
+            data,
+            pd.Index(index["player_ids"]),
+            np.asarray(index["weeks"]),
+            list(index["stats"]),
+        )
+
+    def weights(self, rules: dict[str, float]) -> np.ndarray:
+        """Rule dict → weight vector over the stat axis (missing stats → 0)."""
+        missing = sorted(set(rules) - set(self.stats))
+        if missing:
+            logger.warning(
+                "SeasonTensor: stats not stored and treated as 0 → %s",
+                ", ".join(missing),
+            )
+        return np.array([rules.get(s, 0.0) for s in self.stats], dtype=np.float32)
+
+    def _week_slice(self, weeks: tuple[int, int] | None) -> slice:
+        if weeks is None:
+            return slice(None)
+        lo, hi = weeks
+        return slice(max(lo, 1) - 1, hi)
+
+    def score(
+        self, rules: dict[str, float], weeks: tuple[int, int] | None = None
+    ) -> np.ndarray:
+        """(players × weeks) fantasy points for an inclusive week window."""
+        block = self.data[:, self._week_slice(weeks), :]
+        return np.tensordot(block, self.weights(rules), axes=([2], [0]))
+
+    def season_totals(
+        self, rules: dict[str, float], weeks: tuple[int, int] | None = None
+    ) -> pd.DataFrame:
+        """Same columns as `scoring.aggregate_season` output."""
+        block = self.data[:, self._week_slice(weeks), :]
+        totals = np.tensordot(block.sum(axis=1), self.weights(rules), axes=1)
+        return pd.DataFrame(
+            {
+                "player_id": self.player_ids,
+                "season": self.season,
+                "fantasy_pts_season": totals.astype(np.float32),
+            }
+        )
+
+
+def load_seasons(
+    seasons: Sequence[int], data_root: Path | None = None
+) -> dict[int, SeasonTensor]:
+    """Memory-map several seasons at once (no data is read until scored)."""
+    return {s: SeasonTensor.load(s, data_root) for s in seasons}
+
+
+# --------------------------------------------------------------------------- #
+#  CLI
+# --------------------------------------------------------------------------- #
+def tensor_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb tensor", description="Pack actual_weekly into tensor stores"
+    )
+    parser.add_argument("--season", type=int, nargs="+", required=True)
+    args = parser.parse_args(argv)
+
+    from rich import print
+
+    from ffwb.ingest import io
+
+    for season in args.season:
+        path = io._DATA_ROOT / "actual_weekly" / f"season={season}"
+        if not path.exists():
+            print(f"[red]No weekly stats found at {path}[/red]")
+            continue
+        out = build_season_tensor(pd.read_parquet(path), season)
+        print(f"[green]Wrote {out / 'stats.npy'}[/green]")
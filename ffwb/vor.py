@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+
+from ffwb import arrow_ops
+from ffwb.ingest.registry import has_keys, key_join
+from ffwb.scoring import _check_backend
 
 
 # --------------------------------------------------------------------------- #
@@ -12,10 +17,15 @@ def compute_replacement(
     roster_settings: dict[str, int],
     *,
     num_teams: int,
-) -> pd.DataFrame:
+    backend: str = "pandas",
+) -> pd.DataFrame | pa.Table:
     """
     One row per position with the season‑long replacement‑level points.
     """
+    if _check_backend(backend) == "arrow":
+        return arrow_ops.compute_replacement(
+            arrow_ops.as_table(totals), roster_settings, num_teams=num_teams
+        )
     reps = []
     for pos_raw, starters in roster_settings.items():
         pos = pos_raw.upper()  # ▲ normalize once
@@ -43,12 +53,23 @@ def compute_vor(
     num_teams: int,
     tier_method: str = "quantile",  # "quantile" or "fixed"
     q: float = 0.2,
-) -> pd.DataFrame:
+    backend: str = "pandas",
+) -> pd.DataFrame | pa.Table:
     """
     Adds two columns to `totals`:
       • vor   –– points above position‑specific replacement
       • tier  –– tier number (1 = best)
+
+    backend="arrow" takes/returns a `pa.Table` (rows keep their order).
     """
+    if _check_backend(backend) == "arrow":
+        return arrow_ops.compute_vor(
+            arrow_ops.as_table(totals),
+            roster_settings,
+            num_teams=num_teams,
+            tier_method=tier_method,
+            q=q,
+        )
     rep = compute_replacement(totals, roster_settings, num_teams=num_teams)
     merged = totals.merge(rep, on="position", how="left")
     merged["vor"] = merged["fantasy_pts_season"] - merged["replacement_pts"]
@@ -100,58 +121,46 @@ def compute_vor(
     return merged
 
 
+# legacy column names still found in hand-made ADP files
+ADP_ALIASES = {"adp_mean": "adp", "avg_pick": "adp", "adp_std": "adp_stdev"}
+ADP_COLS = ["adp", "adp_stdev", "n_sources"]
+
+
 def attach_adp(
     vor_df: pd.DataFrame,
     adp_df: pd.DataFrame,
 ) -> pd.DataFrame:
     """
     Join ADP onto VOR and compute 'value_vs_adp'.
-    This will auto-detect whichever ADP column you have (e.g. 'adp_mean', 'avg_pick', etc.)
-    and any stdev column (e.g. 'adp_std', 'std_dev', ...). If none are found,
-    fills with NA so the merge still works.
+    Expects the `adp` table schema (adp, adp_stdev and, for the consensus
+    source, n_sources); columns that are absent are filled with NA so the
+    merge still works.
     """
-    # Make a copy so we don’t clobber the original
-    adp = adp_df.copy()
-
-    # 1) Find the ADP column
-    adp_cols = [
-        c for c in adp.columns if "adp" in c.lower() and c.lower() not in ("adp_stdev",)
-    ]
-    if "adp" in adp.columns:
-        adp_col = "adp"
-    elif adp_cols:
-        # pick the first matching column (e.g. 'adp_mean' or 'avg_pick')
-        adp_col = adp_cols[0]
-        adp = adp.rename(columns={adp_col: "adp"})
+    # first alias present wins per target; later ones are left as they are
+    rename: dict[str, str] = {}
+    for alias, target in ADP_ALIASES.items():
+        if (
+            alias in adp_df.columns
+            and target not in adp_df.columns
+            and target not in rename.values()
+        ):
+            rename[alias] = target
+    adp = adp_df.rename(columns=rename)
+    for col in ["player_id", *ADP_COLS]:
+        if col not in adp.columns:
+            adp[col] = pd.NA
+
+    # Join (integer key lookup when both sides carry player_key)
+    if has_keys(vor_df, adp):
+        merged = key_join(vor_df, adp, ADP_COLS)
     else:
-        adp_col = None
-
-    # 2) Find the ADP-stdev column
-    stdev_cols = [
-        c for c in adp.columns if any(x in c.lower() for x in ("stdev", "std", "dev"))
-    ]
-    if "adp_stdev" in adp.columns:
-        stdev_col = "adp_stdev"
-    elif stdev_cols:
-        stdev_col = stdev_cols[0]
-        adp = adp.rename(columns={stdev_col: "adp_stdev"})
-    else:
-        stdev_col = None
-
-    # 3) Ensure we have the columns (or create them)
-    if adp_col is None:
-        adp["adp"] = pd.NA
-    if stdev_col is None:
-        adp["adp_stdev"] = pd.NA
-
-    # 4) Now do the merge
-    merged = vor_df.merge(
-        adp[["player_id", "adp", "adp_stdev"]],
-        on="player_id",
-        how="left",
-    )
+        merged = vor_df.merge(
+            adp[["player_id", *ADP_COLS]],
+            on="player_id",
+            how="left",
+        )
 
-    # 5) Compute value_vs_adp if possible
+    # Compute value_vs_adp if possible
     merged["value_vs_adp"] = np.where(
         merged["adp"].notna() & (merged["adp"] != 0),
         merged["vor"] / merged["adp"],
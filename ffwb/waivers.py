@@ -0,0 +1,288 @@
+# ffwb/waivers.py
+"""
+League-wide waiver and trade evaluation on top of the lineup kernel.
+
+A player's worth to a team is the change in that team's *optimal lineup*
+points, not their own projection: a WR4 is worth nothing to a team whose
+WR/FLEX slots are already filled by better players.  Rosters are packed
+into a (teams × periods × roster spots) array and every (team, candidate)
+pair becomes one extra row of a single batched `lineup.optimal_lineup`
+call — the candidate sits in one appended roster spot — so a whole
+league's waiver report is a handful of array operations.
+
+"Periods" are one or more point columns (e.g. one per remaining week from
+`ros.RestOfSeason`, so byes are respected); the lineup is solved per
+period and summed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from ffwb.lineup import SLOTS, explode_roster_weekly, optimal_lineup, position_codes
+
+# cap on floats per kernel call; candidates are processed in chunks
+_BATCH_CELLS = 4_000_000
+
+
+def _pack(
+    rosters: pd.DataFrame,
+    values: pd.DataFrame,
+    points_cols: list[str],
+    team_col: str,
+) -> tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rosters → (teams, ids (T, N) object, pts (T, K, N), pos (T, N)).
+    Empty spots are NaN / -1; rostered players without values score 0.
+    """
+    df = rosters[[team_col, "player_id"]].merge(
+        values[["player_id", "position", *points_cols]],
+        on="player_id",
+        how="left",
+    )
+    df[points_cols] = df[points_cols].fillna(0.0)
+
+    teams = pd.Index(pd.unique(df[team_col]))
+    team = teams.get_indexer(df[team_col])
+    spot = df.groupby(team_col, sort=False).cumcount().to_numpy()
+    width = int(spot.max()) + 1 if len(df) else 0
+
+    ids = np.full((len(teams), width), None, dtype=object)
+    pts = np.full((len(teams), len(points_cols), width), np.nan)
+    pos = np.full((len(teams), width), -1, dtype=np.int8)
+    ids[team, spot] = df["player_id"].to_numpy(dtype=object)
+    pts[team, :, spot] = df[points_cols].to_numpy(dtype=np.float64)
+    pos[team, spot] = position_codes(df["position"])
+    return teams, ids, pts, pos
+
+
+def _lineup_pts(pts: np.ndarray, pos: np.ndarray, slots: dict[str, int]) -> np.ndarray:
+    """Optimal lineup points summed over periods: (..., K, N) → (...)."""
+    total, _ = optimal_lineup(pts, pos[..., None, :], slots)
+    return total.sum(axis=-1)
+
+
+def _prepare(values: pd.DataFrame, points_cols: str | Sequence[str]) -> list[str]:
+    cols = [points_cols] if isinstance(points_cols, str) else list(points_cols)
+    missing = {"player_id", "position", *cols} - set(values.columns)
+    if missing:
+        raise KeyError(f"values missing columns {sorted(missing)}")
+    return cols
+
+
+# --------------------------------------------------------------------------- #
+#  Waivers
+# --------------------------------------------------------------------------- #
+def waiver_report(
+    rosters: pd.DataFrame,
+    values: pd.DataFrame,
+    slots: dict[str, int] | None = None,
+    *,
+    team_col: str = "roster_id",
+    points_cols: str | Sequence[str] = "fantasy_pts_season",
+    free_agents: pd.DataFrame | None = None,
+    top: int | None = None,
+) -> pd.DataFrame:
+    """
+    Lineup gain of adding each free agent to each team of one league.
+
+    Parameters
+    ----------
+    rosters : DataFrame
+        Long format: `team_col`, player_id (see `lineup.explode_roster_weekly`).
+    values : DataFrame
+        player_id, position and `points_cols` (same id scheme as rosters).
+    free_agents : DataFrame, optional
+        Candidate rows of `values`; default every unrostered player.
+    top : int, optional
+        Keep only the best `top` candidates per team.
+
+    Returns
+    -------
+    DataFrame
+        team_col, player_id, position, `gain` (lineup points added; the
+        dropped player is the team's worst bench spot, which costs nothing)
+        and `rank` within the team, sorted by team then rank.
+    """
+    slots = SLOTS if slots is None else slots
+    cols = _prepare(values, points_cols)
+    if free_agents is None:
+        free_agents = values.loc[~values["player_id"].isin(rosters["player_id"])]
+    fa = free_agents.drop_duplicates("player_id")
+    fa = fa.loc[position_codes(fa["position"]) >= 0].reset_index(drop=True)
+
+    teams, _, pts, pos = _pack(rosters, values, cols, team_col)
+    n_teams, n_per, width = pts.shape
+    base = _lineup_pts(pts, pos, slots)  # (T,)
+
+    cand_pts = fa[cols].fillna(0.0).to_numpy(dtype=np.float64)  # (C, K)
+    cand_pos = position_codes(fa["position"])  # (C,)
+    gain = np.empty((n_teams, len(fa)))
+    step = max(1, _BATCH_CELLS // max(1, n_teams * n_per * (width + 1)))
+    for lo in range(0, len(fa), step):
+        hi = min(lo + step, len(fa))
+        c = hi - lo
+        # (T, c, K, N+1): every team's roster plus candidate j in the last spot
+        p = np.empty((n_teams, c, n_per, width + 1))
+        p[..., :width] = pts[:, None]
+        p[..., width] = cand_pts[None, lo:hi]
+        q = np.empty((n_teams, c, width + 1), dtype=np.int8)
+        q[..., :width] = pos[:, None]
+        q[..., width] = cand_pos[None, lo:hi]
+        gain[:, lo:hi] = _lineup_pts(p, q, slots) - base[:, None]
+
+    out = pd.DataFrame(
+        {
+            team_col: np.repeat(teams.to_numpy(), len(fa)),
+            "player_id": np.tile(fa["player_id"].to_numpy(), n_teams),
+            "position": np.tile(fa["position"].to_numpy(), n_teams),
+            "gain": gain.ravel(),
+        }
+    )
+    if "full_name" in fa.columns:
+        out.insert(2, "full_name", np.tile(fa["full_name"].to_numpy(), n_teams))
+    out = out.sort_values([team_col, "gain"], ascending=[True, False], kind="stable")
+    out["rank"] = out.groupby(team_col, sort=False).cumcount() + 1
+    if top:
+        out = out[out["rank"] <= top]
+    return out.reset_index(drop=True)
+
+
+# --------------------------------------------------------------------------- #
+#  Trades
+# --------------------------------------------------------------------------- #
+def evaluate_trades(
+    rosters: pd.DataFrame,
+    values: pd.DataFrame,
+    trades: pd.DataFrame,
+    slots: dict[str, int] | None = None,
+    *,
+    team_col: str = "roster_id",
+    points_cols: str | Sequence[str] = "fantasy_pts_season",
+) -> pd.DataFrame:
+    """
+    Lineup points before/after for both sides of each proposed trade.
+
+    `trades` has columns team_a, team_b, give (ids team_a sends) and
+    receive (ids team_b sends).  All post-trade rosters are solved in one
+    kernel call.  Adds pts_a, pts_b (before), delta_a, delta_b.
+    """
+    slots = SLOTS if slots is None else slots
+    cols = _prepare(values, points_cols)
+    teams, ids, pts, pos = _pack(rosters, values, cols, team_col)
+    base = _lineup_pts(pts, pos, slots)
+
+    lookup = values.drop_duplicates("player_id").set_index("player_id")
+    n = len(trades)
+    extra = max(
+        [len(g) for g in trades["give"]] + [len(r) for r in trades["receive"]] + [0]
+    )
+    width = ids.shape[1] + extra
+    # row 2i = team_a after trade i, row 2i+1 = team_b after trade i
+    p = np.full((2 * n, len(cols), width), np.nan)
+    q = np.full((2 * n, width), -1, dtype=np.int8)
+    rows = np.empty(2 * n, dtype=np.intp)
+    for i, t in enumerate(trades.itertuples(index=False)):
+        for j, (team, out_ids, in_ids) in enumerate(
+            ((t.team_a, t.give, t.receive), (t.team_b, t.receive, t.give))
+        ):
+            r = teams.get_loc(team)
+            k = 2 * i + j
+            rows[k] = r
+            keep = ~np.isin(ids[r], list(out_ids))
+            p[k, :, : ids.shape[1]] = np.where(keep, pts[r], np.nan)
+            q[k, : ids.shape[1]] = np.where(keep, pos[r], -1)
+            incoming = lookup.reindex(list(in_ids))
+            m = ids.shape[1]
+            p[k, :, m : m + len(in_ids)] = incoming[cols].fillna(0.0).to_numpy().T
+            q[k, m : m + len(in_ids)] = position_codes(incoming["position"])
+
+    after = _lineup_pts(p, q, slots).reshape(n, 2)
+    before = base[rows].reshape(n, 2)
+    out = trades.copy()
+    out["pts_a"], out["pts_b"] = before[:, 0], before[:, 1]
+    out["delta_a"], out["delta_b"] = (
+        after[:, 0] - before[:, 0],
+        after[:, 1] - before[:, 1],
+    )
+    return out
+
+
+# --------------------------------------------------------------------------- #
+#  Stored data → report
+# --------------------------------------------------------------------------- #
+def ros_values(season: int, start_week: int) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Remaining-week projections keyed by Sleeper id (the roster id scheme):
+    one `wk{n}` column per week ≥ `start_week`.
+    """
+    from ffwb.ingest import io
+    from ffwb.ros import refresh_ros
+
+    state = refresh_ros(season)
+    w = max(start_week, 1) - 1
+    cols = [f"wk{k + 1}" for k in range(w, state.pts.shape[1])]
+    df = pd.DataFrame(state.pts[:, w:], columns=cols)
+    df.insert(0, "tank_id", state.player_ids.to_numpy())
+    df.insert(1, "position", state.position)
+    df.insert(2, "full_name", state.full_name)
+
+    root = io._DATA_ROOT / "projection_weekly_tank01" / f"season={season}"
+    xwalk = (
+        pd.read_parquet(root, columns=["player_id", "sleeper_id"])
+        .query("sleeper_id != ''")
+        .drop_duplicates("player_id")
+        .rename(columns={"player_id": "tank_id", "sleeper_id": "player_id"})
+    )
+    df = df.merge(xwalk, on="tank_id", how="inner").drop(columns="tank_id")
+    return df.drop_duplicates("player_id"), cols
+
+
+def _league_rosters(league_id: str, week: int | None) -> pd.DataFrame:
+    from ffwb.ingest import io
+
+    raw = pd.read_parquet(
+        io._DATA_ROOT / "roster_weekly", filters=[("league_id", "==", league_id)]
+    )
+    if raw.empty:
+        raise FileNotFoundError(f"No roster_weekly rows for league {league_id}")
+    raw["week"] = raw["week"].astype(int)
+    raw = raw[raw["week"] == (week if week is not None else raw["week"].max())]
+    return explode_roster_weekly(raw).astype({"player_id": str})
+
+
+def waivers_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ffwb waivers",
+        description="Rank free agents by rest-of-season lineup gain per team",
+    )
+    parser.add_argument("--league-id", required=True)
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--week", type=int, required=True, help="first week counted")
+    parser.add_argument("--roster-week", type=int, help="default: latest stored")
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    from rich import print
+    from rich.table import Table
+
+    try:
+        rosters = _league_rosters(args.league_id, args.roster_week)
+        values, cols = ros_values(args.season, args.week)
+    except FileNotFoundError as e:
+        print(f"[red]{e}[/red]")
+        return
+
+    report = waiver_report(rosters, values, points_cols=cols, top=args.top)
+    table = Table(title=f"Waiver gains, weeks {args.week}+ (league {args.league_id})")
+    for col in ("roster_id", "rank", "full_name", "position", "gain"):
+        table.add_column(col.replace("_", " ").title())
+    for r in report.itertuples(index=False):
+        table.add_row(
+            str(r.roster_id), str(r.rank), str(r.full_name), r.position, f"{r.gain:.1f}"
+        )
+    print(table)
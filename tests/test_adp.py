@@ -14,3 +14,66 @@ def test_fantasypros_adp(monkeypatch, tmp_path):
         pytest.skip("FantasyPros feed unavailable; skipped ADP ingest test.")
     else:
         assert not df.empty and "player_id" in df.columns
+
+
+def test_consensus_adp_weighted_mean_and_spread():
+    import numpy as np
+    import pandas as pd
+
+    from ffwb.ingest.adp import consensus_adp
+    from ffwb.vor import attach_adp
+
+    def frame(ids, adp, stdev=None):
+        return pd.DataFrame(
+            {
+                "player_id": ids,
+                "position": "RB",
+                "adp": adp,
+                "adp_stdev": np.nan if stdev is None else stdev,
+            }
+        )
+
+    frames = {
+        "fantasypros": frame(["a", "b", "c"], [1.0, 5.0, 30.0]),
+        "underdog": frame(["a", "b"], [3.0, 7.0]),
+        "ffc": frame(["a", "d"], [2.0, 40.0], [1.0, 4.0]),
+    }
+    out = consensus_adp(frames, {"fantasypros": 1.0, "underdog": 1.0, "ffc": 2.0})
+    out = out.set_index("player_id")
+
+    # a: weights 1, 1, 2 → mean 2.0; variance (1 + 1 + 2·1²)/4 = 1
+    assert out.loc["a", "adp"] == 2.0
+    assert np.isclose(out.loc["a", "adp_stdev"], 1.0)
+    assert out.loc["a", "n_sources"] == 3
+    assert np.isclose(out.loc["b", "adp_stdev"], 1.0)
+    assert np.isnan(out.loc["c", "adp_stdev"])  # one source, no own stdev
+    assert out.loc["d", "adp_stdev"] == 4.0
+
+    vor_df = pd.DataFrame({"player_id": ["a", "c", "z"], "vor": [10.0, 5.0, 1.0]})
+    board = attach_adp(vor_df, out.reset_index())
+    assert board["n_sources"].tolist()[:2] == [3, 1]
+    assert pd.isna(board["adp"].iloc[2])
+
+
+def test_failed_adp_write_keeps_previous_board(monkeypatch, tmp_path):
+    import pandas as pd
+
+    from ffwb.ingest import adp as adp_mod
+    from ffwb.ingest import io
+
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    board = pd.DataFrame({"player_id": ["a"], "position": ["RB"], "adp": [1.5]})
+    monkeypatch.setattr(adp_mod, "_load_source", lambda *a: board.copy())
+    monkeypatch.setattr(adp_mod, "_map_to_players", lambda df, season: df)
+    ingest_adp(2024, source="ffc")
+    part = tmp_path / "adp" / "season=2024" / "source=ffc"
+    before = sorted(p.name for p in part.iterdir())
+
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(io, "to_parquet", boom)
+    with pytest.raises(OSError):
+        ingest_adp(2024, source="ffc")
+    assert sorted(p.name for p in part.iterdir()) == before
+    assert pd.read_parquet(part)["adp"].tolist() == [1.5]
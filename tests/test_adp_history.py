@@ -0,0 +1,56 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from ffwb.ingest import adp_history, io
+
+
+def _board(shift):
+    ids = [f"p{i}" for i in range(300)]
+    adp = np.arange(1, 301) + np.asarray(shift, dtype=float)
+    return pd.DataFrame(
+        {"player_id": ids, "position": "WR", "adp": adp, "adp_stdev": 2.5}
+    )
+
+
+def test_snapshots_movers_and_series(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    start = dt.date(2024, 8, 1)
+    for d in range(10):
+        shift = np.zeros(300)
+        shift[5] = -0.5 * d  # p5 rising
+        shift[7] = 0.75 * d  # p7 falling
+        adp_history.snapshot_adp(
+            _board(shift), 2024, "ffc", date=start + dt.timedelta(days=d)
+        )
+    # same-day rerun replaces that day's file
+    path = adp_history.snapshot_adp(_board(0), 2024, "ffc", date=start)
+    assert len(adp_history.snapshot_dates(2024, "ffc")) == 10
+    meta = pq.ParquetFile(path).metadata.row_group(0)
+    assert "DELTA_BINARY_PACKED" in meta.column(2).encodings
+
+    movers = adp_history.adp_movers(
+        2024, "ffc", days=7, as_of=start + dt.timedelta(days=9)
+    )
+    assert movers.attrs["then"] == start + dt.timedelta(days=2)
+    assert movers.iloc[0]["player_id"] == "p5"
+    assert movers.iloc[0]["change"] == pytest.approx(3.5)
+    assert movers.iloc[-1]["player_id"] == "p7"
+
+    series = adp_history.adp_series(
+        ["p5", "p7"], 2024, "ffc", start="2024-08-03", end="2024-08-05"
+    )
+    assert series.shape == (3, 2)
+    assert series["p7"].tolist() == [8 + 1.5, 8 + 2.25, 8 + 3.0]
+
+
+def test_missing_position_is_not_stored_as_nan(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    board = _board(0).astype({"position": object})
+    board.loc[3, "position"] = None
+    path = adp_history.snapshot_adp(board, 2024, "ffc", date="2024-08-01")
+    positions = set(pq.read_table(path).column("position").to_pylist())
+    assert positions == {"WR", ""}
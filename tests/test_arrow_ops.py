@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from ffwb.ingest import io
+from ffwb.rules import compile_rules
+from ffwb.scoring import aggregate_season, score_weekly
+from ffwb.vor import compute_vor
+
+RULES = compile_rules(
+    {
+        "linear": {"pass_yds": 0.04, "pass_tds": 4, "rec_rec": 0.5, "rec_yds": 0.1},
+        "bonuses": [{"stat": ["rec_yds", "rush_yds"], "at": 100, "points": 2}],
+        "tiers": [{"stat": "rush_yds", "lo": 0, "hi": 50, "weight": 0.1}],
+        "position": {"TE": {"rec_rec": 0.5}},
+    }
+)
+SETTINGS = {"qb": 1, "rb": 2, "wr": 2, "te": 1}
+
+
+def _weekly(n_players=400, seed=0):
+    rng = np.random.default_rng(seed)
+    pos = rng.choice(["QB", "RB", "WR", "TE", "K"], n_players)
+    df = pd.DataFrame(
+        {
+            "player_id": np.repeat([f"p{i}" for i in range(n_players)], 17),
+            "season": np.int16(2023),
+            "week": np.tile(np.arange(1, 18, dtype=np.int8), n_players),
+            "position": np.repeat(pos, 17),
+        }
+    )
+    for col in ("pass_yds", "pass_tds", "rec_rec", "rec_yds", "rush_yds"):
+        df[col] = rng.poisson(20, len(df)).astype(float)
+    df.loc[::7, "rec_yds"] = np.nan
+    return df
+
+
+def test_arrow_backend_matches_pandas():
+    weekly = _weekly()
+    scored = score_weekly(weekly, RULES)
+    scored_a = score_weekly(pa.Table.from_pandas(weekly), RULES, backend="arrow")
+    assert isinstance(scored_a, pa.Table)
+    assert np.allclose(scored_a.column("fantasy_pts").to_numpy(), scored["fantasy_pts"])
+
+    totals = aggregate_season(scored)
+    totals_a = aggregate_season(scored_a, backend="arrow").to_pandas()
+    pd.testing.assert_frame_equal(
+        totals_a, totals, check_dtype=False, check_exact=False
+    )
+
+    totals = totals.merge(weekly[["player_id", "position"]].drop_duplicates())
+    rostered = totals[totals["position"] != "K"]  # pandas "fixed" can't tier NaN
+    for method, q, df in (("quantile", 0.2, totals), ("fixed", 20.0, rostered)):
+        expect = compute_vor(df, SETTINGS, num_teams=12, tier_method=method, q=q)
+        got = compute_vor(
+            pa.Table.from_pandas(df),
+            SETTINGS,
+            num_teams=12,
+            tier_method=method,
+            q=q,
+            backend="arrow",
+        ).to_pandas()
+        assert np.allclose(got["vor"], expect["vor"], equal_nan=True)
+        assert (got["tier"].to_numpy() == expect["tier"].to_numpy()).all()
+
+    with pytest.raises(ValueError):
+        aggregate_season(scored, backend="polars")
+
+
+def test_read_table_pushes_down_season(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    weekly = pd.concat([_weekly(20), _weekly(20).assign(season=np.int16(2024))])
+    io.to_parquet(weekly, "actual_weekly", partition_cols=["season", "week"])
+
+    tbl = io.read_table("actual_weekly", season=2024, columns=["player_id", "season"])
+    assert tbl.num_rows == 20 * 17
+    assert tbl.schema.field("season").type == pa.int16()
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from ffwb.backtest import (
+    STRATEGIES,
+    backtest,
+    build_inputs,
+    simulate_draft,
+    summarize,
+)
+
+
+def _lake(root, season=2023, n=240):
+    rng = np.random.default_rng(season)
+    ids = [f"p{i}" for i in range(n)]
+    pos = np.tile(["QB", "RB", "RB", "WR", "WR", "TE"], n // 6)
+    talent = rng.gamma(2.0, 4.0, size=n)
+
+    adp = pd.DataFrame({"player_id": ids, "position": pos})
+    adp["adp"] = pd.Series(-talent + rng.normal(0, 1, n)).rank().to_numpy()
+    board = pd.DataFrame({"player_id": ids, "position": pos, "vor": talent - 5})
+    weekly = pd.DataFrame(
+        {
+            "player_id": np.repeat(ids, 17),
+            "week": np.tile(np.arange(1, 18), n),
+            "fantasy_pts": np.repeat(talent, 17) * rng.uniform(0.5, 1.5, n * 17),
+        }
+    )
+
+    for rel, df in [
+        (f"adp/season={season}/source=ffc", adp),
+        (f"vor/season={season - 1}", board),
+        (f"actual_weekly/season={season}", weekly),
+    ]:
+        (root / rel).mkdir(parents=True)
+        df.to_parquet(root / rel / "part.parquet")
+
+
+def test_backtest_runs_strategies_in_process_pool(tmp_path):
+    _lake(tmp_path)
+    results = backtest(
+        [2023], ["best_vor", "zero_rb"], teams=4, data_root=tmp_path, jobs=2
+    )
+    assert len(results) == 2 * 4
+    assert results["rank"].between(1, 4).all()
+
+    summary = summarize(results)
+    assert set(summary["strategy"]) == {"best_vor", "zero_rb"}
+    assert (summary["drafts"] == 4).all()
+
+
+def test_draft_with_fewer_adp_players_than_picks_has_unique_picks():
+    ids = [f"p{i}" for i in range(40)]
+    pos = np.tile(["QB", "RB", "RB", "WR", "WR", "TE", "RB", "WR"], 5)
+    board = pd.DataFrame({"player_id": ids, "position": pos, "vor": np.arange(40.0)})
+    adp = board.iloc[:20].assign(adp=np.arange(1.0, 21.0))[
+        ["player_id", "position", "adp"]
+    ]
+    weekly = pd.DataFrame({"player_id": ids, "week": 1, "fantasy_pts": 1.0})
+    inp = build_inputs(2023, adp, board, weekly)
+
+    for name, strategy in STRATEGIES.items():
+        rosters = simulate_draft(inp, strategy, slot=0, teams=4, rounds=8)
+        picks = rosters[rosters >= 0]
+        assert len(picks) == 32, name
+        assert len(np.unique(picks)) == len(picks), name
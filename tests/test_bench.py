@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from ffwb.bench import generators, suite
+from ffwb.ingest import io
+
+
+def test_generators_are_seeded_and_scaled():
+    a = generators.make_weekly(2, players=60, seed=7)
+    b = generators.make_weekly(2, players=60, seed=7)
+    pd.testing.assert_frame_equal(a, b)
+    assert not a.equals(generators.make_weekly(2, players=60, seed=8))
+
+    n_players = a["player_id"].nunique()
+    assert len(a) == n_players * generators.WEEKS * 2
+    assert sorted(a["season"].unique()) == [2000, 2001]
+    assert set(generators.positions(a)["position"]) == set(generators.POSITION_COUNTS)
+    # kickers score nothing from yardage stats
+    kickers = generators.positions(a).query("position == 'K'")["player_id"]
+    assert a.loc[a["player_id"].isin(kickers), "pass_yds"].eq(0).all()
+
+    totals = generators.make_totals(1, players=60)
+    adp = generators.make_adp(totals)
+    assert len(adp) == len(totals) and adp["adp"].gt(0).all()
+
+    rosters = generators.make_rosters(generators.player_pool(), leagues=2)
+    assert len(rosters) == 2 * 12 * 16
+    assert not rosters.duplicated(["league_id", "player_id"]).any()
+
+
+def _result(**medians):
+    return {
+        "results": {k: {"median_s": v} for k, v in medians.items() if v is not None}
+    }
+
+
+def test_compare_flags_regressions_and_changes():
+    base = _result(**{"a@1x": 1.0, "b@1x": 1.0, "c@1x": 1.0, "gone@1x": 1.0})
+    cur = _result(**{"a@1x": 1.5, "b@1x": 0.5, "c@1x": 1.1, "tiny@1x": 1e-4})
+    status = suite.compare(base, cur, threshold=0.2).set_index("case")["status"]
+    assert status.to_dict() == {
+        "a@1x": "regression",
+        "b@1x": "improved",
+        "c@1x": "ok",
+        "gone@1x": "missing",
+        "tiny@1x": "new",
+    }
+
+    # sub-millisecond cases are never flagged
+    noisy = suite.compare(_result(**{"t@1x": 1e-5}), _result(**{"t@1x": 5e-4}))
+    assert noisy["status"].tolist() == ["ok"]
+
+
+def test_run_suite_times_every_case(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    result = suite.run_suite((1,), repeat=1, players=60)
+
+    cases = {r["case"] for r in result["results"].values()}
+    assert len(cases) == 8 and {"score_weekly", "io.read_table"} <= cases
+    assert all(r["median_s"] >= 0 for r in result["results"].values())
+    assert io._DATA_ROOT == tmp_path  # scratch root is restored
+    assert not (tmp_path / "actual_weekly").exists()
+
+
+def test_compare_command_exits_nonzero_on_regression(tmp_path):
+    base = suite.save(_result(**{"a@1x": 1.0}), tmp_path / "baseline.json")
+    same = suite.save(_result(**{"a@1x": 1.05}), tmp_path / "same.json")
+    slow = suite.save(_result(**{"a@1x": 2.0}), tmp_path / "slow.json")
+
+    suite.bench_main(["compare", str(base), str(same)])  # within threshold
+    with pytest.raises(SystemExit) as exc:
+        suite.bench_main(["compare", str(base), str(slow)])
+    assert exc.value.code == 1
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from ffwb.bestball import bestball_from_pool, bestball_rosters
+from ffwb.lineup import optimal_lineup
+
+SLOTS = {"qb": 1, "rb": 2, "wr": 2, "te": 1, "flex": 1}
+
+
+def test_bestball_equals_sum_of_weekly_optimal_lineups():
+    rng = np.random.default_rng(3)
+    n_weeks, n_pool = 17, 60
+    pool_pos = np.tile([0, 1, 1, 2, 2, 3], n_pool // 6).astype(np.int8)
+    pts = rng.gamma(2.0, 5.0, size=(n_weeks, n_pool)).astype(np.float32)
+    rosters = np.stack([rng.choice(n_pool, 12, replace=False) for _ in range(8)])
+    rosters[0, -2:] = -1  # short roster padding
+
+    got = bestball_from_pool(pts, pool_pos, rosters, SLOTS)
+
+    for r, roster in enumerate(rosters):
+        keep = roster[roster >= 0]
+        expect = sum(
+            optimal_lineup(pts[w, keep], pool_pos[keep], SLOTS)[0]
+            for w in range(n_weeks)
+        )
+        assert np.isclose(got[r], expect, rtol=1e-5)
+
+    sims = bestball_from_pool(np.stack([pts, pts * 2]), pool_pos, rosters, SLOTS)
+    assert sims.shape == (2, 8)
+    assert np.allclose(sims[1], 2 * got, rtol=1e-5)
+
+
+def test_bestball_rosters_frame():
+    weekly = pd.DataFrame(
+        {
+            "player_id": ["q", "r", "q", "r", "r2"],
+            "week": [1, 1, 2, 2, 2],
+            "fantasy_pts": [20.0, 10.0, 15.0, 4.0, 9.0],
+        }
+    )
+    positions = pd.DataFrame(
+        {"player_id": ["q", "r", "r2"], "position": ["QB", "RB", "RB"]}
+    )
+    rosters = pd.DataFrame({"roster_id": [1, 1, 1], "player_id": ["q", "r", "r2"]})
+    out = bestball_rosters(rosters, weekly, positions, {"qb": 1, "rb": 1})
+    assert out.loc[0, "bb_pts"] == 20 + 10 + 15 + 9
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+# `ffwb --help` must not pay for the data stack
+HEAVY = ("pandas", "pyarrow", "numpy", "rich", "nfl_data_py", "dotenv")
+IMPORT_BUDGET_MS = 50
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_help_imports_no_heavy_modules():
+    proc = _run(
+        "import sys\n"
+        "from ffwb.cli import main\n"
+        "try:\n    main(['--help'])\nexcept SystemExit:\n    pass\n"
+        f"print('heavy=' + ','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    assert "<command>" in proc.stdout
+    assert proc.stdout.strip().splitlines()[-1] == "heavy="
+
+
+def test_cli_import_time_budget():
+    proc = _run("import ffwb.cli")
+    # -X importtime: "import time: self [us] | cumulative | name"
+    line = next(ln for ln in proc.stderr.splitlines() if ln.endswith("| ffwb.cli"))
+    cumulative_us = int(line.split("|")[1])
+    assert cumulative_us / 1000 < IMPORT_BUDGET_MS
+
+
+def test_ingest_package_is_lazy():
+    proc = _run(
+        "import sys, ffwb.ingest\n"
+        "print('ffwb.ingest.nflfast' in sys.modules, 'nfl_data_py' in sys.modules)"
+    )
+    assert proc.stdout.split() == ["False", "False"]
+
+
+def test_legacy_flags_run_the_board(monkeypatch):
+    from ffwb import cli
+
+    seen = []
+    monkeypatch.setenv("FFWB_METRICS", "0")
+    monkeypatch.setattr("ffwb.cli_board.draft_board", seen.append)
+    assert cli.main(["--season", "2024", "--teams", "10"]) == 0
+    assert seen == [["--season", "2024", "--teams", "10"]]
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ffwb.features import build_features, update_features, write_features
+from ffwb.ingest import io
+
+STATS = ["rush_yds", "rec_rec"]
+
+
+def _weekly(rng, weeks=range(1, 9)):
+    rows = [
+        (pid, season, wk)
+        for pid in ["a", "b", "c"]
+        for season in (2022, 2023)
+        for wk in weeks
+        if rng.random() > 0.2  # byes / missed games
+    ]
+    df = pd.DataFrame(rows, columns=["player_id", "season", "week"])
+    df["rush_yds"] = rng.integers(0, 120, len(df)).astype(float)
+    df["rec_rec"] = rng.integers(0, 9, len(df)).astype(float)
+    df["snaps"] = rng.integers(10, 70, len(df)).astype(float)
+    return df.sample(frac=1, random_state=0)  # order must not matter
+
+
+def test_features_match_pandas_groupby():
+    weekly = _weekly(np.random.default_rng(0))
+    got = build_features(
+        weekly, stats=STATS, windows=(3,), alphas=(0.4,), weight_col="snaps"
+    )
+
+    ref = weekly.sort_values(["player_id", "season", "week"]).reset_index(drop=True)
+    g = ref.groupby(["player_id", "season"])
+    for s in STATS:
+        roll = g[s].rolling(3, min_periods=1).mean().to_numpy()
+        ewm = g[s].transform(lambda x: x.ewm(alpha=0.4, adjust=False).mean())
+        num = (ref[s] * ref["snaps"]).groupby([ref["player_id"], ref["season"]])
+        den = ref["snaps"].groupby([ref["player_id"], ref["season"]])
+        wmean = (
+            num.rolling(3, min_periods=1).sum().to_numpy()
+            / den.rolling(3, min_periods=1).sum().to_numpy()
+        )
+        assert np.allclose(got[f"{s}_r3"], roll)
+        assert np.allclose(got[f"{s}_ewm40"], ewm)
+        assert np.allclose(got[f"{s}_w3"], wmean)
+
+
+def test_incremental_update_matches_full_build():
+    weekly = _weekly(np.random.default_rng(1), weeks=range(1, 11))
+    old, new = weekly[weekly["week"] <= 8], weekly[weekly["week"] > 8]
+    kw = dict(stats=STATS, windows=(3, 5), alphas=(0.5,))
+
+    full = build_features(weekly, **kw)
+    inc = update_features(build_features(old, **kw), old, new, **kw)
+
+    expect = full[full["week"] > 8].reset_index(drop=True)
+    pd.testing.assert_frame_equal(inc, expect, check_dtype=False)
+
+
+def test_settings_mismatch_raises_or_rebuilds(tmp_path, monkeypatch):
+    weekly = _weekly(np.random.default_rng(2), weeks=range(1, 11))
+    old, new = weekly[weekly["week"] <= 8], weekly[weekly["week"] > 8]
+    stored = build_features(old, stats=STATS, windows=(3,), alphas=(0.5,))
+    with pytest.raises(ValueError, match="missing: .*_r5"):
+        update_features(stored, old, new, stats=STATS, windows=(3, 5))
+
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    season = weekly[weekly["season"] == 2023]
+    io.to_parquet(
+        season[season["week"] <= 8], "actual_weekly", partition_cols=["season", "week"]
+    )
+    write_features(2023, stats=STATS, windows=(3,))
+    io.to_parquet(
+        season[season["week"] > 8], "actual_weekly", partition_cols=["season", "week"]
+    )
+    rows = write_features(2023, stats=STATS, windows=(3, 5))
+    assert sorted(rows["week"].unique()) == sorted(season["week"].unique())
+    assert "rush_yds_r5" in pd.read_parquet(tmp_path / "features_weekly").columns
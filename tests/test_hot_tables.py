@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from app.services import http_cache, hot_tables
+
+REL = "totals/season=2024"
+
+
+def test_export_is_mapped_and_refreshed(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(hot_tables, "DATA_DIR", tmp_path)
+    hot_tables.clear()
+    part = tmp_path / "totals" / "season=2024"
+    part.mkdir(parents=True)
+    df = pd.DataFrame({"player_id": ["a", "b"], "fantasy_pts_season": [1.0, 2.0]})
+    df.to_parquet(part / "p0.parquet")
+
+    table = hot_tables.load(REL)
+    path = hot_tables.hot_path(REL)
+    assert path.name == "totals__season=2024.arrow"
+    assert hot_tables.load(REL) is table  # same process: reused
+
+    # a new worker maps the existing file: no export, no Arrow heap allocation
+    exports = []
+    real_export = hot_tables.export
+    monkeypatch.setattr(
+        hot_tables, "export", lambda *a: exports.append(a) or real_export(*a)
+    )
+    hot_tables.clear()
+    before = pa.total_allocated_bytes()
+    mapped = hot_tables.load(REL)
+    assert pa.total_allocated_bytes() == before and not exports
+    assert mapped.to_pandas().equals(df)
+
+    # rewriting the partition invalidates the hot copy
+    df.assign(fantasy_pts_season=[5.0, 6.0]).to_parquet(part / "p0.parquet")
+    os.utime(part / "p0.parquet", ns=(1, 1))
+    out = hot_tables.load_frame(REL)
+    assert np.array_equal(out["fantasy_pts_season"], [5.0, 6.0])
+    assert len(exports) == 1 and not list(path.parent.glob("*.tmp"))
@@ -0,0 +1,66 @@
+import gzip
+
+import pandas as pd
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.services import http_cache
+
+
+def _client(tmp_path, monkeypatch, calls):
+    monkeypatch.setattr(http_cache, "DATA_DIR", tmp_path)
+    http_cache.body_cache.clear()
+    app = FastAPI()
+
+    @app.get("/page")
+    async def page(request: Request):
+        def render():
+            calls.append(1)
+            return "<table>" + "<tr><td>row</td></tr>" * 200 + "</table>"
+
+        return http_cache.cached_html(
+            request, lambda: http_cache.make_etag(["totals"], teams=12), render
+        )
+
+    return TestClient(app)
+
+
+def test_conditional_get_and_gzip(tmp_path, monkeypatch):
+    calls = []
+    client = _client(tmp_path, monkeypatch, calls)
+    (tmp_path / "totals").mkdir()
+    pd.DataFrame({"x": [1]}).to_parquet(tmp_path / "totals" / "part.parquet")
+
+    first = client.get("/page", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    etag = first.headers["etag"]
+
+    again = client.get("/page", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert len(calls) == 1  # no re-render for a matching validator
+
+    # rewriting the input partition invalidates the validator
+    pd.DataFrame({"x": [1, 2]}).to_parquet(tmp_path / "totals" / "part.parquet")
+    changed = client.get("/page", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(calls) == 2
+
+
+def test_gzip_roundtrip_body():
+    body = b"<p>hello</p>" * 200
+    assert gzip.decompress(http_cache._compress(body, "gzip")) == body
+
+
+def test_template_version_covers_base_layout(tmp_path):
+    (tmp_path / "base.html").write_text("<html>{% block content %}{% endblock %}")
+    (tmp_path / "page.html").write_text('{% extends "base.html" %}')
+    before = http_cache.template_version(tmp_path, "page.html")
+    assert before == http_cache.template_version(tmp_path, "page.html")
+
+    (tmp_path / "base.html").write_text(
+        "<html lang='en'>{% block content %}{% endblock %}"
+    )
+    assert http_cache.template_version(tmp_path, "page.html") != before
+    assert http_cache.template_version(tmp_path, "nope.html") == "missing"
@@ -0,0 +1,77 @@
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from ffwb.lineup import (
+    POS_CODE,
+    SUPERFLEX_ELIGIBLE,
+    FLEX_ELIGIBLE,
+    optimal_lineup,
+    optimize_lineups,
+    slot_names,
+)
+
+SLOTS = {"qb": 1, "rb": 2, "wr": 2, "te": 1, "flex": 1, "superflex": 1}
+
+
+def _brute_force(points, pos, slots):
+    names = slot_names(slots)
+    seats = [n for n in names for _ in range(slots[n.lower()])]
+    eligible = {
+        "FLEX": {POS_CODE[p] for p in FLEX_ELIGIBLE},
+        "SUPERFLEX": {POS_CODE[p] for p in SUPERFLEX_ELIGIBLE},
+    }
+    best = 0.0
+    n = len(points)
+    for perm in itertools.permutations(range(n), len(seats)):
+        ok = all(
+            pos[i] in eligible.get(seat, {POS_CODE.get(seat)})
+            for i, seat in zip(perm, seats)
+        )
+        if ok:
+            best = max(best, sum(points[i] for i in perm))
+    return best
+
+
+def test_optimal_lineup_matches_brute_force():
+    slots = {"qb": 1, "rb": 1, "wr": 1, "te": 1, "flex": 1, "superflex": 1}
+    rng = np.random.default_rng(7)
+    pos = np.array([0, 0, 1, 1, 2, 2, 2, 3])
+    pts = rng.gamma(2.0, 6.0, size=(6, len(pos))).round(1)
+
+    totals, slot_of = optimal_lineup(pts, pos, slots)  # one batched call
+    for row, total in zip(pts, totals):
+        assert np.isclose(total, _brute_force(row, pos, slots))
+    assert ((slot_of >= 0).sum(axis=1) == sum(slots.values())).all()
+
+
+def test_optimize_lineups_frame_and_batch_speed():
+    rng = np.random.default_rng(0)
+    positions = ["QB"] * 3 + ["RB"] * 6 + ["WR"] * 6 + ["TE"] * 3
+    n_leagues, n_teams = 50, 12
+    rosters = pd.DataFrame(
+        {
+            "league_id": np.repeat(np.arange(n_leagues), n_teams * len(positions)),
+            "roster_id": np.tile(
+                np.repeat(np.arange(n_teams), len(positions)), n_leagues
+            ),
+        }
+    )
+    rosters["player_id"] = np.arange(len(rosters)).astype(str)
+    proj = pd.DataFrame(
+        {
+            "player_id": rosters["player_id"],
+            "position": np.tile(positions, n_leagues * n_teams),
+            "fantasy_pts": rng.gamma(2.0, 6.0, size=len(rosters)),
+        }
+    )
+
+    t0 = time.perf_counter()
+    out = optimize_lineups(rosters, proj, SLOTS)
+    assert time.perf_counter() - t0 < 1.0
+
+    starters = out[out["starter"]].groupby(["league_id", "roster_id"]).size()
+    assert (starters == sum(SLOTS.values())).all()
+    assert set(out.loc[out["starter"], "slot"]) == set(slot_names(SLOTS))
@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from app.services.live import DraftHub, DraftRoom
+
+
+def _board():
+    return pd.DataFrame(
+        {
+            "player_id": ["A", "B", "C"],
+            "full_name": ["Alpha", "Bravo", "Charlie"],
+            "position": ["QB", "RB", "WR"],
+            "vor": [50.0, 20.0, 5.0],
+            "tier": [1, 2, 3],
+        }
+    )
+
+
+def _decode(msg: bytes) -> dict:
+    data = msg.decode().split("data: ", 1)[1]
+    return json.loads(data)
+
+
+def test_pick_pushes_only_changed_row():
+    async def run():
+        room = DraftRoom("d1", _board())
+        viewers = [room.subscribe() for _ in range(3)]
+        snaps = [_decode(q.get_nowait()) for q in viewers]
+        assert all(len(s["upsert"]) == 3 for s in snaps)
+
+        room.mark_drafted(["B"])
+        msgs = [q.get_nowait() for q in viewers]
+        assert len(set(msgs)) == 1  # serialised once, shared by every viewer
+        delta = _decode(msgs[0])
+        assert [r[0] for r in delta["upsert"]] == ["B"]
+        assert delta["upsert"][0][delta["cols"].index("drafted") + 1] is True
+
+    asyncio.run(run())
+
+
+def test_publish_keeps_drafted_and_diffs_values():
+    room = DraftRoom("d2", _board())
+    room.mark_drafted(["A"])
+
+    new = _board()
+    new.loc[new["player_id"] == "C", "vor"] = 9.04
+    new = new[new["player_id"] != "B"]
+    delta = room.publish(new)
+
+    assert [r[0] for r in delta["upsert"]] == ["C"]
+    assert delta["remove"] == ["B"]
+    assert room.version == 2
+
+
+def test_room_remembers_what_it_was_built_for():
+    hub = DraftHub()
+    first = hub.get_or_create("d3", _board, season=2023, teams=10)
+    again = hub.get_or_create("d3", _board, season=2024, teams=12)
+    assert again is first
+    assert (first.season, first.teams) == (2023, 10)
+
+
+def test_hub_evicts_unwatched_rooms():
+    hub = DraftHub(idle_s=60.0, max_rooms=2)
+    a = hub.get_or_create("a", _board)
+    q = a.subscribe()
+    hub.get_or_create("b", _board)
+    hub.get_or_create("c", _board)  # at the cap: unwatched "b" makes room
+    assert hub.get("b") is None and hub.get("a") is a and len(hub) == 2
+
+    a.unsubscribe(q)
+    hub.idle_s = 0.0  # both rooms now idle past the TTL
+    assert hub.get("a") is None and len(hub) == 0
+
+    full = DraftHub(max_rooms=1)
+    full.get_or_create("x", _board).subscribe()
+    with pytest.raises(RuntimeError, match="in use"):
+        full.get_or_create("y", _board)
+
+
+def test_season_board_carries_adp(tmp_path, monkeypatch):
+    from app.services import board, hot_tables, http_cache
+
+    for mod in (http_cache, hot_tables, board):
+        monkeypatch.setattr(mod, "DATA_DIR", tmp_path)
+    hot_tables.clear()
+    totals = _board().rename(columns={"vor": "fantasy_pts_season"})
+    for rel, df in [
+        ("totals/season=2024", totals.drop(columns=["tier", "full_name"])),
+        ("adp/season=2024/source=ffc", _board().assign(adp=[1.0, 2.0, 3.0])),
+        ("tank01_players", _board()[["player_id", "full_name"]]),
+    ]:
+        (tmp_path / rel).mkdir(parents=True)
+        df.to_parquet(tmp_path / rel / "p0.parquet")
+
+    out = board.load_season_board(2024, teams=1)
+    snap = DraftRoom("d4", out).full_message()
+    assert {"adp", "value_vs_adp"} <= set(_decode(snap)["cols"])
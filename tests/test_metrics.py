@@ -0,0 +1,85 @@
+import threading
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from ffwb import metrics
+from ffwb.ingest import io
+from ffwb.runner import RunContext, Stage, run_pipeline
+
+
+@pytest.fixture
+def log(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    monkeypatch.setattr(metrics, "_config", dict(metrics._config))
+    metrics.configure(log=True)
+    return tmp_path / metrics.LOG_NAME
+
+
+def test_spans_nest_record_errors_and_log_jsonl(log):
+    with metrics.span("outer", season=2024) as sp:
+        with pytest.raises(KeyError):
+            with metrics.span("inner"):
+                raise KeyError("boom")
+        sp.set(rows_in=10, rows_out=3)
+
+    inner, outer = metrics.read_log(log)
+    assert inner["parent"] == "outer" and "KeyError" in inner["error"]
+    assert outer["parent"] is None and outer["season"] == 2024
+    assert outer["wall_s"] >= inner["wall_s"] and outer["rss_peak_mb"] > 0
+
+    summary = {s["name"]: s for s in metrics.summarize(metrics.read_log(log))}
+    assert summary["inner"]["errors"] == 1
+    assert summary["outer"]["rows_out"] == 3
+
+
+def test_io_write_and_read_are_instrumented(log):
+    df = pd.DataFrame({"player_id": ["a", "b", "c"], "season": [2023, 2024, 2024]})
+    io.to_parquet(df, "totals", partition_cols=["season"])
+    io.read_table("totals", season=2024)
+
+    records = {
+        r["name"]: r for r in metrics.read_log(log) if r.get("table") == "totals"
+    }
+    written, read = records["io.write"], records["io.read"]
+    assert written["rows_out"] == 3 and written["files"] == 2
+    assert written["bytes_written"] == metrics.path_bytes(log.parent.parent / "totals")
+    assert read["rows_out"] == 2 and read["files"] == 1 and read["bytes_read"] > 0
+
+
+def test_concurrent_spans_share_tracemalloc_and_runner_keeps_parent(log):
+    metrics.configure(trace_memory=True)
+    assert not tracemalloc.is_tracing()
+    barrier = threading.Barrier(2)
+
+    def stage(name):
+        def run(ctx):
+            barrier.wait(timeout=5)  # both stages hold a traced span at once
+            with metrics.span(f"work.{name}"):
+                barrier.wait(timeout=5)
+            assert tracemalloc.is_tracing()
+
+        return Stage(name, run)
+
+    with metrics.span("cli.run"):
+        stages = [stage("a"), stage("b"), Stage("c", lambda c: None, deps=("a", "b"))]
+        results = run_pipeline(RunContext(season=2024), "c", stages=stages)
+    assert [r.status for r in results] == ["ran"] * 3
+    assert not tracemalloc.is_tracing()  # stopped once the last span closed
+
+    records = {r["name"]: r for r in metrics.read_log(log)}
+    assert records["stage.a"]["parent"] == "cli.run"
+    assert records["work.b"]["parent"] == "stage.b"
+    assert all("py_peak_mb" in r for r in records.values())
+
+
+def test_log_rotates_past_max_bytes(log, monkeypatch):
+    monkeypatch.setattr(metrics, "MAX_LOG_BYTES", 200)
+    for i in range(10):
+        with metrics.span("tick", i=i):
+            pass
+    rotated = log.with_name(log.name + ".1")
+    assert rotated.exists() and log.stat().st_size < 400
+    ticks = [r["i"] for r in metrics.read_log(rotated) + metrics.read_log(log)]
+    assert ticks == sorted(ticks) and ticks[-1] == 9
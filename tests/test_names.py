@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from ffwb.ingest.names import NameIndex, normalize_names
+
+ROSTER = pd.DataFrame(
+    {
+        "sleeper_id": ["1", "2", "3", "4", "5", "6"],
+        "full_name": [
+            "Kenneth Walker",
+            "DJ Moore",
+            "Michael Pittman",
+            "Josh Allen",
+            "Josh Allen",
+            "Amon-Ra St. Brown",
+        ],
+        "position": ["RB", "WR", "WR", "QB", "LB", "WR"],
+    }
+)
+
+
+def test_normalize_names():
+    got = normalize_names(["Kenneth Walker III", "D.J. Moore", "Mike Pittman Jr."])
+    assert got.tolist() == ["kenneth walker", "dj moore", "michael pittman"]
+
+
+def test_resolve_exact_blocked_and_fuzzy():
+    index = NameIndex(ROSTER)
+    out = index.resolve(
+        [
+            "Kenneth Walker III",
+            "D.J. Moore",
+            "Mike Pittman Jr.",
+            "Josh Allen",
+            "Amon Ra St Brown",
+            "Amonra St. Brwn",
+            "Nobody Atall",
+        ],
+        ["RB", "WR", "WR", "QB", "WR", "WR3", "TE"],
+    )
+    assert out["player_id"].tolist()[:6] == ["1", "2", "3", "4", "6", "6"]
+    assert out["method"].tolist()[-2:] == ["fuzzy", "unmatched"]
+    assert pd.isna(out["player_id"].iloc[-1])
+
+
+def test_resolve_thousands_quickly():
+    rng = np.random.default_rng(0)
+    first = np.array(["alpha", "bravo", "charlie", "delta", "echo", "foxtrot"])
+    last = np.array([f"name{i}" for i in range(400)])
+    roster = pd.DataFrame(
+        {
+            "sleeper_id": [str(i) for i in range(2400)],
+            "full_name": [f"{f} {s}" for f in first for s in last],
+            "position": rng.choice(["QB", "RB", "WR", "TE"], 2400),
+        }
+    )
+    index = NameIndex(roster)
+    queries = roster.sample(3000, replace=True, random_state=0)
+    t0 = time.perf_counter()
+    out = index.resolve(queries["full_name"].str.upper() + " Jr.", queries["position"])
+    assert time.perf_counter() - t0 < 0.5
+    assert (out["player_id"].to_numpy() == queries["sleeper_id"].to_numpy()).all()
+
+
+def test_shared_name_without_position_is_ambiguous():
+    out = NameIndex(ROSTER).resolve(["Josh Allen", "Josh Allen"], ["", "LB"])
+    assert out["method"].tolist() == ["ambiguous", "exact"]
+    assert pd.isna(out["player_id"].iloc[0]) and out["player_id"].iloc[1] == "5"
+
+    teams = ROSTER.assign(team=["SEA", "CHI", "IND", "BUF", "JAX", "DET"])
+    out = NameIndex(teams).resolve(["Josh Allen"], [""], ["JAX"])
+    assert out["player_id"].tolist() == ["5"]
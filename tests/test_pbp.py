@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ffwb.ingest.pbp import PBP_STAT_COLS, aggregate_pbp, merge_into_weekly
+
+
+def _plays(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = np.array(["00-01", "00-02", "00-03", None], dtype=object)
+    is_pass = rng.random(n) < 0.6
+    complete = is_pass & (rng.random(n) < 0.65)
+    gain = rng.integers(-5, 70, n).astype(float)
+    return pd.DataFrame(
+        {
+            "season_type": np.where(rng.random(n) < 0.9, "REG", "POST"),
+            "week": rng.integers(1, 4, n),
+            "yardline_100": rng.integers(1, 100, n).astype(float),
+            "passer_player_id": np.where(is_pass, ids[0], None),
+            "rusher_player_id": np.where(~is_pass, ids[rng.integers(1, 4, n)], None),
+            "receiver_player_id": np.where(is_pass, ids[rng.integers(1, 4, n)], None),
+            "pass_attempt": is_pass.astype(float),
+            "rush_attempt": (~is_pass).astype(float),
+            "complete_pass": complete.astype(float),
+            "first_down_pass": (complete & (rng.random(n) < 0.5)).astype(float),
+            "first_down_rush": (~is_pass & (rng.random(n) < 0.3)).astype(float),
+            "passing_yards": np.where(complete, gain, np.nan),
+            "rushing_yards": np.where(~is_pass, gain, np.nan),
+            "receiving_yards": np.where(complete, gain, np.nan),
+            "desc": "unused column",
+        }
+    )
+
+
+def test_streamed_aggregate_matches_in_memory(tmp_path):
+    plays = _plays()
+    path = tmp_path / "pbp.parquet"
+    plays.to_parquet(path, row_group_size=64)
+
+    got = aggregate_pbp(path, batch_rows=37).set_index(["gsis_id", "week"])
+
+    reg = plays[plays["season_type"] == "REG"]
+    rz = reg["yardline_100"] <= 20
+    fd = (reg["first_down_pass"] > 0) & (reg["complete_pass"] > 0)
+    rec = reg.assign(rec_fd=fd, rec_rz_tgt=(reg["pass_attempt"] > 0) & rz)
+    expect = rec.groupby(["receiver_player_id", "week"])[["rec_fd", "rec_rz_tgt"]].sum()
+    expect["rec_40"] = (
+        (rec["receiving_yards"] >= 40).groupby([rec["receiver_player_id"], rec["week"]])
+    ).sum()
+    for (pid, wk), row in expect.iterrows():
+        assert list(got.loc[(pid, wk), ["rec_fd", "rec_rz_tgt", "rec_40"]]) == list(row)
+    assert got.loc[("00-01", 1), "pass_fd"] == fd[reg["week"] == 1].sum()
+
+
+def test_merge_into_weekly_zero_fills():
+    weekly = pd.DataFrame(
+        {"player_id": ["a", "b"], "week": [1, 1], "rush_yds": [10, 20], "rush_fd": 9}
+    )
+    stats = pd.DataFrame({"player_id": ["a"], "week": np.int8(1), "rush_fd": [3]})
+    stats = stats.reindex(columns=["player_id", "week", *PBP_STAT_COLS], fill_value=0)
+    out = merge_into_weekly(weekly, stats)
+    assert out["rush_fd"].tolist() == [3, 0]
+    assert out["rush_yds"].tolist() == [10, 20]
+
+
+def test_long_touchdowns_count_by_distance(tmp_path):
+    plays = pd.DataFrame(
+        {
+            "season_type": "REG",
+            "week": 1,
+            "yardline_100": [45.0, 60.0, 30.0, 55.0],
+            "passer_player_id": ["qb", "qb", "qb", None],
+            "rusher_player_id": [None, None, None, "rb"],
+            "receiver_player_id": ["wr", "wr", "wr", None],
+            "pass_attempt": [1.0, 1.0, 1.0, 0.0],
+            "rush_attempt": [0.0, 0.0, 0.0, 1.0],
+            "complete_pass": [1.0, 1.0, 1.0, 0.0],
+            "passing_yards": [45.0, 60.0, 30.0, np.nan],
+            "rushing_yards": [np.nan, np.nan, np.nan, 55.0],
+            "receiving_yards": [45.0, 60.0, 30.0, np.nan],
+            "pass_touchdown": [1.0, 1.0, 1.0, 0.0],
+            "rush_touchdown": [0.0, 0.0, 0.0, 1.0],
+        }
+    )
+    path = tmp_path / "pbp.parquet"
+    plays.to_parquet(path)
+    got = aggregate_pbp(path).set_index("gsis_id")
+
+    assert got.loc["qb", ["pass_td_40", "pass_td_50"]].tolist() == [2, 1]
+    assert got.loc["wr", ["rec_td_40", "rec_td_50"]].tolist() == [2, 1]
+    assert got.loc["rb", ["rush_td_40", "rush_td_50"]].tolist() == [1, 1]
+
+
+def test_failed_rewrite_keeps_season_partition(tmp_path, monkeypatch):
+    from ffwb.ingest import ids, io, pbp
+
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    weekly = pd.DataFrame(
+        {"player_id": ["s1"], "season": 2024, "week": 1, "rush_yds": [50.0]}
+    )
+    io.to_parquet(weekly, "actual_weekly", partition_cols=["season", "week"])
+    plays = tmp_path / "pbp.parquet"
+    _plays().assign(rusher_player_id="00-01").to_parquet(plays)
+    monkeypatch.setattr(pbp, "download_pbp", lambda season: plays)
+    monkeypatch.setattr(
+        ids,
+        "build_xwalk",
+        lambda season: pd.DataFrame({"gsis_id": ["00-01"], "sleeper_id": ["s1"]}),
+    )
+
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(io, "to_parquet", boom)
+        with pytest.raises(OSError):
+            pbp.ingest_pbp_stats(2024)
+    before = pd.read_parquet(tmp_path / "actual_weekly")
+    assert before["rush_yds"].tolist() == [50.0] and "rush_fd" not in before
+
+    pbp.ingest_pbp_stats(2024)
+    after = pd.read_parquet(tmp_path / "actual_weekly")
+    assert len(after) == 1 and after["rush_fd"].iloc[0] > 0
+    assert sorted(p.name for p in (tmp_path / "actual_weekly").iterdir()) == [
+        "season=2024"
+    ]
@@ -0,0 +1,81 @@
+import multiprocessing as mp
+
+import numpy as np
+import pandas as pd
+
+from ffwb.ingest import io, registry
+
+
+def test_keys_stable_and_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    first = registry.keys_for(["100", "200", "100"])
+    assert first.dtype == np.int32
+    assert first[0] == first[2] != first[1]
+
+    # a cold cache (as in a fresh process) reads the keys back from disk
+    monkeypatch.setattr(
+        registry, "_cache", {"root": None, "stamp": None, "df": None, "index": {}}
+    )
+    assert (tmp_path / "player_registry" / "registry.parquet").exists()
+    again = registry.keys_for(["200", "100", "300"])
+    assert list(again[:2]) == [first[1], first[0]]
+    assert again[2] not in first
+    assert registry.keys_for(["999"], create=False)[0] == registry.NO_KEY
+
+
+def test_link_and_key_join(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    tank = pd.DataFrame(
+        {
+            "player_id": ["t1", "t2", "t3"],
+            "sleeper_id": ["s1", "s2", None],
+            "full_name": ["A", "B", "C"],
+        }
+    )
+    io.to_parquet(tank, "tank01_players")
+    stored = pd.read_parquet(tmp_path / "tank01_players")
+    assert stored["player_key"].dtype == np.int32
+
+    board = registry.attach_keys(
+        pd.DataFrame({"player_id": ["s2", "s1", "s9"], "vor": [3.0, 2.0, 1.0]})
+    )
+    joined = registry.key_join(board, stored, ["full_name"])
+    assert joined["full_name"].tolist()[:2] == ["B", "A"]
+    assert pd.isna(joined["full_name"].iloc[2])
+
+    via_merge = board.merge(
+        tank.rename(columns={"player_id": "tank_id", "sleeper_id": "player_id"}),
+        on="player_id",
+        how="left",
+    )
+    assert joined["full_name"].equals(via_merge["full_name"])
+
+
+def _assign(root, ids, barrier, out):
+    io._DATA_ROOT = root
+    barrier.wait()
+    out.put(dict(zip(ids, registry.keys_for(ids).tolist())))
+
+
+def test_concurrent_processes_get_distinct_keys(tmp_path):
+    ctx = mp.get_context("fork")
+    barrier, out = ctx.Barrier(4), ctx.Queue()
+    batches = [[f"p{i}" for i in range(n, n + 30)] for n in (0, 10, 20, 30)]
+    procs = [
+        ctx.Process(target=_assign, args=(tmp_path, ids, barrier, out))
+        for ids in batches
+    ]
+    for p in procs:
+        p.start()
+    seen = [out.get(timeout=30) for _ in procs]
+    for p in procs:
+        p.join()
+
+    merged: dict[str, int] = {}
+    for keys in seen:
+        for ext, key in keys.items():
+            assert merged.setdefault(ext, key) == key  # overlaps agree
+    assert len(set(merged.values())) == len(merged) == 60
+
+    stored = pd.read_parquet(tmp_path / "player_registry" / "registry.parquet")
+    assert dict(zip(stored["external_id"], stored["player_key"])) == merged
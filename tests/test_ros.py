@@ -0,0 +1,82 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ffwb.ingest import io
+from ffwb.ros import RestOfSeason, refresh_ros
+
+
+def _proj(seed=0, weeks=range(1, 19)):
+    rng = np.random.default_rng(seed)
+    rows = [
+        (f"p{i}", pos, w, float(rng.gamma(2.0, 5.0)))
+        for i, pos in enumerate(["QB", "RB", "RB", "WR", "WR", "TE"] * 4)
+        for w in weeks
+        if rng.random() > 0.06  # byes / not projected
+    ]
+    return pd.DataFrame(rows, columns=["player_id", "position", "week", "fantasy_pts"])
+
+
+def test_totals_match_groupby_and_incremental_update():
+    proj = _proj()
+    state = RestOfSeason.from_projections(proj, 2024)
+    for start in (1, 7, 18):
+        expect = proj[proj["week"] >= start].groupby("player_id")["fantasy_pts"].sum()
+        got = state.totals(start).set_index("player_id")["fantasy_pts_season"]
+        assert np.allclose(got.reindex(expect.index), expect, atol=1e-3)
+
+    # re-project week 9 (a new player appears too) and patch in place
+    wk9 = _proj(seed=1, weeks=[9])
+    wk9 = pd.concat([wk9, pd.DataFrame([("new", "WR", 9, 30.0)], columns=wk9.columns)])
+    state.update_week(9, wk9)
+    rebuilt = RestOfSeason.from_projections(
+        pd.concat([proj[proj["week"] != 9], wk9]), 2024
+    )
+    a = state.totals(5).set_index("player_id")["fantasy_pts_season"]
+    b = rebuilt.totals(5).set_index("player_id")["fantasy_pts_season"]
+    assert np.allclose(a, b.reindex(a.index), atol=1e-3)
+    assert "vor" in state.vor(5, teams=2).columns
+
+
+def test_refresh_reads_only_changed_weeks(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    proj = _proj(weeks=range(1, 5)).assign(season=2024)
+    io.to_parquet(proj, "projection_weekly_tank01", partition_cols=["season", "week"])
+
+    calls = []
+    original = RestOfSeason.update_week
+    monkeypatch.setattr(
+        RestOfSeason,
+        "update_week",
+        lambda self, week, rows: calls.append(week) or original(self, week, rows),
+    )
+    first = refresh_ros(2024)
+    assert calls == [1, 2, 3, 4]
+
+    wk5 = _proj(seed=3, weeks=[5]).assign(season=2024)
+    io.to_parquet(wk5, "projection_weekly_tank01", partition_cols=["season", "week"])
+    second = refresh_ros(2024)
+    assert calls == [1, 2, 3, 4, 5]
+    assert np.allclose(
+        second.ros[:, 0].sum(),
+        first.ros[:, 0].sum() + wk5["fantasy_pts"].sum(),
+        rtol=1e-5,
+    )
+
+
+def test_refresh_zeroes_removed_weeks_and_rejects_bad_week(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    proj = _proj(weeks=range(1, 4)).assign(season=2024)
+    io.to_parquet(proj, "projection_weekly_tank01", partition_cols=["season", "week"])
+    refresh_ros(2024)
+
+    shutil.rmtree(tmp_path / "projection_weekly_tank01" / "season=2024" / "week=3")
+    state = refresh_ros(2024)
+    kept = proj[proj["week"] < 3]["fantasy_pts"].sum()
+    assert np.isclose(state.ros[:, 0].sum(), kept, rtol=1e-5)
+    assert not state.pts[:, 2].any() and "3" not in state.versions
+
+    with pytest.raises(ValueError, match="week 19"):
+        state.update_week(19, proj.head(1))
@@ -0,0 +1,79 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ffwb.rules import compile_rules, from_sleeper
+from ffwb.scoring import score_weekly
+
+SLEEPER = {
+    "pass_yd": 0.04,
+    "pass_td": 4.0,
+    "rec": 0.5,
+    "rec_yd": 0.1,
+    "rush_yd": 0.1,
+    "bonus_pass_yd_300": 3.0,
+    "bonus_pass_yd_400": 3.0,
+    "bonus_rush_rec_yd_100": 2.0,
+    "bonus_rec_te": 0.5,
+    "def_td": 6.0,  # defensive keys are ignored
+    "st_fum_rec": 0.0,
+}
+
+STATS = pd.DataFrame(
+    {
+        "player_id": ["qb", "te", "rb", "wr"],
+        "position": ["QB", "TE", "RB", "wr"],
+        "pass_yds": [410, 0, 0, 0],
+        "pass_tds": [2, 0, 0, 0],
+        "rec_rec": [0, 6, 3, 6],
+        "rec_yds": [0, 70, 40, 70],
+        "rush_yds": [5, 0, 65, 0],
+    }
+)
+
+
+def test_sleeper_settings_match_rowwise_reference():
+    def reference(r):
+        pts = 0.04 * r.pass_yds + 4 * r.pass_tds + 0.5 * r.rec_rec
+        pts += 0.1 * (r.rec_yds + r.rush_yds)
+        pts += 3 * (r.pass_yds >= 300) + 3 * (r.pass_yds >= 400)
+        pts += 2 * (r.rush_yds + r.rec_yds >= 100)
+        pts += 0.5 * r.rec_rec * (r.position.upper() == "TE")
+        return pts
+
+    out = score_weekly(STATS, json.dumps(SLEEPER))
+    expect = [reference(r) for r in STATS.itertuples()]
+    assert np.allclose(out["fantasy_pts"], expect)
+
+
+def test_flat_rules_do_not_mutate_or_add_columns():
+    df = STATS[["player_id", "pass_yds"]]
+    out = score_weekly(df, {"pass_yds": 0.04, "pass_ints": -2})
+    assert "pass_ints" not in out.columns
+    assert list(df.columns) == ["player_id", "pass_yds"]
+    assert out["fantasy_pts"].iloc[0] == pytest.approx(16.4)
+
+
+def test_structured_tiers_and_position_rules():
+    rules = compile_rules(
+        {
+            "linear": {"rec_yds": 0.1},
+            "tiers": [{"stat": "rec_yds", "lo": 50, "hi": 60, "weight": 1.0}],
+            "position": {"wr": {"rec_rec": 1.0}},
+        }
+    )
+    pts = rules.evaluate(STATS)
+    assert np.allclose(pts, [0, 7 + 10, 4, 7 + 10 + 6])
+
+
+def test_position_rules_need_position_column():
+    with pytest.raises(KeyError):
+        from_sleeper(SLEEPER).evaluate(STATS.drop(columns="position"))
+
+
+def test_sleeper_long_td_bonuses_stack():
+    rules = from_sleeper({"pass_td": 4, "pass_td_40p": 1, "pass_td_50p": 2})
+    df = pd.DataFrame({"pass_tds": [3], "pass_td_40": [2], "pass_td_50": [1]})
+    assert rules.evaluate(df)[0] == pytest.approx(12 + 2 + 2)
@@ -0,0 +1,88 @@
+import threading
+
+import pandas as pd
+
+from ffwb.ingest import io
+from ffwb.runner import RunContext, Stage, run_pipeline
+
+
+def _stages(calls, barrier):
+    def source(name, value):
+        def run(ctx):
+            calls.append(name)
+            barrier.wait(timeout=5)  # both sources must be in flight together
+            df = pd.DataFrame({"player_id": ["a"], "x": [value[0]]})
+            df["season"] = ctx.season
+            io.to_parquet(df, name, partition_cols=["season"])
+
+        return Stage(name, run, outputs=lambda c: [f"{name}/season={c.season}"])
+
+    def combine(ctx):
+        calls.append("combined")
+        a = pd.read_parquet(io._DATA_ROOT / "a" / f"season={ctx.season}")
+        a["season"] = ctx.season
+        io.to_parquet(a, "combined", partition_cols=["season"])
+
+    value = [1]
+    return value, [
+        source("a", value),
+        source("b", value),
+        Stage(
+            "combined",
+            combine,
+            deps=("a", "b"),
+            inputs=lambda c: [f"a/season={c.season}", f"b/season={c.season}"],
+            outputs=lambda c: [f"combined/season={c.season}"],
+        ),
+    ]
+
+
+def test_runner_skips_current_and_reruns_changed(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    calls = []
+    value, stages = _stages(calls, threading.Barrier(2))
+    ctx = RunContext(season=2024)
+
+    first = run_pipeline(ctx, "combined", stages=stages)
+    assert [r.status for r in first] == ["ran", "ran", "ran"]
+
+    calls.clear()
+    second = run_pipeline(ctx, "combined", stages=stages)
+    assert [r.status for r in second] == ["skipped"] * 3
+    assert calls == []
+
+    # refreshing a source with identical content keeps downstream current
+    _, stages = _stages(calls, threading.Barrier(1))
+    third = run_pipeline(ctx, "combined", stages=stages, refresh={"a"})
+    assert {r.name: r.status for r in third}["combined"] == "skipped"
+
+    value, stages = _stages(calls, threading.Barrier(1))
+    value[0] = 2
+    fourth = run_pipeline(ctx, "combined", stages=stages, refresh={"a"})
+    assert {r.name: r.status for r in fourth} == {
+        "a": "ran",
+        "b": "skipped",
+        "combined": "ran",
+    }
+
+
+def test_failed_stage_keeps_previous_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    ctx = RunContext(season=2024)
+    out = "a/season=2024"
+
+    def write(value, fail=False):
+        def run(ctx):
+            df = pd.DataFrame({"player_id": ["a"], "x": [value], "season": 2024})
+            io.to_parquet(df, "a", partition_cols=["season"])
+            if fail:
+                raise RuntimeError("stage broke after writing")
+
+        return [Stage("a", run, outputs=lambda c: [out])]
+
+    run_pipeline(ctx, "a", stages=write(1))
+    failed = run_pipeline(ctx, "a", stages=write(2, fail=True), force=True)
+    assert failed[0].status == "failed"
+    kept = pd.read_parquet(tmp_path / "a")
+    assert kept["x"].tolist() == [1]
+    assert sorted(p.name for p in (tmp_path / "a").iterdir()) == ["season=2024"]
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from ffwb.simulate import MatchupSim, fit_residuals
+
+
+def _history():
+    rng = np.random.default_rng(1)
+    n_players, weeks = 40, 17
+    df = pd.DataFrame(
+        {
+            "player_id": np.repeat(np.arange(n_players).astype(str), weeks),
+            "season": 2023,
+            "week": np.tile(np.arange(1, weeks + 1), n_players),
+            "position": np.repeat(["QB", "RB", "WR", "TE"] * 10, weeks),
+        }
+    )
+    df["fantasy_pts"] = rng.gamma(3.0, 4.0, size=len(df))
+    return df
+
+
+def test_win_probabilities_and_swaps():
+    model = fit_residuals(_history())
+    assert {"QB", "RB", "WR", "TE"} <= set(model)
+
+    proj = pd.DataFrame(
+        {
+            "player_id": ["a1", "a2", "b1", "b2", "bench"],
+            "position": ["QB", "RB", "QB", "RB", "RB"],
+            "fantasy_pts": [22.0, 15.0, 15.0, 10.0, 20.0],
+        }
+    )
+    lineups = pd.DataFrame(
+        {
+            "roster_id": [1, 1, 2, 2],
+            "player_id": ["a1", "a2", "b1", "b2"],
+            "matchup_id": [1, 1, 1, 1],
+        }
+    )
+    sim = MatchupSim(proj, lineups, model, n_sims=20_000, seed=0)
+    wp = sim.win_probabilities().set_index("team")["win_prob"]
+    assert wp[1] > 0.5 > wp[2]
+    assert np.isclose(wp[1] + wp[2], 1.0)
+
+    swaps = sim.swap_win_probs(2, ["b2", "b2"], ["bench", "b2"])
+    assert swaps.loc[0, "delta"] > 0
+    assert swaps.loc[1, "delta"] == 0
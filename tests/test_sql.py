@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ffwb.ingest import io
+from ffwb.sql import lake_tables
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    vor_df = pd.DataFrame(
+        {
+            "player_id": [f"p{i}" for i in range(8)] * 2,
+            "position": ["WR", "RB"] * 8,
+            "vor": np.arange(16, dtype=float),
+            "season": np.repeat([2022, 2023], 8).astype(np.int16),
+        }
+    )
+    io.to_parquet(vor_df, "vor", partition_cols=["season"])
+    (tmp_path / "_cache").mkdir()
+    (tmp_path / "_cache" / "raw.parquet").touch()
+    return tmp_path
+
+
+def test_lake_tables_skips_caches(lake):
+    assert set(lake_tables()) == {"vor", "player_registry"}
+
+
+def test_query_partitioned_view(lake):
+    pytest.importorskip("duckdb")
+    from ffwb.sql import query
+
+    out = query(
+        "SELECT player_id, vor FROM vor "
+        "WHERE season = 2023 AND position = 'WR' ORDER BY vor DESC LIMIT 2"
+    )
+    assert out["vor"].tolist() == [14.0, 12.0]
@@ -0,0 +1,128 @@
+import json
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from ffwb.ingest import io
+from ffwb.ingest.tank01 import PROJ_SCHEMA, _loads, _parse_projections
+
+PAYLOAD = {
+    "body": {
+        "playerProjections": {
+            "4381": {
+                "playerID": "4381",
+                "sleeperBotID": "4984",
+                "longName": "Josh Allen",
+                "pos": "qb",
+                "fantasyPointsDefault": {"PPR": "24.1", "standard": "24.1"},
+                "Passing": {"passYds": "254.3", "passTD": "1.9", "int": "0.7"},
+                "Rushing": {"rushYds": "38.0", "rushTD": "0.5", "carries": "7"},
+                "fumblesLost": "0.2",
+            },
+            "5000": {
+                "playerID": "5000",
+                "longName": "Some Receiver",
+                "pos": "WR",
+                "fantasyPointsDefault": {"PPR": "11.5"},
+                "Receiving": {"receptions": "5.5", "recYds": "", "targets": "8"},
+            },
+        }
+    }
+}
+
+
+def test_parse_projections_columnar():
+    pp = _loads(json.dumps(PAYLOAD).encode())["body"]["playerProjections"]
+    batch = _parse_projections(list(pp.values()))
+    assert batch.schema == PROJ_SCHEMA
+    cols = batch.to_pydict()
+    assert cols["position"] == ["QB", "WR"]
+    assert cols["sleeper_id"] == ["4984", None]
+    assert np.allclose(cols["pass_yds"], [254.3, 0.0])
+    assert np.allclose(cols["rec_rec"], [0.0, 5.5])
+    assert cols["rec_yds"] == [0.0, 0.0]  # blank string → 0
+    assert np.allclose(cols["fantasy_pts"], [24.1, 11.5])
+
+
+def test_write_table_links_registry_keys(tmp_path, monkeypatch):
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    pp = PAYLOAD["body"]["playerProjections"]
+    batch = _parse_projections(list(pp.values()))
+    io.write_table(batch, "projection_weekly_tank01")
+
+    stored = pq.read_table(tmp_path / "projection_weekly_tank01")
+    assert (
+        stored.schema.field("fantasy_pts").type == PROJ_SCHEMA.field("fantasy_pts").type
+    )
+    from ffwb.ingest import registry
+
+    tank_key = stored.column("player_key").to_pylist()[0]
+    assert registry.keys_for(["4984"], "sleeper")[0] == tank_key
+
+
+def test_backfill_skips_stored_weeks_and_writes_once(tmp_path, monkeypatch):
+    import threading
+
+    from ffwb.ingest import tank01
+
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    monkeypatch.setattr(tank01, "_headers", lambda: {"x-rapidapi-key": "k"})
+    calls, lock = [], threading.Lock()
+
+    def fake_request(week, season, weights):
+        with lock:
+            calls.append((season, week))
+        pp = PAYLOAD["body"]["playerProjections"]
+        return _parse_projections(list(pp.values()))
+
+    monkeypatch.setattr(tank01, "_request", fake_request)
+
+    first = tank01.backfill_tank01([2023, 2024], [1, 2, 3], rate=1000)
+    assert (first["status"] == "fetched").all() and len(calls) == 6
+    assert len(list((tmp_path / tank01.TABLE).rglob("*.parquet"))) == 6
+
+    again = tank01.backfill_tank01([2023, 2024], [1, 2, 3, 4], rate=1000)
+    assert again["status"].tolist().count("skipped") == 6
+    assert set(calls[6:]) == {(2023, 4), (2024, 4)} and len(calls) == 8
+
+    # new scoring weights → refetch, old week files replaced not appended
+    tank01.backfill_tank01([2023], [1], scoring_weights={"pointsPerReception": 1})
+    week1 = list((tmp_path / tank01.TABLE / "season=2023" / "week=1").glob("*"))
+    assert len(week1) == 1
+
+
+def test_rate_limiter_spaces_calls():
+    import time
+
+    from ffwb.ingest.tank01 import RateLimiter
+
+    limiter = RateLimiter(rate=50, burst=1)
+    t0 = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - t0 >= 0.09
+
+
+def test_failed_week_write_keeps_old_week_and_manifest(tmp_path, monkeypatch):
+    import pytest
+
+    from ffwb.ingest import tank01
+
+    monkeypatch.setattr(io, "_DATA_ROOT", tmp_path)
+    monkeypatch.setattr(tank01, "_headers", lambda: {"x-rapidapi-key": "k"})
+    pp = list(PAYLOAD["body"]["playerProjections"].values())
+    monkeypatch.setattr(tank01, "_request", lambda *a: _parse_projections(pp))
+    tank01.backfill_tank01([2024], [1], rate=1000)
+    week = tmp_path / tank01.TABLE / "season=2024" / "week=1"
+    before = sorted(p.name for p in week.iterdir())
+    manifest = tank01._load_manifest()
+
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(io, "write_table", boom)
+    with pytest.raises(OSError):
+        tank01.backfill_tank01([2024], [1], rate=1000, force=True)
+    assert sorted(p.name for p in week.iterdir()) == before
+    assert tank01._load_manifest() == manifest
+    assert [p.name for p in week.parent.iterdir()] == ["week=1"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from ffwb.scoring import aggregate_season, score_weekly
+from ffwb.tensor import SeasonTensor, build_season_tensor
+
+RULES = {"pass_yds": 0.04, "pass_tds": 4, "rec_rec": 0.5}
+
+
+def test_tensor_scoring_matches_pandas(tmp_path):
+    rng = np.random.default_rng(2)
+    weekly = pd.DataFrame(
+        {
+            "player_id": np.repeat(["a", "b", "c"], 4),
+            "season": 2023,
+            "week": np.tile([1, 2, 3, 5], 3),
+            "pass_yds": rng.integers(0, 350, 12),
+            "pass_tds": rng.integers(0, 4, 12),
+            "rec_rec": rng.integers(0, 9, 12),
+        }
+    )
+    build_season_tensor(weekly, 2023, data_root=tmp_path)
+    t = SeasonTensor.load(2023, data_root=tmp_path)
+    assert isinstance(t.data, np.memmap)
+    assert t.data.shape == (3, 5, 3)
+
+    expect = aggregate_season(score_weekly(weekly, RULES)).set_index("player_id")
+    got = t.season_totals(RULES).set_index("player_id")
+    assert np.allclose(
+        got["fantasy_pts_season"], expect.loc[got.index, "fantasy_pts_season"]
+    )
+
+    window = t.score(RULES, weeks=(2, 3))
+    assert window.shape == (3, 2)
+    row = weekly[(weekly["player_id"] == "b") & (weekly["week"] == 3)].iloc[0]
+    assert np.isclose(
+        window[t.player_ids.get_loc("b"), 1], sum(row[k] * w for k, w in RULES.items())
+    )
+
+
+def test_default_stats_skip_keys_and_points(tmp_path):
+    weekly = pd.DataFrame(
+        {
+            "player_id": ["a", "b"],
+            "player_key": np.array([7, 8], dtype=np.int32),
+            "week": [1, 1],
+            "rush_yds": [10.0, 20.0],
+            "fantasy_pts": [1.0, 2.0],
+        }
+    )
+    out = build_season_tensor(weekly, 2023, data_root=tmp_path)
+    assert SeasonTensor.load(2023, data_root=tmp_path).stats == ["rush_yds"]
+    assert sorted(p.name for p in out.iterdir()) == ["index.json", "stats.npy"]
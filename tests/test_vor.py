@@ -1,5 +1,5 @@
 import pandas as pd
-from ffwb.vor import compute_vor
+from ffwb.vor import attach_adp, compute_vor
 
 
 def test_compute_vor_quantile():
@@ -20,3 +20,14 @@ def test_compute_vor_quantile():
     assert out.loc[out["player_id"] == "A", "vor"].iloc[0] == 50  # 400‑350
     # tier split 50%: top player tier 1, others tier 2 or 99
     assert out.loc[out["player_id"] == "A", "tier"].iloc[0] == 1
+
+
+def test_attach_adp_with_two_adp_aliases():
+    vor_df = pd.DataFrame({"player_id": ["A", "B"], "vor": [10.0, 5.0]})
+    adp = pd.DataFrame(
+        {"player_id": ["A", "B"], "adp_mean": [3.0, 9.0], "avg_pick": [4.0, 8.0]}
+    )
+    out = attach_adp(vor_df, adp)
+    assert list(out.columns).count("adp") == 1
+    assert out["adp"].tolist() == [3.0, 9.0]
+    assert out["value_vs_adp"].notna().all()
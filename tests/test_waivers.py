@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from ffwb.lineup import optimal_lineup, position_codes
+from ffwb.waivers import evaluate_trades, waiver_report
+
+SLOTS = {"qb": 1, "rb": 2, "wr": 2, "te": 1, "flex": 1}
+POSITIONS = ["QB"] * 2 + ["RB"] * 5 + ["WR"] * 5 + ["TE"] * 2
+
+
+def _league(n_teams=12, n_fa=300, n_weeks=14, seed=0):
+    rng = np.random.default_rng(seed)
+    per_team = len(POSITIONS)
+    n_players = n_teams * per_team + n_fa
+    pos = np.resize(POSITIONS, n_players)
+    weeks = [f"wk{w}" for w in range(1, n_weeks + 1)]
+    values = pd.DataFrame(rng.gamma(2.0, 5.0, (n_players, n_weeks)), columns=weeks)
+    values.insert(0, "player_id", [f"p{i}" for i in range(n_players)])
+    values.insert(1, "position", pos)
+    rosters = pd.DataFrame(
+        {
+            "roster_id": np.repeat(np.arange(n_teams), per_team),
+            "player_id": values["player_id"].iloc[: n_teams * per_team].to_numpy(),
+        }
+    )
+    return rosters, values, weeks
+
+
+def _team_pts(rosters, values, cols, team, swap_out=(), swap_in=()):
+    ids = [
+        p
+        for p in rosters.loc[rosters["roster_id"] == team, "player_id"]
+        if p not in swap_out
+    ] + list(swap_in)
+    v = values.set_index("player_id").loc[ids]
+    pts = v[cols].to_numpy().T  # (K, N)
+    total, _ = optimal_lineup(pts, position_codes(v["position"]), SLOTS)
+    return total.sum()
+
+
+def test_waiver_gain_matches_per_pair_optimizer():
+    rosters, values, cols = _league(n_teams=3, n_fa=8, n_weeks=4)
+    report = waiver_report(rosters, values, SLOTS, points_cols=cols)
+    assert len(report) == 3 * 8 and (report["gain"] >= -1e-9).all()
+    for r in report.sample(10, random_state=1).itertuples():
+        expect = _team_pts(rosters, values, cols, r.roster_id, swap_in=[r.player_id])
+        expect -= _team_pts(rosters, values, cols, r.roster_id)
+        assert np.isclose(r.gain, expect)
+    assert report.groupby("roster_id")["gain"].is_monotonic_decreasing.all()
+
+
+def test_trade_deltas_and_league_speed():
+    rosters, values, cols = _league()
+    trades = pd.DataFrame(
+        {
+            "team_a": [0, 1],
+            "team_b": [2, 3],
+            "give": [["p2"], ["p14", "p15"]],
+            "receive": [["p30", "p31"], ["p44"]],
+        }
+    )
+    out = evaluate_trades(rosters, values, trades, SLOTS, points_cols=cols)
+    t = out.iloc[1]
+    expect_a = _team_pts(rosters, values, cols, 1, t.give, t.receive)
+    expect_b = _team_pts(rosters, values, cols, 3, t.receive, t.give)
+    assert np.isclose(t.pts_a + t.delta_a, expect_a)
+    assert np.isclose(t.pts_b + t.delta_b, expect_b)
+
+    start = time.perf_counter()
+    report = waiver_report(rosters, values, SLOTS, points_cols=cols, top=10)
+    assert time.perf_counter() - start < 1.0  # 12 teams × 300 FAs × 14 weeks
+    assert len(report) == 12 * 10
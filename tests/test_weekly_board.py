@@ -0,0 +1,39 @@
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app import main
+from app.services import board, hot_tables, http_cache
+
+
+def test_weekly_board_renders_from_stored_week(tmp_path, monkeypatch):
+    for mod in (http_cache, hot_tables, board):
+        monkeypatch.setattr(mod, "DATA_DIR", tmp_path)
+    http_cache.body_cache.clear()
+    hot_tables.clear()
+
+    def no_api(*args, **kwargs):
+        raise AssertionError("stored week must not be re-fetched")
+
+    monkeypatch.setattr(board, "ingest_tank01", no_api)
+    part = tmp_path / "projection_weekly_tank01" / "season=2024" / "week=1"
+    part.mkdir(parents=True)
+    pd.DataFrame(
+        {
+            "player_id": ["a", "b", "c"],
+            "position": ["QB", "RB", "WR"],
+            "fantasy_pts": [20.0, 15.0, 12.0],
+            "full_name": ["Alpha", "Bravo", "Charlie"],
+        }
+    ).to_parquet(part / "p0.parquet")
+
+    client = TestClient(main.app)
+    url = "/weekly-board?season=2024&week=1"
+    first = client.get(url)
+    http_cache.body_cache.clear()  # force a second full render
+    second = client.get(url)
+    assert first.status_code == second.status_code == 200
+    assert first.headers["etag"] == second.headers["etag"]
+    assert (
+        client.get(url, headers={"If-None-Match": first.headers["etag"]}).status_code
+        == 304
+    )